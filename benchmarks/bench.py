@@ -2,6 +2,8 @@
 
 Run against SQLite locally; against live Postgres in CI. Prints a table the
 report in ``docs/BENCHMARKS.md`` can be regenerated from.
+``EVENTIC_BENCH_BACKLOG`` sets the intent backlog the claim is timed over
+(default 100 000 rows).
 """
 
 from __future__ import annotations
@@ -9,12 +11,13 @@ from __future__ import annotations
 import os
 import time
 import uuid
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from eventic.ids import AggregateKey
 from eventic.jsonx import canonical_bytes, digest
 from eventic.sql import Postgres, SQLite
-from eventic.wire import CommitRequest
+from eventic.wire import CommitRequest, Settlement
 
 AID = uuid.UUID(int=42)
 
@@ -47,6 +50,70 @@ def _request(i: int) -> CommitRequest:
     )
 
 
+def _backlog(store, rows: int) -> None:
+    """``rows`` due pending intents on one queue, plus a tenth as many dead
+    ones and a hundredth as many live leases, all on one revision."""
+    from eventic.ids import revision_id
+    from eventic.sql.tables import eventic_intent
+
+    aid = uuid.UUID(int=7)
+    payload = canonical_bytes({"text": "backlog"})
+    store.commit(
+        [
+            CommitRequest(
+                stream="backlog",
+                aggregate_id=aid,
+                expected_revision=None,
+                kind="create",
+                schema_version=1,
+                payload=payload,
+                digest=digest(payload),
+                meta=canonical_bytes({}),
+                meta_version=1,
+                fingerprint="f",
+            )
+        ]
+    )
+    rid = revision_id("backlog", aid, 0)
+    past = datetime.now(UTC) - timedelta(days=1)
+    later = datetime.now(UTC) + timedelta(days=1)
+    kinds = [("pending", rows), ("dead", rows // 10), ("leased", rows // 100)]
+    n = 0
+    for status, count in kinds:
+        for start in range(0, count, 10_000):
+            chunk = [
+                {
+                    "intent_id": uuid.UUID(int=n + i),
+                    "subscription_id": f"sub.{n + i}",
+                    "revision_id": rid,
+                    "stream": "backlog",
+                    "aggregate_id": aid,
+                    "revision": 0,
+                    "queue": "bench",
+                    "status": status,
+                    "attempts": 0,
+                    "available_at": past + timedelta(microseconds=n + i),
+                    "leased_until": later if status == "leased" else None,
+                    "created_at": past,
+                    "partition": 0,
+                }
+                for i in range(min(10_000, count - start))
+            ]
+            n += len(chunk)
+            with store.engine.begin() as conn:
+                conn.execute(eventic_intent.insert(), chunk)
+
+
+def _claim_and_ack(store) -> None:
+    claimed = store.claim("bench", limit=100, lease=timedelta(seconds=30))
+    store.settle(
+        [
+            Settlement(intent_id=c.intent_id, status="delivered", attempts=c.attempts)
+            for c in claimed
+        ]
+    )
+
+
 def _bench(fn, n: int) -> float:
     start = time.perf_counter()
     for _ in range(n):
@@ -100,6 +167,11 @@ def main() -> None:
     print(f"head read (ms): {head_ms:.3f}")
     print(f"history limit=100 (ms): {history_ms:.3f}")
     print(f"where bucket=3 over 10k heads (ms): {where_ms:.3f}")
+
+    backlog = int(os.environ.get("EVENTIC_BENCH_BACKLOG", "100000"))
+    _backlog(store, backlog)
+    claim_ms = _bench(lambda: _claim_and_ack(store), 50) * 1000
+    print(f"claim+ack limit=100 over {backlog} pending (ms): {claim_ms:.3f}")
     store.close()
 
 
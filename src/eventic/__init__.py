@@ -7,21 +7,42 @@ first module that imports SQLAlchemy.
 from __future__ import annotations
 
 from eventic.app import App
-from eventic.envelopes import Commit, Page, Revision
+from eventic.envelopes import (
+    Change,
+    Commit,
+    NotModified,
+    Page,
+    Projection,
+    Revision,
+)
 from eventic.meta import NoMeta
 from eventic.stream import Stream
-from eventic.subscription import Backoff, Inline, Outbox, Subscription
+from eventic.subscription import (
+    AsyncSubscription,
+    Backoff,
+    BatchSubscription,
+    Inline,
+    Outbox,
+    Subscription,
+)
+from eventic.wire import HeadRef
 
 __version__ = "1.1.2"
 
 __all__ = [
     "App",
+    "AsyncSubscription",
     "Backoff",
+    "BatchSubscription",
+    "Change",
     "Commit",
+    "HeadRef",
     "Inline",
     "NoMeta",
+    "NotModified",
     "Outbox",
     "Page",
+    "Projection",
     "Revision",
     "Stream",
     "Subscription",
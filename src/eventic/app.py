@@ -21,8 +21,15 @@ from eventic.errors import (
     UnsupportedHandler,
 )
 from eventic.meta import Meta, NoMeta
+from eventic.paths import split_path
 from eventic.stream import Stream
-from eventic.subscription import Outbox, Subscription
+from eventic.subscription import (
+    AnySubscription,
+    AsyncSubscription,
+    BatchSubscription,
+    Outbox,
+    Subscription,
+)
 
 if TYPE_CHECKING:
     from eventic.protocols import Store
@@ -31,13 +38,35 @@ if TYPE_CHECKING:
 InlineErrorMode = Literal["raise", "log"]
 
 
-def _handler_problems(sub: Subscription[Any, Any]) -> list[str]:
+def _handler_problems(sub: AnySubscription) -> list[str]:
     problems: list[str] = []
     handler = sub.handler
-    if inspect.iscoroutinefunction(handler):
+    if isinstance(sub, AsyncSubscription):
+        if not inspect.iscoroutinefunction(handler):
+            problems.append(
+                f"subscription {sub.id}: an AsyncSubscription handler must be "
+                "an async def"
+            )
+        if not isinstance(sub.delivery, Outbox):  # type: ignore[reportUnnecessaryIsInstance]
+            problems.append(
+                f"subscription {sub.id}: an AsyncSubscription needs Outbox delivery"
+            )
+    elif isinstance(sub, BatchSubscription):
+        if inspect.iscoroutinefunction(handler):
+            problems.append(
+                f"subscription {sub.id}: a BatchSubscription handler must not "
+                "be an async def"
+            )
+        if not isinstance(sub.delivery, Outbox):  # type: ignore[reportUnnecessaryIsInstance]
+            problems.append(
+                f"subscription {sub.id}: a BatchSubscription needs Outbox delivery"
+            )
+        if sub.max_batch < 1:
+            problems.append(f"subscription {sub.id}: max_batch must be >= 1")
+    elif inspect.iscoroutinefunction(handler):
         problems.append(
-            f"subscription {sub.id}: async handlers are not supported in 1.0; "
-            "declare a sync handler"
+            f"subscription {sub.id}: async handlers are not supported in a "
+            "Subscription; declare it with AsyncSubscription"
         )
     try:
         params = [
@@ -51,12 +80,19 @@ def _handler_problems(sub: Subscription[Any, Any]) -> list[str]:
         ]
     except (TypeError, ValueError):
         params = []
+    argument = (
+        "a sequence of Commit[T, M]"
+        if isinstance(sub, BatchSubscription)
+        else "a Commit[T, M]"
+    )
     if len(params) != 1:
         problems.append(
             f"subscription {sub.id}: handler must accept exactly one positional "
-            f"argument (a Commit[T, M]); got {len(params)}"
+            f"argument ({argument}); got {len(params)}"
         )
         return problems
+    if isinstance(sub, BatchSubscription):
+        return problems  # its Sequence[Commit] annotation goes unchecked
     # Annotation check is best-effort: string annotations that reference
     # function-local names cannot be evaluated, and an untyped handler is
     # acceptable (dispatch is dynamic).
@@ -73,6 +109,31 @@ def _handler_problems(sub: Subscription[Any, Any]) -> list[str]:
     return problems
 
 
+def _filter_problems(sub: AnySubscription) -> list[str]:
+    """``when_changed`` keys and ``where`` paths the stream's documents can
+    hold: a typo would filter out every commit, silently."""
+    problems: list[str] = []
+    model = sub.stream.model
+    known = None if model.model_config.get("extra") == "allow" else model.model_fields
+    if known is not None:
+        unknown = sorted(sub.when_changed - known.keys())
+        if unknown:
+            problems.append(
+                f"subscription {sub.id}: when_changed names unknown keys "
+                f"{', '.join(unknown)}"
+            )
+    for path in sub.where:
+        segments = split_path(path)
+        if "" in segments:
+            problems.append(f"subscription {sub.id}: where path {path!r} is malformed")
+        elif known is not None and segments[0] not in known:
+            problems.append(
+                f"subscription {sub.id}: where path {path!r} names unknown key "
+                f"{segments[0]}"
+            )
+    return problems
+
+
 def _is_commit(t: object) -> bool:
     from eventic.envelopes import Commit
 
@@ -95,7 +156,11 @@ class App(BaseModel):
     id: str
     streams: Sequence[Stream[Any]] = ()
     meta: Meta[Any] = NoMeta
-    subscriptions: Sequence[Subscription[Any, Any]] = ()
+    subscriptions: Sequence[
+        Subscription[Any, Any]
+        | AsyncSubscription[Any, Any]
+        | BatchSubscription[Any, Any]
+    ] = ()
     on_inline_error: InlineErrorMode = "raise"
 
     @model_validator(mode="after")
@@ -112,6 +177,8 @@ class App(BaseModel):
             stream_names.add(stream.name)
 
         sub_ids: set[str] = set()
+        partitions: dict[str, int] = {}
+        grouped: dict[str, bool] = {}
         for sub in self.subscriptions:
             if sub.id in sub_ids:
                 problems.append((DuplicateId, f"duplicate subscription id: {sub.id}"))
@@ -125,6 +192,41 @@ class App(BaseModel):
                     )
                 )
             problems.extend((UnsupportedHandler, msg) for msg in _handler_problems(sub))
+            problems.extend((ConfigError, msg) for msg in _filter_problems(sub))
+            if isinstance(sub.delivery, Outbox):
+                count = sub.delivery.partitions
+                if count < 1:
+                    problems.append(
+                        (ConfigError, f"subscription {sub.id}: partitions must be >= 1")
+                    )
+                elif partitions.setdefault(sub.delivery.queue, count) != count:
+                    problems.append(
+                        (
+                            ConfigError,
+                            f"subscription {sub.id}: queue {sub.delivery.queue} "
+                            f"has {partitions[sub.delivery.queue]} partitions, "
+                            f"not {count}",
+                        )
+                    )
+                queue = sub.delivery.queue
+                if grouped.setdefault(queue, sub.delivery.grouped) != (
+                    sub.delivery.grouped
+                ):
+                    problems.append(
+                        (
+                            ConfigError,
+                            f"subscription {sub.id}: queue {queue} mixes grouped "
+                            "and per-subscription intents",
+                        )
+                    )
+                if sub.delivery.grouped and sub.delivery.coalesce:
+                    problems.append(
+                        (
+                            ConfigError,
+                            f"subscription {sub.id}: coalesce needs one intent "
+                            "per subscription, not grouped",
+                        )
+                    )
 
         if problems:
             # §2.1: all checks run and are reported together. If every failure
@@ -153,6 +255,14 @@ class App(BaseModel):
                 "app declares Outbox subscriptions but the store does not "
                 "support transactional delivery intents",
             )
+        grouped_needed = any(
+            isinstance(sub.delivery, Outbox) and sub.delivery.grouped
+            for sub in self.subscriptions
+        )
+        if grouped_needed and not store.capabilities.grouped_intents:
+            raise CapabilityUnsupported(
+                "this store lacks the grouped_intents capability"
+            )
         from eventic.runtime import Runtime
 
         return Runtime(app=self, store=store)  # type: ignore[assignment]
@@ -3,15 +3,17 @@ exit code: 0 success, 1 operational failure, 2 usage/config, 3 drift."""
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import sys
 from typing import Any
 
 from eventic.app import App
 from eventic.cli.loader import make_store
-from eventic.errors import ConfigError, EventicError
+from eventic.cli.supervisor import supervise
+from eventic.errors import CapabilityUnsupported, ConfigError, EventicError
 from eventic.sql.admin import SqlAdmin
-from eventic.worker import Worker
+from eventic.worker import Worker, WorkerReport
 
 EXIT_OK = 0
 EXIT_FAILURE = 1
@@ -99,28 +101,113 @@ def verify(
         store.close()
 
 
-def worker(app: App, url: str, *, queue: str, once: bool, out: Any = sys.stdout) -> int:
+def worker(
+    app: App,
+    url: str,
+    *,
+    queues: dict[str, int],
+    once: bool,
+    concurrency: int = 1,
+    pipelined: bool = False,
+    processes: int = 1,
+    out: Any = sys.stdout,
+) -> int:
+    if processes < 1:
+        raise ConfigError("--processes must be >= 1")
+
+    def drain() -> WorkerReport | None:
+        import signal
+
+        store = make_store(url)
+        try:
+            worker = Worker(
+                app, store, queues=queues, concurrency=concurrency, pipelined=pipelined
+            )
+            if once:
+                return worker.drain_once()
+            # The library never installs signal handlers (F11): the CLI owns the
+            # process, so SIGTERM/SIGINT map to a graceful stop after the current
+            # drain — leases from a killed mid-batch drain stay claimed until
+            # they expire, which at-least-once absorbs.
+            signal.signal(signal.SIGTERM, lambda _s, _f: worker.stop())
+            signal.signal(signal.SIGINT, lambda _s, _f: worker.stop())
+            worker.run_forever()
+            return None
+        finally:
+            store.close()
+
+    failed = False
+    if processes == 1:
+        report = drain()
+    else:
+        store = make_store(url)
+        try:
+            if not store.capabilities.concurrent_drainers:
+                raise CapabilityUnsupported(
+                    "this store lacks the concurrent_drainers capability; "
+                    "run one process"
+                )
+        finally:
+            store.close()
+        report, failed = supervise(processes, drain, once=once)
+    if report is None:
+        return EXIT_FAILURE if failed else EXIT_OK
+    for queue, part in report.by_queue.items():
+        print(
+            f"queue={queue} claimed={part.claimed} "
+            f"delivered={part.delivered} retried={part.retried} "
+            f"dead_lettered={part.dead_lettered}",
+            file=out,
+        )
+    print(
+        f"claimed={report.claimed} delivered={report.delivered} "
+        f"retried={report.retried} dead_lettered={report.dead_lettered}",
+        file=out,
+    )
+    return EXIT_FAILURE if failed or report.dead_lettered > 0 else EXIT_OK
+
+
+def tail(
+    app: App,
+    url: str,
+    *,
+    streams: list[str],
+    after: str | None,
+    limit: int,
+    follow: bool,
+    poll: float,
+    out: Any = sys.stdout,
+) -> int:
     import signal
+    import threading
 
+    declared = {stream.name: stream for stream in app.streams}
+    unknown = [name for name in streams if name not in declared]
+    if unknown:
+        print(
+            f"error: stream {unknown[0]} is not installed in this app", file=sys.stderr
+        )
+        return EXIT_USAGE
+    selected = [declared[name] for name in streams]
     store = make_store(url)
+    stopped = threading.Event()
+    if follow:
+        signal.signal(signal.SIGTERM, lambda _s, _f: stopped.set())
+        signal.signal(signal.SIGINT, lambda _s, _f: stopped.set())
     try:
-        worker = Worker(app, store, queue=queue)
-        if once:
-            report = worker.drain_once()
-            print(
-                f"claimed={report.claimed} delivered={report.delivered} "
-                f"retried={report.retried} dead_lettered={report.dead_lettered}",
-                file=out,
-            )
-            return EXIT_FAILURE if report.dead_lettered > 0 else EXIT_OK
-
-        # The library never installs signal handlers (F11): the CLI owns the
-        # process, so SIGTERM/SIGINT map to a graceful stop after the current
-        # drain — leases from a killed mid-batch drain stay claimed until they
-        # expire, which at-least-once absorbs.
-        signal.signal(signal.SIGTERM, lambda _s, _f: worker.stop())
-        signal.signal(signal.SIGINT, lambda _s, _f: worker.stop())
-        worker.run_forever()
+        runtime = app.bind(store)
+        while not stopped.is_set():
+            page = runtime.changes(after, streams=selected, limit=limit)
+            for change in page.items:
+                # one JSON line per revision: identity and position, no payload
+                print(change.model_dump_json(), file=out, flush=True)
+            if page.items:
+                after = page.items[-1].position
+            if page.cursor is not None:
+                continue  # a full page: more is already settled
+            if not follow:
+                break
+            stopped.wait(poll)
         return EXIT_OK
     finally:
         store.close()
@@ -141,8 +228,9 @@ def intents_list(
             status=status, limit=limit, cursor=cursor
         )
         for row in rows:
+            owed = ",".join(row["subscriptions"] or [row["subscription_id"]])
             print(
-                f"{row['intent_id']} {row['subscription_id']} {row['queue']} "
+                f"{row['intent_id']} {owed} {row['queue']} "
                 f"{row['status']} attempts={row['attempts']}",
                 file=out,
             )
@@ -188,12 +276,7 @@ def inspect_app(app: App, url: str, out: Any = sys.stdout) -> int:
                 }
                 for sub in app.subscriptions
             ],
-            "capabilities": {
-                "outbox": store.capabilities.outbox,
-                "json_paths": store.capabilities.json_paths,
-                "concurrent_drainers": store.capabilities.concurrent_drainers,
-                "max_batch": store.capabilities.max_batch,
-            },
+            "capabilities": dataclasses.asdict(store.capabilities),
         }
         print(json.dumps(facts, indent=2, sort_keys=True), file=out)
         return EXIT_OK
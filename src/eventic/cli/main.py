@@ -15,6 +15,14 @@ from eventic.cli.loader import load_app
 URL_HELP = "database URL (sqlite:// or postgresql://); defaults to $EVENTIC_URL"
 
 
+def _queue(value: str) -> tuple[str, int]:
+    """``NAME`` or ``NAME=WEIGHT`` for ``worker --queue``."""
+    name, sep, weight = value.partition("=")
+    if not name or (sep and not weight.isdigit()) or weight == "0":
+        raise argparse.ArgumentTypeError(f"expected NAME or NAME=WEIGHT: {value}")
+    return name, int(weight) if sep else 1
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="eventic",
@@ -44,8 +52,41 @@ def _build_parser() -> argparse.ArgumentParser:
     verify.add_argument("--chunk", type=int, default=1000)
 
     worker = sub.add_parser("worker", help="drain an outbox queue")
-    worker.add_argument("--queue", default="default")
+    worker.add_argument(
+        "--queue",
+        type=_queue,
+        action="append",
+        help="NAME or NAME=WEIGHT; repeatable, default 'default'",
+    )
     worker.add_argument("--once", action="store_true", help="drain one batch and exit")
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="delivery threads; one aggregate stays in order on one thread",
+    )
+    worker.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="settle each batch in the transaction that claims the next",
+    )
+    worker.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="drainer processes; more than one needs concurrent_drainers",
+    )
+
+    tail = sub.add_parser("tail", help="print committed revisions in commit order")
+    tail.add_argument(
+        "--stream", action="append", default=[], help="repeatable; default all"
+    )
+    tail.add_argument("--after", help="resume after this position")
+    tail.add_argument("--limit", type=int, default=100, help="page size")
+    tail.add_argument("--follow", action="store_true", help="keep polling")
+    tail.add_argument(
+        "--poll", type=float, default=1.0, help="seconds between polls when idle"
+    )
 
     intents = sub.add_parser("intents", help="inspect and operate on delivery intents")
     intents_sub = intents.add_subparsers(dest="action", required=True)
@@ -85,6 +126,7 @@ def _dispatch(args: argparse.Namespace, app: Any) -> int:
         "heads.rebuild": commands.heads_rebuild,
         "verify": commands.verify,
         "worker": commands.worker,
+        "tail": commands.tail,
         "intents.list": commands.intents_list,
         "intents.redrive": commands.intents_redrive,
         "inspect": commands.inspect_app,
@@ -100,7 +142,25 @@ def _dispatch(args: argparse.Namespace, app: Any) -> int:
     if key == "verify":
         return handler(app, args.url, stream=args.stream, chunk=args.chunk)
     if key == "worker":
-        return handler(app, args.url, queue=args.queue, once=args.once)
+        return handler(
+            app,
+            args.url,
+            queues=dict(args.queue or [("default", 1)]),
+            once=args.once,
+            concurrency=args.concurrency,
+            pipelined=args.pipelined,
+            processes=args.processes,
+        )
+    if key == "tail":
+        return handler(
+            app,
+            args.url,
+            streams=args.stream,
+            after=args.after,
+            limit=args.limit,
+            follow=args.follow,
+            poll=args.poll,
+        )
     if key == "intents.list":
         return handler(
             app, args.url, status=args.status, limit=args.limit, cursor=args.cursor
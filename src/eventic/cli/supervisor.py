@@ -0,0 +1,128 @@
+"""``eventic worker --processes N``: fork N drainers and keep them running.
+
+POSIX only. Children are forked, so they inherit the loaded app — handlers
+need not be importable or picklable. Each child opens its own store; no
+connection crosses the fork.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import signal
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import SimpleQueue
+from typing import Any
+
+from eventic.errors import ConfigError
+from eventic.worker import WorkerReport
+
+_RESTART_BASE = 1.0  # seconds before the first restart of a crashed child
+_RESTART_CAP = 30.0
+_HEALTHY = 60.0  # a child that ran this long starts its backoff over
+_TICK = 0.1  # seconds; the supervisor rechecks its stop flag this often
+
+
+@dataclass
+class _Slot:
+    process: BaseProcess | None = None
+    started: float = 0.0
+    failures: int = 0
+    due: float = 0.0  # monotonic time of the next start
+
+
+def _child(drain: Callable[[], WorkerReport | None], reports: SimpleQueue[Any]) -> None:
+    # Not the supervisor's handlers: ``drain`` installs its own.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    report = drain()
+    if report is not None:
+        reports.put(report)
+
+
+def supervise(
+    processes: int,
+    drain: Callable[[], WorkerReport | None],
+    *,
+    once: bool,
+    err: Any = sys.stderr,
+) -> tuple[WorkerReport | None, bool]:
+    """Run ``drain`` in ``processes`` forked children until they are done.
+
+    ``drain`` owns the child's store, worker and signal handling, and
+    returns a report with ``once``. SIGTERM and SIGINT here are forwarded
+    to the children as SIGTERM, and the supervisor returns once they have
+    stopped. Without ``once`` a child that exits on its own is restarted,
+    after a backoff that doubles per crash up to 30 s.
+
+    Returns the children's combined report (``None`` without ``once``) and
+    whether any child failed.
+    """
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError as exc:
+        raise ConfigError("--processes needs a platform that can fork") from exc
+    reports: SimpleQueue[Any] = context.SimpleQueue()
+    slots = [_Slot() for _ in range(processes)]
+    stopping = False
+    forwarded = False
+    failed = False
+    collected: list[WorkerReport] = []
+
+    def stop(_signum: int, _frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    previous = {
+        signum: signal.signal(signum, stop)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    try:
+        while True:
+            now = time.monotonic()
+            for number, slot in enumerate(slots):
+                if slot.process is not None and slot.process.exitcode is not None:
+                    code = slot.process.exitcode
+                    slot.process = None
+                    if once or stopping:
+                        failed = failed or code != 0
+                        slot.due = float("inf")
+                        continue
+                    ran = now - slot.started
+                    slot.failures = 1 if ran >= _HEALTHY else slot.failures + 1
+                    delay = min(_RESTART_CAP, _RESTART_BASE * 2 ** (slot.failures - 1))
+                    slot.due = now + delay
+                    print(
+                        f"worker process {number} exited with code {code}; "
+                        f"restarting in {delay:g}s",
+                        file=err,
+                    )
+                if slot.process is None and not stopping and slot.due <= now:
+                    slot.process = context.Process(
+                        target=_child,
+                        args=(drain, reports),
+                        name=f"eventic-worker-{number}",
+                    )
+                    slot.process.start()
+                    slot.started = now
+                    slot.due = float("inf") if once else 0.0
+            while not reports.empty():  # read as they come: a full pipe blocks
+                collected.append(reports.get())
+            live = [slot.process for slot in slots if slot.process is not None]
+            if stopping and not forwarded:
+                for process in live:
+                    process.terminate()  # SIGTERM: the child stops after its drain
+                forwarded = True
+            if not live and (once or stopping):
+                break
+            wait([process.sentinel for process in live], timeout=_TICK)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+    while not reports.empty():
+        collected.append(reports.get())
+    return (WorkerReport.combine(collected) if once else None), failed
@@ -13,8 +13,9 @@ from typing import Any
 from eventic.app import App
 from eventic.envelopes import Commit
 from eventic.errors import InlineDispatchError
+from eventic.planning import state_tree, wants
 from eventic.stream import Stream
-from eventic.subscription import Inline
+from eventic.subscription import BatchSubscription, Inline
 
 logger = logging.getLogger("eventic")
 
@@ -22,10 +23,15 @@ logger = logging.getLogger("eventic")
 def dispatch_inline(app: App, stream: Stream[Any], commit: Commit[Any, Any]) -> None:
     """Run every inline subscription matching this commit, in declaration order."""
     failures: list[str] = []
+    after = None
     for sub in app.subscriptions:
         if sub.stream.name != stream.name or commit.kind not in sub.kinds:
             continue
-        if not isinstance(sub.delivery, Inline):
+        if isinstance(sub, BatchSubscription) or not isinstance(sub.delivery, Inline):
+            continue  # a BatchSubscription is Outbox only
+        if sub.where and after is None:
+            after = state_tree(stream, commit.revision.state)
+        if not wants(sub, commit.changed, after or {}):
             continue
         try:
             sub.handler(commit)
@@ -1,9 +1,10 @@
-"""Envelopes: ``Revision``, ``Commit``, ``Page`` — frozen generic Pydantic models."""
+"""Envelopes: ``Revision``, ``Commit``, ``Projection``, ``NotModified``, ``Change``,
+``Page`` — frozen Pydantic models."""
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -36,6 +37,62 @@ class Commit[T: BaseModel, M: BaseModel](BaseModel):
     changed: frozenset[str]
 
 
+class Projection(BaseModel):
+    """Selected paths of a head, read without validating the stream model.
+
+    ``fields`` holds the stored document's values at ``schema_version`` — no
+    upcast, no model validation. A path missing from the document is missing
+    from ``fields``; an explicit JSON null is present as ``None``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    stream: str
+    id: UUID
+    revision: int
+    revision_id: UUID
+    schema_version: int
+    committed_at: datetime
+    digest: str
+    fields: dict[str, Any]
+
+
+class NotModified(BaseModel):
+    """A conditional ``get`` whose condition held: the head is unchanged.
+
+    Carries the current head's revision and digest (the ETag), never state.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    stream: str
+    id: UUID
+    revision: int
+    digest: str
+
+
+class Change(BaseModel):
+    """One committed revision in the global change feed, without state.
+
+    ``position`` is opaque and totally ordered by the store; resume a feed by
+    passing the last seen ``position`` as ``after``. ``changed`` is the
+    top-level keys the revision changed, or ``None`` for a revision written
+    without them.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    position: str
+    stream: str
+    id: UUID
+    revision: int
+    revision_id: UUID
+    kind: Kind
+    digest: str
+    committed_at: datetime
+    changed: frozenset[str] | None = None
+
+
 class Page[X](BaseModel):
     """A bounded page of results; ``cursor`` is opaque and ``None`` when exhausted."""
 
@@ -0,0 +1,75 @@
+"""Pure drain pacing: the last batch -> the next wait, the next batch size,
+and which queue goes next.
+
+No clock read: measured durations are arguments. The worker measures; this
+module decides.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import timedelta
+
+_LEASE_SHARE = 0.5  # deliver a batch within half its lease; the rest is slack
+_SMOOTHING = 0.3  # weight of the newest batch in the per-intent average
+
+
+def next_wait(
+    claimed: int,
+    limit: int,
+    previous: timedelta,
+    *,
+    floor: timedelta,
+    ceiling: timedelta,
+) -> timedelta:
+    """How long to wait before the next drain.
+
+    A full batch means a backlog: drain again at once. A partial batch just
+    emptied the queue: wait ``floor``. An empty one doubles the previous
+    wait, up to ``ceiling``.
+    """
+    if claimed >= limit:
+        return timedelta(0)
+    if claimed > 0:
+        return floor
+    return min(ceiling, max(floor, previous * 2))
+
+
+def per_intent(previous: float | None, claimed: int, seconds: float) -> float | None:
+    """The smoothed delivery time per intent after a batch of ``claimed``."""
+    if claimed == 0:
+        return previous
+    latest = seconds / claimed
+    if previous is None:
+        return latest
+    return previous + _SMOOTHING * (latest - previous)
+
+
+def batch_size(per_intent: float | None, lease: timedelta, *, ceiling: int) -> int:
+    """The largest batch whose serial delivery fits half the lease.
+
+    At most ``ceiling``, at least one; ``ceiling`` until there is a
+    measurement.
+    """
+    if per_intent is None or per_intent <= 0:
+        return ceiling
+    fits = int(lease.total_seconds() * _LEASE_SHARE / per_intent)
+    return max(1, min(ceiling, fits))
+
+
+def weighted_turn(
+    weights: Mapping[str, int], credit: Mapping[str, int], ready: Sequence[str]
+) -> tuple[str, dict[str, int]]:
+    """The queue that drains next, and the credit after its turn.
+
+    Smooth weighted round-robin: each ready queue earns its weight, the one
+    with the most credit goes and pays back the ready queues' total weight.
+    Turns come in proportion to weight and interleaved, not in bursts; a
+    queue that is not ready neither earns nor pays. ``ready`` is not empty.
+    """
+    after = dict(credit)
+    for queue in ready:
+        after[queue] = after.get(queue, 0) + weights[queue]
+    chosen = max(ready, key=lambda queue: after[queue])
+    after[chosen] -= sum(weights[queue] for queue in ready)
+    return chosen, after
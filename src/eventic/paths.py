@@ -0,0 +1,62 @@
+"""Dotted filter paths, parsed and matched in Python.
+
+The SQL dialects push the same semantics into the database; this module is
+the reference for documents that only exist after decoding (historical reads).
+Pure: no I/O, no clock.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from eventic.jsonx import JsonObject, JsonValue
+
+_MISSING = object()
+
+
+def split_path(path: str) -> list[str]:
+    """Split a dotted filter path, honoring ``\\`` escaping for literal dots."""
+    segments: list[str] = []
+    current: list[str] = []
+    escaped = False
+    for char in path:
+        if escaped:
+            current.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == ".":
+            segments.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    if escaped:
+        current.append("\\")
+    segments.append("".join(current))
+    return segments
+
+
+def lookup(doc: JsonObject, path: str) -> Any:
+    """The value at ``path``, or a private sentinel when the path is missing."""
+    node: object = doc
+    for segment in split_path(path):
+        if not isinstance(node, dict) or segment not in node:
+            return _MISSING
+        node = node[segment]
+    return node
+
+
+def matches(doc: JsonObject, filters: Mapping[str, JsonValue]) -> bool:
+    """Equality on every path, with the SQLite dialect's ``search`` semantics.
+
+    A missing path never matches, not even ``None``; JSON types are strict,
+    so ``True`` does not equal ``1`` and ``1`` does not equal ``1.0``.
+    """
+    for path, expected in filters.items():
+        actual = lookup(doc, path)
+        if actual is _MISSING or type(actual) is not type(expected):
+            return False
+        if actual != expected:
+            return False
+    return True
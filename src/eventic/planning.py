@@ -6,6 +6,7 @@ fully-formed request the store can commit blindly.
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from typing import Any
 from uuid import UUID
@@ -16,8 +17,9 @@ from eventic.envelopes import Revision
 from eventic.ids import revision_id
 from eventic.jsonx import JsonObject, digest
 from eventic.meta import Meta
+from eventic.paths import matches
 from eventic.stream import Stream
-from eventic.subscription import Outbox
+from eventic.subscription import AnySubscription, Outbox
 from eventic.wire import CommitRequest, IntentRequest, Kind
 
 
@@ -38,6 +40,8 @@ def plan_create(
 ) -> CommitRequest:
     """Plan the creation of a new aggregate at revision 0."""
     payload = _canonical_bytes(stream, state)
+    after = json.loads(payload)
+    changed = changed_keys(None, after)
     meta_decl = app.meta
     meta_value = meta if meta is not None else meta_decl.model()
     meta_payload = _meta_bytes(meta_decl, meta_value)
@@ -53,7 +57,8 @@ def plan_create(
         meta=meta_payload,
         meta_version=meta_decl.version,
         fingerprint=stream.fingerprint,
-        intents=intents_for(app, stream, "create", rid),
+        intents=intents_for(app, stream, "create", rid, aggregate_id, changed, after),
+        changed=tuple(sorted(changed)),
     )
 
 
@@ -65,6 +70,8 @@ def _plan_change(
     meta: object | None,
 ) -> CommitRequest:
     payload = _canonical_bytes(stream, new_state)
+    after = json.loads(payload)
+    changed = changed_keys(state_tree(stream, base.state), after)
     meta_decl = app.meta
     meta_value = meta if meta is not None else base.meta
     meta_payload = _meta_bytes(meta_decl, meta_value)
@@ -81,7 +88,8 @@ def _plan_change(
         meta=meta_payload,
         meta_version=meta_decl.version,
         fingerprint=stream.fingerprint,
-        intents=intents_for(app, stream, "change", rid),
+        intents=intents_for(app, stream, "change", rid, base.id, changed, after),
+        changed=tuple(sorted(changed)),
     )
 
 
@@ -134,20 +142,60 @@ def state_tree(stream: Stream[Any], state: object) -> JsonObject:
     return json.loads(_canonical_bytes(stream, state))
 
 
+def partition_of(aggregate_id: UUID, partitions: int) -> int:
+    """The aggregate's partition: stable across processes and releases."""
+    return aggregate_id.int % partitions
+
+
+def wants(sub: AnySubscription, changed: frozenset[str], after: JsonObject) -> bool:
+    """Whether the subscription's ``when_changed`` and ``where`` take a
+    commit that changed ``changed`` and left the document at ``after``."""
+    if sub.when_changed and sub.when_changed.isdisjoint(changed):
+        return False
+    return matches(after, sub.where)
+
+
 def intents_for(
-    app: App, stream: Stream[Any], kind: Kind, revision_id_: UUID
+    app: App,
+    stream: Stream[Any],
+    kind: Kind,
+    revision_id_: UUID,
+    aggregate_id: UUID,
+    changed: frozenset[str],
+    after: JsonObject,
 ) -> tuple[IntentRequest, ...]:
-    """Every outbox intent owed for a commit; inline subscriptions are free."""
+    """Every outbox intent owed for a commit; inline subscriptions are free,
+    and a subscription whose predicates reject the commit owes none.
+
+    A grouped queue gets one intent for all of its subscriptions, in
+    declaration order, in the place of the first.
+    """
     intents: list[IntentRequest] = []
+    grouped: dict[str, int] = {}  # queue -> index of its intent
     for sub in app.subscriptions:
         if sub.stream.name != stream.name or kind not in sub.kinds:
             continue
-        if isinstance(sub.delivery, Outbox):
-            intents.append(
-                IntentRequest(
-                    subscription_id=sub.id,
-                    revision_id=revision_id_,
-                    queue=sub.delivery.queue,
-                )
+        if not isinstance(sub.delivery, Outbox) or not wants(sub, changed, after):
+            continue
+        queue = sub.delivery.queue
+        if queue in grouped:
+            first = intents[grouped[queue]]
+            intents[grouped[queue]] = dataclasses.replace(
+                first,
+                inline_payload=first.inline_payload or sub.delivery.inline_payload,
+                subscriptions=(*first.subscriptions, sub.id),
+            )
+            continue
+        if sub.delivery.grouped:
+            grouped[queue] = len(intents)
+        intents.append(
+            IntentRequest(
+                subscription_id=sub.id,
+                revision_id=revision_id_,
+                queue=queue,
+                inline_payload=sub.delivery.inline_payload,
+                partition=partition_of(aggregate_id, sub.delivery.partitions),
+                subscriptions=(sub.id,) if sub.delivery.grouped else (),
             )
+        )
     return tuple(intents)
@@ -2,14 +2,19 @@
 
 No SQLAlchemy import, no ``Session`` parameter, no generator or iterator
 return. This file is the seam the async port happens below.
+
+Optional read paths and worker extensions are separate narrow protocols, gated
+by a capability, so a minimal store stays a valid ``Store`` without
+implementing them.
 """
 
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Protocol
+from uuid import UUID
 
 from eventic.app import App
 from eventic.envelopes import Page
@@ -19,7 +24,10 @@ from eventic.wire import (
     ClaimedIntent,
     CommitRequest,
     CommitResult,
+    HeadRef,
     Settlement,
+    StoredChange,
+    StoredProjection,
     StoredRevision,
 )
 
@@ -31,6 +39,15 @@ class Capabilities:
     outbox: bool = False
     json_paths: bool = False
     concurrent_drainers: bool = False
+    projections: bool = False
+    change_feed: bool = False
+    point_in_time: bool = False
+    wakeups: bool = False
+    batch_reads: bool = False
+    pipelined_claims: bool = False
+    lease_extension: bool = False
+    partitions: bool = False
+    grouped_intents: bool = False
     max_batch: int = 100
 
 
@@ -101,6 +118,176 @@ class Store(Protocol):
     def settle(self, settlements: Sequence[Settlement]) -> None: ...
 
 
+class ProjectionReads(Protocol):
+    """Narrow head reads; required by the ``projections`` capability.
+
+    Paths use the ``search`` filter syntax (dotted, ``\\.`` for a literal dot)
+    and are extracted by the backend: the full document never leaves it.
+    ``*_refs`` read no document at all.
+    """
+
+    def head_fields(
+        self, key: AggregateKey, fields: Sequence[str]
+    ) -> StoredProjection | None: ...
+
+    def search_fields(
+        self,
+        stream: str,
+        filters: Mapping[str, JsonValue],
+        *,
+        fields: Sequence[str],
+        cursor: str | None,
+        limit: int,
+    ) -> Page[StoredProjection]: ...
+
+    def head_refs(self, stream: str, ids: Sequence[UUID]) -> Sequence[HeadRef]: ...
+
+    def search_refs(
+        self,
+        stream: str,
+        filters: Mapping[str, JsonValue],
+        *,
+        cursor: str | None,
+        limit: int,
+    ) -> Page[HeadRef]: ...
+
+
+class ChangeFeed(Protocol):
+    """The global commit-ordered log; required by the ``change_feed`` capability.
+
+    ``changes`` pages log rows after an opaque ``position`` in an order that
+    never places a row behind one already returned: a reader that resumes
+    from its last position misses nothing. ``streams`` empty means all.
+    """
+
+    def changes(
+        self, after: str | None, *, streams: Sequence[str], limit: int
+    ) -> Page[StoredChange]: ...
+
+
+class PointInTimeReads(Protocol):
+    """Reads as of a moment; required by the ``point_in_time`` capability.
+
+    The revision returned for an aggregate is its last one committed at or
+    before ``as_of`` (tz-aware); an aggregate created later is absent.
+    ``search_at`` applies ``filters`` to those historical documents.
+    """
+
+    def revision_at(
+        self, key: AggregateKey, as_of: datetime
+    ) -> StoredRevision | None: ...
+
+    def search_at(
+        self,
+        stream: str,
+        filters: Mapping[str, JsonValue],
+        *,
+        as_of: datetime,
+        cursor: str | None,
+        limit: int,
+    ) -> Page[StoredRevision]: ...
+
+
+class BatchReads(Protocol):
+    """Many exact revisions in one call; required by ``batch_reads``.
+
+    ``revisions`` returns every requested ``(key, revision)`` that exists, in
+    no particular order, each decoded as ``Store.revision`` would. Absent
+    ones are simply missing from the result.
+    """
+
+    def revisions(
+        self, keys: Sequence[tuple[AggregateKey, int]]
+    ) -> Sequence[StoredRevision]: ...
+
+
+class Wakeups(Protocol):
+    """Commit-to-worker signals; required by the ``wakeups`` capability.
+
+    ``wait_for_intents`` blocks until a commit staged intents for ``queue``
+    or ``timeout`` passes, and says which. The first call subscribes; a
+    signal that arrives between calls is kept for the next one, so a worker
+    that waits once before its first drain misses nothing. A signal is a
+    hint to claim, never a delivery: polling stays the fallback.
+    """
+
+    def wait_for_intents(self, queue: str, *, timeout: timedelta) -> bool: ...
+
+
+class PipelinedClaims(Protocol):
+    """Settle and claim in one transaction; required by ``pipelined_claims``.
+
+    ``settle_and_claim`` applies ``settlements`` exactly as ``settle`` would
+    and then claims as ``claim`` would, atomically: if the claim fails, the
+    settlements are not applied either.
+    """
+
+    def settle_and_claim(
+        self,
+        settlements: Sequence[Settlement],
+        queue: str,
+        *,
+        limit: int,
+        lease: timedelta,
+    ) -> Sequence[ClaimedIntent]: ...
+
+
+class LeaseExtension(Protocol):
+    """Longer leases for intents still in delivery; required by
+    ``lease_extension``.
+
+    ``extend`` sets ``leased_until`` to ``lease`` from now for every claimed
+    intent still leased at the claim's ``attempts``, and returns the ids it
+    extended. One missing from the result was settled or re-claimed: its
+    holder has lost it.
+    """
+
+    def extend(
+        self, claimed: Sequence[ClaimedIntent], *, lease: timedelta
+    ) -> Sequence[UUID]: ...
+
+
+class PartitionedClaims(Protocol):
+    """Partition leases and claims within them; required by ``partitions``.
+
+    ``acquire_partitions`` is one holder's turn at balancing a queue's
+    ``partitions``: it renews the holder's partitions for ``lease``, gives
+    back any above its fair share (the count over the live holders, rounded
+    up), takes free or expired ones up to that share, and returns what the
+    holder now has. Two live holders never hold one partition. A holder
+    joining takes its share as the others give theirs back on their next
+    turn. ``release_partitions`` frees everything the holder has.
+    ``renew_partitions`` renews the holder's partitions and its membership
+    for ``lease`` without rebalancing, and returns the partitions it still
+    has; a worker calls it while a batch is in delivery.
+
+    ``claim_partitions`` is ``claim`` restricted to intents in ``partitions``
+    of the queue's current count ``of``. An intent staged under another
+    count is in partition ``partition % of``, so lowering the count strands
+    nothing.
+    """
+
+    def acquire_partitions(
+        self, queue: str, *, partitions: int, holder: str, lease: timedelta
+    ) -> Sequence[int]: ...
+
+    def release_partitions(self, queue: str, *, holder: str) -> None: ...
+
+    def renew_partitions(
+        self, queue: str, *, holder: str, lease: timedelta
+    ) -> Sequence[int]: ...
+
+    def claim_partitions(
+        self,
+        queue: str,
+        partitions: Sequence[int],
+        *,
+        of: int,
+        limit: int,
+        lease: timedelta,
+    ) -> Sequence[ClaimedIntent]: ...
+
+
 class StoreAdmin(Protocol):
     """CLI-only operations; sync forever (R10)."""
 
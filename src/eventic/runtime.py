@@ -8,15 +8,24 @@ dispatches inline handlers. ``Batch`` accumulates requests and issues one
 from __future__ import annotations
 
 import json
-from typing import Any, TypeVar, cast
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, TypeVar, cast, overload
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel
 
 from eventic.app import App
 from eventic.dispatch import dispatch_inline
-from eventic.envelopes import Commit, Page, Revision
-from eventic.errors import NotFound, UsageError
+from eventic.envelopes import (
+    Change,
+    Commit,
+    NotModified,
+    Page,
+    Projection,
+    Revision,
+)
+from eventic.errors import CapabilityUnsupported, NotFound, UsageError
 from eventic.hydration import hydrate
 from eventic.planning import (
     changed_keys,
@@ -25,9 +34,21 @@ from eventic.planning import (
     plan_replace,
     state_tree,
 )
-from eventic.protocols import Store, StoreAdmin
+from eventic.protocols import (
+    ChangeFeed,
+    PointInTimeReads,
+    ProjectionReads,
+    Store,
+    StoreAdmin,
+)
 from eventic.stream import Stream
-from eventic.wire import CommitRequest, CommitResult, StoredRevision
+from eventic.wire import (
+    CommitRequest,
+    CommitResult,
+    HeadRef,
+    StoredProjection,
+    StoredRevision,
+)
 
 AnyT = TypeVar("AnyT", bound=BaseModel)
 
@@ -78,10 +99,70 @@ class Collection[AnyT: BaseModel]:
 
     # -- reads --------------------------------------------------------------
 
-    def get(self, id: UUID, *, revision: int | None = None) -> Revision[AnyT, Any]:
+    @overload
+    def get(
+        self,
+        id: UUID,
+        *,
+        revision: int | None = None,
+        as_of: datetime | None = None,
+        fields: None = None,
+    ) -> Revision[AnyT, Any]: ...
+
+    @overload
+    def get(self, id: UUID, *, fields: Sequence[str]) -> Projection: ...
+
+    @overload
+    def get(
+        self, id: UUID, *, if_none_match: str
+    ) -> Revision[AnyT, Any] | NotModified: ...
+
+    @overload
+    def get(
+        self, id: UUID, *, if_revision_gt: int
+    ) -> Revision[AnyT, Any] | NotModified: ...
+
+    def get(
+        self,
+        id: UUID,
+        *,
+        revision: int | None = None,
+        as_of: datetime | None = None,
+        fields: Sequence[str] | None = None,
+        if_none_match: str | None = None,
+        if_revision_gt: int | None = None,
+    ) -> Revision[AnyT, Any] | Projection | NotModified:
         from eventic.ids import AggregateKey
 
         key = AggregateKey(self._stream.name, id)
+        if if_none_match is not None or if_revision_gt is not None:
+            if revision is not None or fields is not None or as_of is not None:
+                raise UsageError("a conditional get reads the head, nothing else")
+            if if_none_match is not None and if_revision_gt is not None:
+                raise UsageError("pass if_none_match or if_revision_gt, not both")
+            unchanged = self._unchanged(id, if_none_match, if_revision_gt)
+            if unchanged is not None:
+                return unchanged
+        if fields is not None:
+            if revision is not None or as_of is not None:
+                raise UsageError("fields reads the head; it cannot take a revision")
+            projected = self._projections().head_fields(key, _paths(fields))
+            if projected is None:
+                raise NotFound(
+                    "aggregate absent", stream=self._stream.name, aggregate_id=id
+                )
+            return _projection(projected)
+        if as_of is not None:
+            if revision is not None:
+                raise UsageError("pass revision or as_of, not both")
+            stored = self._history().revision_at(key, as_of)
+            if stored is None:
+                raise NotFound(
+                    "aggregate absent at as_of",
+                    stream=self._stream.name,
+                    aggregate_id=id,
+                )
+            return hydrate(self._stream, self._app.meta, stored)
         stored = (
             self._store.head(key)
             if revision is None
@@ -111,29 +192,127 @@ class Collection[AnyT: BaseModel]:
         )
         return Page[Revision[AnyT, Any]](items=items, cursor=page.cursor)
 
+    @overload
     def where(
         self,
         *,
         limit: int = 100,
         cursor: str | None = None,
+        as_of: datetime | None = None,
+        fields: None = None,
         **filters: object,
-    ) -> Page[Revision[AnyT, Any]]:
+    ) -> Page[Revision[AnyT, Any]]: ...
+
+    @overload
+    def where(
+        self,
+        *,
+        limit: int = 100,
+        cursor: str | None = None,
+        as_of: None = None,
+        fields: Sequence[str],
+        **filters: object,
+    ) -> Page[Projection]: ...
+
+    def where(
+        self,
+        *,
+        limit: int = 100,
+        cursor: str | None = None,
+        as_of: datetime | None = None,
+        fields: Sequence[str] | None = None,
+        **filters: object,
+    ) -> Page[Revision[AnyT, Any]] | Page[Projection]:
         if limit < 1:
             raise UsageError("limit must be >= 1")
-        page = self._store.search(
-            self._stream.name,
-            {k: v for k, v in filters.items()},  # type: ignore[misc]
-            cursor=cursor,
-            limit=limit,
+        if as_of is not None and fields is not None:
+            raise UsageError("fields reads heads; it cannot take as_of")
+        if fields is not None:
+            projected = self._projections().search_fields(
+                self._stream.name,
+                {k: v for k, v in filters.items()},  # type: ignore[misc]
+                fields=_paths(fields),
+                cursor=cursor,
+                limit=limit,
+            )
+            return Page[Projection](
+                items=tuple(_projection(item) for item in projected.items),
+                cursor=projected.cursor,
+            )
+        page = (
+            self._store.search(
+                self._stream.name,
+                {k: v for k, v in filters.items()},  # type: ignore[misc]
+                cursor=cursor,
+                limit=limit,
+            )
+            if as_of is None
+            else self._history().search_at(
+                self._stream.name,
+                {k: v for k, v in filters.items()},  # type: ignore[misc]
+                as_of=as_of,
+                cursor=cursor,
+                limit=limit,
+            )
         )
         items = tuple(
             hydrate(self._stream, self._app.meta, stored) for stored in page.items
         )
         return Page[Revision[AnyT, Any]](items=items, cursor=page.cursor)
 
+    def where_ids(
+        self,
+        *,
+        limit: int = 100,
+        cursor: str | None = None,
+        **filters: object,
+    ) -> Page[HeadRef]:
+        """Which aggregates match, with their head revision and digest only."""
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        return self._projections().search_refs(
+            self._stream.name,
+            {k: v for k, v in filters.items()},  # type: ignore[misc]
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def head_revisions(self, ids: Sequence[UUID]) -> dict[UUID, HeadRef]:
+        """Current revision and digest per id; absent aggregates are omitted."""
+        refs = self._projections().head_refs(self._stream.name, list(ids))
+        return {ref.aggregate_id: ref for ref in refs}
+
     # -- plumbing -----------------------------------------------------------
 
+    def _unchanged(
+        self, id: UUID, if_none_match: str | None, if_revision_gt: int | None
+    ) -> NotModified | None:
+        """Check the head by ref; ``None`` means read and return it in full."""
+        refs = self._projections().head_refs(self._stream.name, [id])
+        if not refs:
+            raise NotFound(
+                "aggregate absent", stream=self._stream.name, aggregate_id=id
+            )
+        ref = refs[0]
+        if if_none_match is not None and ref.digest != if_none_match:
+            return None
+        if if_revision_gt is not None and ref.revision > if_revision_gt:
+            return None
+        return NotModified(
+            stream=self._stream.name, id=id, revision=ref.revision, digest=ref.digest
+        )
+
+    def _history(self) -> PointInTimeReads:
+        _require(self._store, "point_in_time")
+        return cast(PointInTimeReads, self._store)
+
+    def _projections(self) -> ProjectionReads:
+        _require(self._store, "projections")
+        return cast(ProjectionReads, self._store)
+
     def _changed(self, request: CommitRequest, before: AnyT | None) -> frozenset[str]:
+        if request.changed is not None:
+            return frozenset(request.changed)
         after = json.loads(request.payload)
         if before is None:
             return frozenset(after)
@@ -176,6 +355,34 @@ class Collection[AnyT: BaseModel]:
         return revision
 
 
+def _require(store: Store, capability: str) -> None:
+    if not getattr(store.capabilities, capability):
+        raise CapabilityUnsupported(f"this store lacks the {capability} capability")
+
+
+def _paths(fields: Sequence[str]) -> tuple[str, ...]:
+    if isinstance(fields, str):
+        raise UsageError("fields takes a sequence of paths, not one string")
+    if not fields:
+        raise UsageError("fields must name at least one path")
+    return tuple(fields)
+
+
+def _projection(stored: StoredProjection) -> Projection:
+    # ``model_construct``: the values are the store's JSON, already trusted;
+    # skipping validation is the point of a projection read.
+    return Projection.model_construct(
+        stream=stored.stream,
+        id=stored.aggregate_id,
+        revision=stored.revision,
+        revision_id=stored.revision_id,
+        schema_version=stored.schema_version,
+        committed_at=stored.committed_at,
+        digest=stored.digest,
+        fields=dict(stored.fields),
+    )
+
+
 class Batch:
     """Accumulate writes; one ``store.commit`` on exit, then inline dispatch."""
 
@@ -279,6 +486,43 @@ class Runtime:
     def batch(self) -> Batch:
         return Batch(self)
 
+    def changes(
+        self,
+        after: str | None = None,
+        *,
+        streams: Sequence[Stream[Any]] = (),
+        limit: int = 100,
+    ) -> Page[Change]:
+        """Committed revisions across streams, in global commit order.
+
+        Resume by passing the last item's ``position`` as ``after``; a reader
+        that does so misses nothing. ``streams`` empty means every stream.
+        """
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        installed = {stream.name for stream in self._app.streams}
+        names = [stream.name for stream in streams]
+        for name in names:
+            if name not in installed:
+                raise UsageError(f"stream {name} is not installed in this app")
+        _require(self._store, "change_feed")
+        page = cast(ChangeFeed, self._store).changes(after, streams=names, limit=limit)
+        items = tuple(
+            Change(
+                position=item.position,
+                stream=item.stream,
+                id=item.aggregate_id,
+                revision=item.revision,
+                revision_id=item.revision_id,
+                kind=cast(Any, item.kind),
+                digest=item.digest,
+                committed_at=item.committed_at,
+                changed=item.changed,
+            )
+            for item in page.items
+        )
+        return Page[Change](items=items, cursor=page.cursor)
+
     def admin(self) -> StoreAdmin:
         """A ``StoreAdmin`` for the bound store, or a clear error."""
         provider = getattr(self.store, "admin", None)
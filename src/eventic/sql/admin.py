@@ -13,7 +13,7 @@ from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select, tuple_
+from sqlalchemy import and_, or_, select, tuple_
 
 from eventic.app import App
 from eventic.errors import StoreError
@@ -314,7 +314,11 @@ class SqlAdmin(StoreAdmin):
         return out, next_cursor
 
     def redrive(self, subscription_id: str) -> int:
-        """Move dead intents of one subscription back to pending."""
+        """Move dead intents of one subscription back to pending.
+
+        A grouped intent owed to it moves whole, with the other
+        subscriptions it still owes.
+        """
         from datetime import datetime
 
         from sqlalchemy import update
@@ -323,10 +327,28 @@ class SqlAdmin(StoreAdmin):
 
         now = datetime.now(UTC)
         with self._store.engine.begin() as conn:
+            # Grouped rows name their subscriptions in JSON; match in Python
+            # rather than per dialect. Dead rows are few.
+            grouped = [
+                row.intent_id
+                for row in conn.execute(
+                    select(intents_t.c.intent_id, intents_t.c.subscriptions).where(
+                        intents_t.c.status == "dead",
+                        intents_t.c.subscriptions.is_not(None),
+                    )
+                )
+                if subscription_id in row.subscriptions
+            ]
             result = conn.execute(
                 update(intents_t)
                 .where(
-                    intents_t.c.subscription_id == subscription_id,
+                    or_(
+                        and_(
+                            intents_t.c.subscription_id == subscription_id,
+                            intents_t.c.subscriptions.is_(None),
+                        ),
+                        intents_t.c.intent_id.in_(grouped),
+                    ),
                     intents_t.c.status == "dead",
                 )
                 .values(
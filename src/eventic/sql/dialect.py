@@ -7,50 +7,64 @@ Core constructs through it; ``store.py`` executes them.
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import ColumnElement, Insert, and_, or_
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    ColumnElement,
+    DateTime,
+    Insert,
+    Integer,
+    Text,
+    Uuid,
+    and_,
+    bindparam,
+    cast,
+    column,
+    func,
+    literal,
+    true,
+    union_all,
+    update,
+    values,
+)
 from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from eventic.jsonx import JsonValue
+from eventic.paths import split_path
 from eventic.protocols import Capabilities
+from eventic.sql.tables import (
+    eventic_drainer as eventic_drainer_table,
+)
 from eventic.sql.tables import (
     eventic_head as eventic_head_table,
 )
 from eventic.sql.tables import (
     eventic_intent as eventic_intent_table,
 )
+from eventic.sql.tables import (
+    eventic_partition as eventic_partition_table,
+)
 from eventic.sql.tables import (
     eventic_revision as eventic_revision_table,
 )
 from eventic.sql.tables import (
     eventic_schema as eventic_schema_table,
 )
+from eventic.sql.tables import position_seq
+from eventic.wire import Settlement
 
+INTENT_CHANNEL = "eventic_intent"
+"""The Postgres NOTIFY channel; the payload is the queue name."""
 
-def split_path(path: str) -> list[str]:
-    """Split a dotted filter path, honoring ``\\`` escaping for literal dots."""
-    segments: list[str] = []
-    current: list[str] = []
-    escaped = False
-    for char in path:
-        if escaped:
-            current.append(char)
-            escaped = False
-        elif char == "\\":
-            escaped = True
-        elif char == ".":
-            segments.append("".join(current))
-            current = []
-        else:
-            current.append(char)
-    if escaped:
-        current.append("\\")
-    segments.append("".join(current))
-    return segments
+# A settlement's owed subscriptions; ``None`` binds SQL NULL, not JSON null.
+_OWED = JSON(none_as_null=True)
 
 
 def _json_path_string(path: str) -> str:
@@ -84,8 +98,6 @@ class Dialect:
     ) -> ColumnElement[Any]:
         """Equality on a dotted path, distinguishing missing from JSON null."""
         if self.name == "sqlite":
-            from sqlalchemy import func
-
             path_str = _json_path_string(path)
             if value is None:
                 return and_(
@@ -115,6 +127,59 @@ class Dialect:
         # in the document is present; a missing path is not.
         return column.op("@>")(_nested(path, value))
 
+    def path_json(self, column: ColumnElement[Any], path: str) -> ColumnElement[Any]:
+        """The JSON text at a dotted path, or SQL NULL when the path is missing.
+
+        Text, not a parsed value: a JSON ``null`` comes back as ``'null'`` and
+        stays distinct from a missing path.
+        """
+        if self.name == "sqlite":
+            return column.op("->", return_type=Text)(_json_path_string(path))
+        return cast(func.jsonb_extract_path(column, *split_path(path)), Text)
+
+    def commit_order(self) -> dict[str, Any]:
+        """``commit_tx`` and ``position`` values for a new log row.
+
+        SQLite serializes writers (``BEGIN IMMEDIATE``), so ``max + 1`` inside
+        the write transaction is already commit order; ``commit_tx`` mirrors
+        ``position``. Postgres records the writing transaction id and draws
+        ``position`` from a sequence.
+        """
+        log = eventic_revision_table
+        if self.name == "sqlite":
+            after = sa_select(
+                func.coalesce(func.max(log.c.commit_tx), 0) + 1
+            ).scalar_subquery()
+            return {"commit_tx": after, "position": after}
+        return {
+            "commit_tx": cast(cast(func.pg_current_xact_id(), Text), BigInteger),
+            "position": position_seq.next_value(),
+        }
+
+    def settled_commits(self, commit_tx: ColumnElement[Any]) -> ColumnElement[bool]:
+        """Rows no still-running writer can precede in commit order.
+
+        On Postgres a transaction below the snapshot ``xmin`` has finished, so
+        no row with a smaller ``commit_tx`` can appear later; newer rows wait
+        until every older writer ends. SQLite readers never see a write in
+        flight, so every visible row qualifies.
+        """
+        if self.name == "sqlite":
+            return true()
+        xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+        return commit_tx < cast(cast(xmin, Text), BigInteger)
+
+    def notify_intents(self, queue: str) -> Any | None:
+        """Signal waiting workers that ``queue`` has new intents.
+
+        Postgres delivers a ``NOTIFY`` issued inside the write transaction on
+        COMMIT and drops it on rollback. SQLite has no cross-connection
+        signal, so there is no statement.
+        """
+        if self.name == "sqlite":
+            return None
+        return sa_select(func.pg_notify(INTENT_CHANNEL, queue))
+
     def upsert_head(self, values: dict[str, Any]) -> Insert:
         """Upsert an ``eventic_head`` row, replacing the whole row on conflict."""
         if self.name == "postgresql":
@@ -160,48 +225,196 @@ class Dialect:
             index_elements=["stream", "schema_version"]
         )
 
-    def claim_select(self, queue: str, now: Any, limit: int) -> Any:
-        """The claim SELECT, joined to the log for the aggregate key, with the
-        right locking."""
+    def insert_partitions(self, queue: str, partitions: int) -> Insert:
+        """Rows for every partition of the queue, keeping those that exist."""
+        rows = [{"queue": queue, "partition": n} for n in range(partitions)]
+        if self.name == "postgresql":
+            insert = pg_insert(eventic_partition_table).values(rows)
+            return insert.on_conflict_do_nothing(index_elements=["queue", "partition"])
+        insert = sqlite_insert(eventic_partition_table).values(rows)
+        return insert.on_conflict_do_nothing(index_elements=["queue", "partition"])
+
+    def upsert_drainer(self, queue: str, holder: str, until: Any) -> Insert:
+        """Record ``holder`` as a live drainer of the queue until ``until``."""
+        row = {"queue": queue, "holder": holder, "seen_until": until}
+        keys = ["queue", "holder"]
+        if self.name == "postgresql":
+            insert = pg_insert(eventic_drainer_table).values(row)
+            return insert.on_conflict_do_update(
+                index_elements=keys, set_={"seen_until": insert.excluded.seen_until}
+            )
+        insert = sqlite_insert(eventic_drainer_table).values(row)
+        return insert.on_conflict_do_update(
+            index_elements=keys, set_={"seen_until": insert.excluded.seen_until}
+        )
+
+    def settle_updates(
+        self, settlements: Sequence[Settlement]
+    ) -> tuple[Any, list[dict[str, Any]] | None]:
+        """Retries and deaths as one statement, and its parameter sets.
+
+        Postgres joins one ``UPDATE`` to a ``VALUES`` list; SQLite cannot
+        name ``VALUES`` columns, so it runs one parameterized ``UPDATE`` as
+        an ``executemany``. A death keeps its ``available_at``, and a
+        settlement without ``subscriptions`` the row's; a fenced settlement
+        matches only at its ``attempts``.
+        """
         intent = eventic_intent_table
-        claimable = or_(
-            and_(
-                intent.c.status == "pending",
-                intent.c.available_at <= now,
-            ),
-            and_(
-                intent.c.status == "leased",
-                intent.c.leased_until < now,
-            ),
+        rows = [
+            {
+                "intent_id": s.intent_id,
+                "status": "pending" if s.status == "retry" else "dead",
+                "available_at": s.available_at if s.status == "retry" else None,
+                "last_error": s.error,
+                "attempts": s.attempts,
+                "subscriptions": (
+                    None if s.subscriptions is None else list(s.subscriptions)
+                ),
+            }
+            for s in settlements
+        ]
+        owed = _OWED.with_variant(JSONB(none_as_null=True), "postgresql")
+        if self.name == "postgresql":
+            given = values(
+                column("intent_id", Uuid),
+                column("status", Text),
+                column("available_at", DateTime(timezone=True)),
+                column("last_error", Text),
+                column("attempts", Integer),
+                column("subscriptions", owed),
+                name="settled",
+            ).data([tuple(row.values()) for row in rows])
+            statement = (
+                update(intent)
+                .where(
+                    intent.c.intent_id == given.c.intent_id,
+                    intent.c.attempts
+                    == func.coalesce(
+                        cast(given.c.attempts, Integer), intent.c.attempts
+                    ),
+                )
+                .values(
+                    status=given.c.status,
+                    leased_until=None,
+                    available_at=func.coalesce(
+                        cast(given.c.available_at, DateTime(timezone=True)),
+                        intent.c.available_at,
+                    ),
+                    last_error=cast(given.c.last_error, Text),
+                    subscriptions=func.coalesce(
+                        cast(given.c.subscriptions, owed), intent.c.subscriptions
+                    ),
+                )
+            )
+            return statement, None
+        statement = (
+            update(intent)
+            .where(
+                intent.c.intent_id == bindparam("b_intent_id", type_=Uuid),
+                intent.c.attempts
+                == func.coalesce(
+                    bindparam("b_attempts", type_=Integer), intent.c.attempts
+                ),
+            )
+            .values(
+                status=bindparam("b_status", type_=Text),
+                leased_until=None,
+                available_at=func.coalesce(
+                    bindparam("b_available_at", type_=DateTime(timezone=True)),
+                    intent.c.available_at,
+                ),
+                last_error=bindparam("b_last_error", type_=Text),
+                subscriptions=func.coalesce(
+                    bindparam("b_subscriptions", type_=owed), intent.c.subscriptions
+                ),
+            )
         )
-        select = (
-            sa_select(
-                intent.c.intent_id,
-                intent.c.subscription_id,
-                intent.c.revision_id,
-                intent.c.queue,
-                intent.c.attempts,
-                eventic_revision_table.c.stream,
-                eventic_revision_table.c.aggregate_id,
-                eventic_revision_table.c.revision,
+        return statement, [{f"b_{k}": v for k, v in row.items()} for row in rows]
+
+    def claim_select(
+        self,
+        queue: str,
+        now: Any,
+        limit: int,
+        partitions: Sequence[int] | None = None,
+        of: int = 1,
+    ) -> Any:
+        """The claim SELECT, with the right locking; only ``partitions`` of
+        the queue's ``of`` when given, an intent's stored partition taken
+        modulo ``of`` in case it was staged under another count.
+
+        Due pending intents and expired leases are two branches, each a
+        range scan of its own partial index, limited and locked on its own;
+        their union is ordered by ``available_at``. The intent row carries
+        the aggregate key, so the claim neither joins nor locks the log.
+        """
+        intent = eventic_intent_table
+        branches: list[Any] = []
+        for status, due, order in (
+            ("pending", intent.c.available_at <= now, intent.c.available_at),
+            ("leased", intent.c.leased_until < now, intent.c.leased_until),
+        ):
+            branch = (
+                sa_select(
+                    intent.c.intent_id,
+                    intent.c.subscription_id,
+                    intent.c.revision_id,
+                    intent.c.queue,
+                    intent.c.attempts,
+                    intent.c.stream,
+                    intent.c.aggregate_id,
+                    intent.c.revision,
+                    intent.c.available_at,
+                    intent.c.inline_revision,
+                    intent.c.subscriptions,
+                )
+                .where(
+                    intent.c.queue == queue,
+                    # Inline, not bound: a partial index is only used when
+                    # the query repeats its predicate literally.
+                    intent.c.status == literal(status, literal_execute=True),
+                    due,
+                )
+                .order_by(order)
+                .limit(limit)
             )
-            .join(
-                eventic_revision_table,
-                eventic_revision_table.c.revision_id == intent.c.revision_id,
+            if partitions is not None:
+                branch = branch.where((intent.c.partition % of).in_(partitions))
+            if self.name == "postgresql":
+                branch = branch.with_for_update(skip_locked=True, of=intent)
+            branches.append(sa_select(branch.subquery()))
+        claimable = union_all(*branches).subquery("claimable")
+        return (
+            sa_select(
+                claimable.c.intent_id,
+                claimable.c.subscription_id,
+                claimable.c.revision_id,
+                claimable.c.queue,
+                claimable.c.attempts,
+                claimable.c.inline_revision,
+                claimable.c.subscriptions,
+                claimable.c.stream,
+                claimable.c.aggregate_id,
+                claimable.c.revision,
             )
-            .where(intent.c.queue == queue, claimable)
-            .order_by(intent.c.available_at)
+            .order_by(claimable.c.available_at)
             .limit(limit)
         )
-        if self.name == "postgresql":
-            select = select.with_for_update(skip_locked=True)
-        return select
 
 
 SQLITE_CAPABILITIES = Capabilities(
     outbox=True,
     json_paths=True,
     concurrent_drainers=False,
+    projections=True,
+    change_feed=True,
+    point_in_time=True,
+    wakeups=True,
+    batch_reads=True,
+    pipelined_claims=True,
+    lease_extension=True,
+    partitions=True,
+    grouped_intents=True,
     max_batch=100,
 )
 
@@ -209,5 +422,14 @@ POSTGRES_CAPABILITIES = Capabilities(
     outbox=True,
     json_paths=True,
     concurrent_drainers=True,
+    projections=True,
+    change_feed=True,
+    point_in_time=True,
+    wakeups=True,
+    batch_reads=True,
+    pipelined_claims=True,
+    lease_extension=True,
+    partitions=True,
+    grouped_intents=True,
     max_batch=1000,
 )
@@ -0,0 +1,71 @@
+"""global commit order on the log
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:12:40.118204
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_SEQUENCE = "eventic_revision_position_seq"
+
+
+def upgrade() -> None:
+    postgres = op.get_bind().dialect.name == "postgresql"
+    if postgres:
+        op.execute(sa.schema.CreateSequence(sa.Sequence(_SEQUENCE)))
+    with op.batch_alter_table("eventic_revision") as batch:
+        batch.add_column(sa.Column("commit_tx", sa.BigInteger(), nullable=True))
+        batch.add_column(sa.Column("position", sa.BigInteger(), nullable=True))
+    # Backfill existing rows roughly in commit order, keyed by the latest
+    # committed_at up to each revision of its aggregate: committed_at is the
+    # transaction start on Postgres and need not rise with revision, the
+    # running maximum does, so every aggregate stays in revision order. They
+    # all predate any reader of the feed, so commit_tx is 0 on Postgres
+    # (below every real transaction id); SQLite mirrors position.
+    op.execute(
+        "UPDATE eventic_revision SET position = ordered.n FROM ("
+        "SELECT revision_id, row_number() OVER ("
+        "ORDER BY reached_at, stream, aggregate_id, revision) AS n "
+        "FROM (SELECT revision_id, stream, aggregate_id, revision, "
+        "max(committed_at) OVER ("
+        "PARTITION BY stream, aggregate_id ORDER BY revision) AS reached_at "
+        "FROM eventic_revision) AS clocked) AS ordered "
+        "WHERE eventic_revision.revision_id = ordered.revision_id"
+    )
+    op.execute(
+        "UPDATE eventic_revision SET commit_tx = " + ("0" if postgres else "position")
+    )
+    if postgres:
+        op.execute(
+            f"SELECT setval('{_SEQUENCE}', "
+            "(SELECT coalesce(max(position), 0) + 1 FROM eventic_revision), false)"
+        )
+    with op.batch_alter_table("eventic_revision") as batch:
+        batch.alter_column("commit_tx", existing_type=sa.BigInteger(), nullable=False)
+        batch.alter_column("position", existing_type=sa.BigInteger(), nullable=False)
+    op.create_index(
+        "ix_revision_commit_order",
+        "eventic_revision",
+        ["commit_tx", "position"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revision_commit_order", table_name="eventic_revision")
+    with op.batch_alter_table("eventic_revision") as batch:
+        batch.drop_column("position")
+        batch.drop_column("commit_tx")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(sa.schema.DropSequence(sa.Sequence(_SEQUENCE)))
@@ -0,0 +1,30 @@
+"""index the log by committed_at per aggregate
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 11:02:17.530911
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_revision_sac",
+        "eventic_revision",
+        ["stream", "aggregate_id", "committed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revision_sac", table_name="eventic_revision")
@@ -0,0 +1,39 @@
+"""record each revision's changed keys on the log
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 14:26:51.904417
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL: readers diff them against their predecessor.
+    with op.batch_alter_table("eventic_revision") as batch:
+        batch.add_column(
+            sa.Column(
+                "changed",
+                sa.JSON().with_variant(
+                    postgresql.JSONB(astext_type=Text()), "postgresql"
+                ),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("eventic_revision") as batch:
+        batch.drop_column("changed")
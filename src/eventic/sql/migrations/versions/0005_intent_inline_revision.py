@@ -0,0 +1,38 @@
+"""carry the revision in inline-payload intents
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 15:48:09.215734
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        batch.add_column(
+            sa.Column(
+                "inline_revision",
+                sa.JSON().with_variant(
+                    postgresql.JSONB(astext_type=Text()), "postgresql"
+                ),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        batch.drop_column("inline_revision")
@@ -0,0 +1,47 @@
+"""partition intents and lease partitions to workers
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 18:02:41.530117
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        batch.add_column(
+            sa.Column("partition", sa.Integer(), server_default="0", nullable=False)
+        )
+    op.create_table(
+        "eventic_partition",
+        sa.Column("queue", sa.Text(), nullable=False),
+        sa.Column("partition", sa.Integer(), nullable=False),
+        sa.Column("holder", sa.Text(), nullable=True),
+        sa.Column("leased_until", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("queue", "partition"),
+    )
+    op.create_table(
+        "eventic_drainer",
+        sa.Column("queue", sa.Text(), nullable=False),
+        sa.Column("holder", sa.Text(), nullable=False),
+        sa.Column("seen_until", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("queue", "holder"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("eventic_drainer")
+    op.drop_table("eventic_partition")
+    with op.batch_alter_table("eventic_intent") as batch:
+        batch.drop_column("partition")
@@ -0,0 +1,38 @@
+"""owe one intent row to several subscriptions
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 20:14:52.361208
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        batch.add_column(
+            sa.Column(
+                "subscriptions",
+                sa.JSON().with_variant(
+                    postgresql.JSONB(astext_type=Text()), "postgresql"
+                ),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        batch.drop_column("subscriptions")
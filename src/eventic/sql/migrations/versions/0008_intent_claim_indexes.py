@@ -0,0 +1,49 @@
+"""index only claimable intents, by status
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 21:37:05.118402
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_intent_pending",
+        "eventic_intent",
+        ["queue", "available_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_intent_leased",
+        "eventic_intent",
+        ["queue", "leased_until"],
+        unique=False,
+        postgresql_where=sa.text("status = 'leased'"),
+        sqlite_where=sa.text("status = 'leased'"),
+    )
+    op.drop_index("ix_intent_drain", table_name="eventic_intent")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_intent_drain",
+        "eventic_intent",
+        ["queue", "status", "available_at"],
+        unique=False,
+    )
+    op.drop_index("ix_intent_leased", table_name="eventic_intent")
+    op.drop_index("ix_intent_pending", table_name="eventic_intent")
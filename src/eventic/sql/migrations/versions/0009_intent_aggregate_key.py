@@ -0,0 +1,48 @@
+"""copy the aggregate key onto intent rows
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 23:05:41.118230
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_KEY = (
+    ("stream", sa.Text()),
+    ("aggregate_id", sa.Uuid()),
+    ("revision", sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        for name, type_ in _KEY:
+            batch.add_column(sa.Column(name, type_, nullable=True))
+    for name, _type in _KEY:
+        op.execute(
+            f"UPDATE eventic_intent SET {name} = (SELECT r.{name} "
+            "FROM eventic_revision AS r "
+            "WHERE r.revision_id = eventic_intent.revision_id)"
+        )
+    # An intent without its log row was never claimable: the claim joined
+    # the log to find the aggregate key.
+    op.execute("DELETE FROM eventic_intent WHERE stream IS NULL")
+    with op.batch_alter_table("eventic_intent") as batch:
+        for name, type_ in _KEY:
+            batch.alter_column(name, existing_type=type_, nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("eventic_intent") as batch:
+        for name, _type in reversed(_KEY):
+            batch.drop_column(name)
@@ -8,24 +8,46 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from typing import Any
-from uuid import UUID
-
-from sqlalchemy import delete, select, tuple_, update
+from uuid import UUID, uuid5
+
+from sqlalchemy import (
+    Select,
+    Text,
+    Uuid,
+    and_,
+    delete,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 
+from eventic.errors import UsageError
+from eventic.ids import NS
 from eventic.sql.dialect import Dialect
+from eventic.sql.tables import (
+    eventic_drainer as drainers,
+)
 from eventic.sql.tables import (
     eventic_head as heads,
 )
 from eventic.sql.tables import (
     eventic_intent as intents,
 )
+from eventic.sql.tables import (
+    eventic_partition as partition_leases,
+)
 from eventic.sql.tables import (
     eventic_revision as revisions,
 )
 from eventic.sql.tables import (
     eventic_schema as schema,
 )
-from eventic.wire import Settlement
+from eventic.sql.tables import json_type
+from eventic.wire import ClaimedIntent, Settlement
 
 
 def select_head(stream: str, aggregate_id: UUID, *, for_update: bool) -> Any:
@@ -60,6 +82,75 @@ def select_window(stream: str, aggregate_id: UUID, start: int, end: int) -> Any:
     )
 
 
+def select_windows(stream: str, spans: Sequence[tuple[UUID, int, int]]) -> Any:
+    """Several inclusive log ranges of one stream in one query, in
+    ``(aggregate_id, revision)`` order. ``spans`` are ``(id, start, end)``."""
+    return (
+        select(revisions)
+        .where(
+            revisions.c.stream == stream,
+            or_(
+                *(
+                    and_(
+                        revisions.c.aggregate_id == aggregate_id,
+                        revisions.c.revision >= start,
+                        revisions.c.revision <= end,
+                    )
+                    for aggregate_id, start, end in spans
+                )
+            ),
+        )
+        .order_by(revisions.c.aggregate_id, revisions.c.revision)
+    )
+
+
+def select_revision_at(stream: str, aggregate_id: UUID, as_of: Any) -> Any:
+    """The last log row committed at or before ``as_of`` (index-ordered)."""
+    return (
+        select(revisions)
+        .where(
+            revisions.c.stream == stream,
+            revisions.c.aggregate_id == aggregate_id,
+            revisions.c.committed_at <= as_of,
+        )
+        .order_by(revisions.c.committed_at.desc(), revisions.c.revision.desc())
+        .limit(1)
+    )
+
+
+def select_revisions_at(
+    stream: str, as_of: Any, *, cursor: UUID | None, limit: int
+) -> Any:
+    """Per aggregate, in id order, the last log row committed by ``as_of``."""
+    latest = select(
+        revisions.c.aggregate_id,
+        func.max(revisions.c.revision).label("revision"),
+    ).where(
+        revisions.c.stream == stream,
+        revisions.c.committed_at <= as_of,
+    )
+    if cursor is not None:
+        latest = latest.where(revisions.c.aggregate_id > cursor)
+    picked = (
+        latest.group_by(revisions.c.aggregate_id)
+        .order_by(revisions.c.aggregate_id)
+        .limit(limit)
+        .subquery()
+    )
+    return (
+        select(revisions)
+        .join(
+            picked,
+            and_(
+                revisions.c.aggregate_id == picked.c.aggregate_id,
+                revisions.c.revision == picked.c.revision,
+            ),
+        )
+        .where(revisions.c.stream == stream)
+        .order_by(revisions.c.aggregate_id)
+    )
+
+
 def select_history(stream: str, aggregate_id: UUID, *, since: int, limit: int) -> Any:
     return (
         select(revisions)
@@ -86,7 +177,7 @@ def select_latest_revision(stream: str, aggregate_id: UUID) -> Any:
 
 
 def insert_revision(dialect: Dialect, values: dict[str, Any]) -> Any:
-    return revisions.insert().values(**values)
+    return revisions.insert().values(**values, **dialect.commit_order())
 
 
 def upsert_head(dialect: Dialect, values: dict[str, Any]) -> Any:
@@ -114,38 +205,178 @@ def claim_mark_leased(
     )
 
 
-def settle_intents(dialect: Dialect, settlements: Sequence[Settlement]) -> list[Any]:
-    """One statement per settlement: delete on delivery, update otherwise."""
-    statements: list[Any] = []
-    for settlement in settlements:
-        if settlement.status == "delivered":
-            statements.append(
-                delete(intents).where(intents.c.intent_id == settlement.intent_id)
-            )
-        elif settlement.status == "retry":
-            statements.append(
-                update(intents)
-                .where(intents.c.intent_id == settlement.intent_id)
-                .values(
-                    status="pending",
-                    leased_until=None,
-                    available_at=settlement.available_at,
-                    last_error=settlement.error,
-                )
-            )
-        else:  # dead
-            statements.append(
-                update(intents)
-                .where(intents.c.intent_id == settlement.intent_id)
-                .values(
-                    status="dead",
-                    leased_until=None,
-                    last_error=settlement.error,
-                )
-            )
+def settle_intents(
+    dialect: Dialect, settlements: Sequence[Settlement]
+) -> list[tuple[Any, list[dict[str, Any]] | None]]:
+    """The statements, with their parameter sets: one ``DELETE`` for every
+    delivery, one ``UPDATE`` for every retry and death, then two per split
+    after the retry that keeps the rest of its intent."""
+    statements: list[tuple[Any, list[dict[str, Any]] | None]] = []
+    delivered = [s for s in settlements if s.status == "delivered"]
+    if delivered:
+        statements.append((delete(intents).where(_fenced(delivered)), None))
+    failed = [s for s in settlements if s.status != "delivered" and not s.split]
+    if failed:
+        statements.append(dialect.settle_updates(failed))
+    kept = {s.intent_id: s.subscriptions for s in failed if s.status == "retry"}
+    for split in (s for s in settlements if s.split):
+        dead, rest = split.subscriptions, kept.get(split.intent_id)
+        if split.status != "dead" or not dead or not rest:
+            raise UsageError("a split is a death beside a retry of its intent")
+        statements.extend(_split(split, dead, rest))
     return statements
 
 
+def _split(
+    settlement: Settlement, dead: tuple[str, ...], rest: Sequence[str]
+) -> list[tuple[Any, list[dict[str, Any]] | None]]:
+    """A dead copy of the intent owing ``dead``.
+
+    Each row is named for a subscription it owes, unique per revision, so
+    the intent gives up a name that goes with the dead ones first.
+    """
+    source = intents.c.intent_id == settlement.intent_id
+    if settlement.attempts is not None:
+        source = and_(source, intents.c.attempts == settlement.attempts)
+    rename = (
+        update(intents)
+        .where(source, intents.c.subscription_id.in_(dead))
+        .values(subscription_id=rest[0])
+    )
+    copy: Select[Any] = select(
+        literal(
+            uuid5(NS, f"split:{settlement.intent_id}:{','.join(dead)}"),
+            type_=Uuid(),
+        ),
+        literal(dead[0], type_=Text()),
+        intents.c.revision_id,
+        intents.c.stream,
+        intents.c.aggregate_id,
+        intents.c.revision,
+        intents.c.queue,
+        literal("dead", type_=Text()),
+        intents.c.attempts,
+        intents.c.available_at,
+        null(),
+        literal(settlement.error, type_=Text()),
+        intents.c.created_at,
+        intents.c.inline_revision,
+        intents.c.partition,
+        literal(list(dead), type_=json_type),
+    ).where(source)
+    columns = [
+        "intent_id",
+        "subscription_id",
+        "revision_id",
+        "stream",
+        "aggregate_id",
+        "revision",
+        "queue",
+        "status",
+        "attempts",
+        "available_at",
+        "leased_until",
+        "last_error",
+        "created_at",
+        "inline_revision",
+        "partition",
+        "subscriptions",
+    ]
+    return [(rename, None), (intents.insert().from_select(columns, copy), None)]
+
+
+def _fenced(settlements: Sequence[Settlement]) -> Any:
+    """The settled intents, each at its claim's attempt when it has one."""
+    unfenced = [s.intent_id for s in settlements if s.attempts is None]
+    fenced = [(s.intent_id, s.attempts) for s in settlements if s.attempts is not None]
+    clauses: list[Any] = []
+    if unfenced:
+        clauses.append(intents.c.intent_id.in_(unfenced))
+    if fenced:
+        clauses.append(tuple_(intents.c.intent_id, intents.c.attempts).in_(fenced))
+    return or_(*clauses)
+
+
+def extend_leases(claimed: Sequence[ClaimedIntent], until: Any) -> Any:
+    """Push out the leases still held at each claim's attempt."""
+    return (
+        update(intents)
+        .where(
+            intents.c.status == "leased",
+            tuple_(intents.c.intent_id, intents.c.attempts).in_(
+                [(c.intent_id, c.attempts) for c in claimed]
+            ),
+        )
+        .values(leased_until=until)
+        .returning(intents.c.intent_id)
+    )
+
+
+def select_partitions(queue: str, partitions: int) -> Any:
+    """The queue's partition leases, locked for one holder's turn."""
+    return (
+        select(
+            partition_leases.c.partition,
+            partition_leases.c.holder,
+            partition_leases.c.leased_until,
+        )
+        .where(
+            partition_leases.c.queue == queue,
+            partition_leases.c.partition < partitions,
+        )
+        .order_by(partition_leases.c.partition)
+        .with_for_update()
+    )
+
+
+def lease_partitions(
+    queue: str, partitions: Sequence[int], holder: str | None, until: Any
+) -> Any:
+    """Hand ``partitions`` to ``holder`` until ``until``; ``None`` frees them."""
+    return (
+        update(partition_leases)
+        .where(
+            partition_leases.c.queue == queue,
+            partition_leases.c.partition.in_(partitions),
+        )
+        .values(holder=holder, leased_until=until)
+    )
+
+
+def release_partitions(queue: str, holder: str) -> Any:
+    return (
+        update(partition_leases)
+        .where(partition_leases.c.queue == queue, partition_leases.c.holder == holder)
+        .values(holder=None, leased_until=None)
+    )
+
+
+def renew_partitions(queue: str, holder: str, until: Any) -> Any:
+    """Push out the holder's partition leases, returning the partitions."""
+    return (
+        update(partition_leases)
+        .where(partition_leases.c.queue == queue, partition_leases.c.holder == holder)
+        .values(leased_until=until)
+        .returning(partition_leases.c.partition)
+    )
+
+
+def live_drainers(queue: str) -> Any:
+    return select(drainers.c.holder).where(drainers.c.queue == queue)
+
+
+def expire_drainers(queue: str, now: Any) -> Any:
+    return delete(drainers).where(
+        drainers.c.queue == queue, drainers.c.seen_until <= now
+    )
+
+
+def remove_drainer(queue: str, holder: str) -> Any:
+    return delete(drainers).where(
+        drainers.c.queue == queue, drainers.c.holder == holder
+    )
+
+
 def search_heads(
     dialect: Dialect,
     stream: str,
@@ -154,7 +385,13 @@ def search_heads(
     cursor: Any,
     limit: int,
 ) -> Any:
-    stmt = select(heads).where(heads.c.stream == stream)
+    return _search(dialect, select(heads), stream, filters, cursor, limit)
+
+
+def _search(
+    dialect: Dialect, stmt: Any, stream: str, filters: Any, cursor: Any, limit: int
+) -> Any:
+    stmt = stmt.where(heads.c.stream == stream)
     for path, value in filters.items():
         stmt = stmt.where(dialect.path_equals(heads.c.state, path, value))
     if cursor is not None:
@@ -162,6 +399,90 @@ def search_heads(
     return stmt.order_by(heads.c.aggregate_id).limit(limit)
 
 
+def _projected(dialect: Dialect, fields: Sequence[str]) -> Any:
+    """Head identity columns plus one JSON-text column ``f{i}`` per path."""
+    return select(
+        heads.c.stream,
+        heads.c.aggregate_id,
+        heads.c.revision,
+        heads.c.revision_id,
+        heads.c.schema_version,
+        heads.c.digest,
+        heads.c.committed_at,
+        *(
+            dialect.path_json(heads.c.state, path).label(f"f{index}")
+            for index, path in enumerate(fields)
+        ),
+    )
+
+
+def select_head_fields(
+    dialect: Dialect, stream: str, aggregate_id: UUID, fields: Sequence[str]
+) -> Any:
+    return _projected(dialect, fields).where(
+        heads.c.stream == stream,
+        heads.c.aggregate_id == aggregate_id,
+    )
+
+
+def search_head_fields(
+    dialect: Dialect,
+    stream: str,
+    filters: Any,
+    *,
+    fields: Sequence[str],
+    cursor: Any,
+    limit: int,
+) -> Any:
+    return _search(dialect, _projected(dialect, fields), stream, filters, cursor, limit)
+
+
+def select_head_refs(stream: str, ids: Sequence[UUID]) -> Any:
+    return select(heads.c.aggregate_id, heads.c.revision, heads.c.digest).where(
+        heads.c.stream == stream,
+        heads.c.aggregate_id.in_(ids),
+    )
+
+
+def search_head_refs(
+    dialect: Dialect,
+    stream: str,
+    filters: Any,
+    *,
+    cursor: Any,
+    limit: int,
+) -> Any:
+    stmt = select(heads.c.aggregate_id, heads.c.revision, heads.c.digest)
+    return _search(dialect, stmt, stream, filters, cursor, limit)
+
+
+def select_changes(
+    dialect: Dialect,
+    *,
+    after: tuple[int, int] | None,
+    streams: Sequence[str],
+    limit: int,
+) -> Any:
+    """The next log rows in global commit order, settled commits only."""
+    stmt = select(
+        revisions.c.commit_tx,
+        revisions.c.position,
+        revisions.c.stream,
+        revisions.c.aggregate_id,
+        revisions.c.revision,
+        revisions.c.revision_id,
+        revisions.c.kind,
+        revisions.c.digest,
+        revisions.c.committed_at,
+        revisions.c.changed,
+    ).where(dialect.settled_commits(revisions.c.commit_tx))
+    if after is not None:
+        stmt = stmt.where(tuple_(revisions.c.commit_tx, revisions.c.position) > after)
+    if streams:
+        stmt = stmt.where(revisions.c.stream.in_(streams))
+    return stmt.order_by(revisions.c.commit_tx, revisions.c.position).limit(limit)
+
+
 def upsert_fingerprint(dialect: Dialect, values: dict[str, Any]) -> Any:
     return dialect.upsert_fingerprint(values)
 
@@ -13,7 +13,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 from uuid import UUID, uuid5
 
-from sqlalchemy import create_engine, func, select
+from sqlalchemy import create_engine, func, null, select
 from sqlalchemy import event as sa_event
 from sqlalchemy.engine import Connection, RowMapping
 from sqlalchemy.exc import IntegrityError
@@ -31,18 +31,38 @@ from eventic.errors import (
 )
 from eventic.ids import AggregateKey, revision_id
 from eventic.jsonx import JsonObject, JsonValue, canonical_bytes
-from eventic.protocols import Capabilities, Store, StoreAdmin
+from eventic.paths import matches
+from eventic.protocols import (
+    BatchReads,
+    Capabilities,
+    ChangeFeed,
+    LeaseExtension,
+    PartitionedClaims,
+    PipelinedClaims,
+    PointInTimeReads,
+    ProjectionReads,
+    Store,
+    StoreAdmin,
+    Wakeups,
+)
 from eventic.sql import statements as st
 from eventic.sql.dialect import POSTGRES_CAPABILITIES, SQLITE_CAPABILITIES, Dialect
+from eventic.sql.wakeups import LocalSignals, PgListener
 from eventic.wire import (
     ClaimedIntent,
     CommitRequest,
     CommitResult,
+    HeadRef,
     IntentRequest,
     Settlement,
+    StoredChange,
+    StoredProjection,
     StoredRevision,
 )
 
+_IN_CHUNK = 500  # ids per IN (...) list
+_WINDOW_CHUNK = 200  # log ranges per OR in a multi-window read
+
 
 def _parse_db_datetime(value: Any) -> datetime:
     """Normalize a database clock reading to tz-aware UTC."""
@@ -115,7 +135,17 @@ class _SerializedStaticPool(StaticPool):
             self._op_lock.release()
 
 
-class SQLite(Store):
+class SQLite(
+    Store,
+    ProjectionReads,
+    ChangeFeed,
+    PointInTimeReads,
+    BatchReads,
+    Wakeups,
+    PipelinedClaims,
+    LeaseExtension,
+    PartitionedClaims,
+):
     """The development/testing/single-process backend.
 
     ``SQLite(":memory:")`` or a path. ``encodings`` maps stream names to an
@@ -133,6 +163,7 @@ class SQLite(Store):
             url_or_path = f"sqlite:///{url_or_path}"
         self.dialect = Dialect(name="sqlite", capabilities=SQLITE_CAPABILITIES)
         self._encodings = dict(encodings or {})
+        self._signals = LocalSignals()
         if ":memory:" in url_or_path:
             self.engine = create_engine(
                 url_or_path,
@@ -192,6 +223,11 @@ class SQLite(Store):
             with self.engine.begin() as conn:
                 now = _now(conn)
                 results = [self._commit_one(conn, request, now) for request in requests]
+                queues = _staged_queues(requests, results)
+                for queue in queues:
+                    notify = self.dialect.notify_intents(queue)
+                    if notify is not None:
+                        conn.execute(notify)
         except EventicError:
             raise
         except IntegrityError as exc:
@@ -208,8 +244,17 @@ class SQLite(Store):
             ) from exc
         except Exception as exc:  # noqa: BLE001
             raise StoreError("commit failed") from exc
+        self._committed(queues)
         return results
 
+    def _committed(self, queues: Sequence[str]) -> None:
+        """Wake co-located workers once the intents are durable."""
+        self._signals.signal(queues)
+
+    def wait_for_intents(self, queue: str, *, timeout: timedelta) -> bool:
+        """Signals commits made through this store object only."""
+        return self._signals.wait(queue, timeout)
+
     def _commit_one(
         self, conn: Connection, request: CommitRequest, now: datetime
     ) -> CommitResult:
@@ -305,6 +350,9 @@ class SQLite(Store):
                     "digest": request.digest,
                     "meta": _json_loads(request.meta),
                     "committed_at": now,
+                    "changed": (
+                        list(request.changed) if request.changed is not None else null()
+                    ),
                 },
             )
         )
@@ -338,6 +386,11 @@ class SQLite(Store):
             )
         )
 
+        inline = (
+            _inline_revision(request, now)
+            if any(intent.inline_payload for intent in request.intents)
+            else None
+        )
         for intent in request.intents:
             conn.execute(
                 st.insert_intents(
@@ -347,6 +400,9 @@ class SQLite(Store):
                             "intent_id": _intent_id(intent),
                             "subscription_id": intent.subscription_id,
                             "revision_id": intent.revision_id,
+                            "stream": request.stream,
+                            "aggregate_id": request.aggregate_id,
+                            "revision": target,
                             "queue": intent.queue,
                             "status": "pending",
                             "attempts": 0,
@@ -354,6 +410,15 @@ class SQLite(Store):
                             "leased_until": None,
                             "last_error": None,
                             "created_at": now,
+                            "inline_revision": (
+                                inline if intent.inline_payload else null()
+                            ),
+                            "partition": intent.partition,
+                            "subscriptions": (
+                                list(intent.subscriptions)
+                                if intent.subscriptions
+                                else null()
+                            ),
                         }
                     ],
                 )
@@ -483,6 +548,47 @@ class SQLite(Store):
             raise StoreError("revision read failed") from exc
         return self._log_row_to_stored(row, payload)
 
+    def revisions(
+        self, keys: Sequence[tuple[AggregateKey, int]]
+    ) -> Sequence[StoredRevision]:
+        wanted: dict[str, dict[UUID, set[int]]] = {}
+        for key, revision in keys:
+            if revision < 0:
+                raise UsageError("revision must be >= 0")
+            wanted.setdefault(key.stream, {}).setdefault(key.aggregate_id, set()).add(
+                revision
+            )
+        found: list[StoredRevision] = []
+        try:
+            with self.engine.connect() as conn:
+                for stream, by_aggregate in wanted.items():
+                    spans = [
+                        (aggregate_id, start, end)
+                        for aggregate_id, numbers in by_aggregate.items()
+                        for start, end in _runs(numbers)
+                    ]
+                    rows: list[RowMapping] = []
+                    for start in range(0, len(spans), _WINDOW_CHUNK):
+                        rows.extend(
+                            conn.execute(
+                                st.select_windows(
+                                    stream, spans[start : start + _WINDOW_CHUNK]
+                                )
+                            )
+                            .mappings()
+                            .all()
+                        )
+                    docs = self._decode_rows(conn, stream, rows)
+                    found.extend(
+                        self._log_row_to_stored(row, doc)
+                        for row, doc in zip(rows, docs, strict=True)
+                    )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("revision read failed") from exc
+        return found
+
     def history(self, key: AggregateKey, *, after: int, limit: int) -> Any:
         if limit < 1:
             raise UsageError("limit must be >= 1")
@@ -548,6 +654,230 @@ class SQLite(Store):
         cursor_out = str(rows[-1]["aggregate_id"]) if len(rows) == limit else None
         return Page[StoredRevision](items=items, cursor=cursor_out)
 
+    def head_fields(
+        self, key: AggregateKey, fields: Sequence[str]
+    ) -> StoredProjection | None:
+        try:
+            with self.engine.connect() as conn:
+                row = (
+                    conn.execute(
+                        st.select_head_fields(
+                            self.dialect, key.stream, key.aggregate_id, fields
+                        )
+                    )
+                    .mappings()
+                    .first()
+                )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("head read failed") from exc
+        if row is None:
+            return None
+        return _projection_row_to_stored(row, fields)
+
+    def search_fields(
+        self,
+        stream: str,
+        filters: Mapping[str, JsonValue],
+        *,
+        fields: Sequence[str],
+        cursor: str | None,
+        limit: int,
+    ) -> Any:
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        cursor_uuid = UUID(cursor) if cursor is not None else None
+        try:
+            with self.engine.connect() as conn:
+                rows = (
+                    conn.execute(
+                        st.search_head_fields(
+                            self.dialect,
+                            stream,
+                            dict(filters),
+                            fields=fields,
+                            cursor=cursor_uuid,
+                            limit=limit,
+                        )
+                    )
+                    .mappings()
+                    .all()
+                )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("search failed") from exc
+        from eventic.envelopes import Page
+
+        items = tuple(_projection_row_to_stored(row, fields) for row in rows)
+        cursor_out = str(rows[-1]["aggregate_id"]) if len(rows) == limit else None
+        return Page[StoredProjection](items=items, cursor=cursor_out)
+
+    def head_refs(self, stream: str, ids: Sequence[UUID]) -> Sequence[HeadRef]:
+        unique = list(dict.fromkeys(ids))
+        rows: list[RowMapping] = []
+        try:
+            with self.engine.connect() as conn:
+                # Chunked to stay under the driver's bound-parameter limit.
+                for start in range(0, len(unique), _IN_CHUNK):
+                    chunk = unique[start : start + _IN_CHUNK]
+                    rows.extend(
+                        conn.execute(st.select_head_refs(stream, chunk))
+                        .mappings()
+                        .all()
+                    )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("head read failed") from exc
+        return [_ref(row) for row in rows]
+
+    def search_refs(
+        self,
+        stream: str,
+        filters: Mapping[str, JsonValue],
+        *,
+        cursor: str | None,
+        limit: int,
+    ) -> Any:
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        cursor_uuid = UUID(cursor) if cursor is not None else None
+        try:
+            with self.engine.connect() as conn:
+                rows = (
+                    conn.execute(
+                        st.search_head_refs(
+                            self.dialect,
+                            stream,
+                            dict(filters),
+                            cursor=cursor_uuid,
+                            limit=limit,
+                        )
+                    )
+                    .mappings()
+                    .all()
+                )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("search failed") from exc
+        from eventic.envelopes import Page
+
+        cursor_out = str(rows[-1]["aggregate_id"]) if len(rows) == limit else None
+        return Page[HeadRef](items=tuple(_ref(row) for row in rows), cursor=cursor_out)
+
+    def changes(self, after: str | None, *, streams: Sequence[str], limit: int) -> Any:
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        start = _parse_position(after) if after is not None else None
+        try:
+            with self.engine.connect() as conn:
+                rows = (
+                    conn.execute(
+                        st.select_changes(
+                            self.dialect,
+                            after=start,
+                            streams=list(streams),
+                            limit=limit,
+                        )
+                    )
+                    .mappings()
+                    .all()
+                )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("changes read failed") from exc
+        from eventic.envelopes import Page
+
+        items = tuple(
+            StoredChange(
+                position=f"{row['commit_tx']}:{row['position']}",
+                stream=row["stream"],
+                aggregate_id=row["aggregate_id"],
+                revision=row["revision"],
+                revision_id=row["revision_id"],
+                kind=row["kind"],
+                digest=row["digest"],
+                committed_at=_parse_db_datetime(row["committed_at"]),
+                changed=_changed_keys(row["changed"]),
+            )
+            for row in rows
+        )
+        cursor = items[-1].position if len(items) == limit else None
+        return Page[StoredChange](items=items, cursor=cursor)
+
+    def revision_at(self, key: AggregateKey, as_of: datetime) -> StoredRevision | None:
+        moment = _utc_moment(as_of)
+        try:
+            with self.engine.connect() as conn:
+                row = (
+                    conn.execute(
+                        st.select_revision_at(key.stream, key.aggregate_id, moment)
+                    )
+                    .mappings()
+                    .first()
+                )
+                if row is None:
+                    return None
+                payload = self._decode_rows(conn, key.stream, [row])[0]
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("revision read failed") from exc
+        return self._log_row_to_stored(row, payload)
+
+    def search_at(
+        self,
+        stream: str,
+        filters: Mapping[str, JsonValue],
+        *,
+        as_of: datetime,
+        cursor: str | None,
+        limit: int,
+    ) -> Any:
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        moment = _utc_moment(as_of)
+        scan = UUID(cursor) if cursor is not None else None
+        # Historical documents exist only after decoding, so filters apply
+        # in Python; scan candidates in id order until the page fills.
+        chunk = max(limit, 100)
+        items: list[StoredRevision] = []
+        cursor_out: str | None = None
+        try:
+            with self.engine.connect() as conn:
+                while cursor_out is None:
+                    rows = (
+                        conn.execute(
+                            st.select_revisions_at(
+                                stream, moment, cursor=scan, limit=chunk
+                            )
+                        )
+                        .mappings()
+                        .all()
+                    )
+                    docs = self._decode_rows(conn, stream, rows)
+                    for row, doc in zip(rows, docs, strict=True):
+                        if not matches(doc, filters):
+                            continue
+                        items.append(self._log_row_to_stored(row, doc))
+                        if len(items) == limit:
+                            cursor_out = str(row["aggregate_id"])
+                            break
+                    if len(rows) < chunk:
+                        break
+                    scan = rows[-1]["aggregate_id"]
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("search failed") from exc
+        from eventic.envelopes import Page
+
+        return Page[StoredRevision](items=tuple(items), cursor=cursor_out)
+
     # -- delivery -----------------------------------------------------------
 
     def claim(
@@ -557,27 +887,176 @@ class SQLite(Store):
             raise UsageError("limit must be >= 1")
         try:
             with self.engine.begin() as conn:
-                # Lease checks are wall-clock delivery semantics; SQLite's
-                # CURRENT_TIMESTAMP is second-precision and would stall
-                # sub-second leases. committed_at is still the DB clock.
-                now = datetime.now(UTC)
+                return self._claim(conn, queue, limit=limit, lease=lease)
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("claim failed") from exc
+
+    def settle(self, settlements: Sequence[Settlement]) -> None:
+        try:
+            with self.engine.begin() as conn:
+                self._settle(conn, settlements)
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("settle failed") from exc
+
+    def settle_and_claim(
+        self,
+        settlements: Sequence[Settlement],
+        queue: str,
+        *,
+        limit: int,
+        lease: timedelta,
+    ) -> Sequence[ClaimedIntent]:
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        try:
+            with self.engine.begin() as conn:
+                self._settle(conn, settlements)
+                return self._claim(conn, queue, limit=limit, lease=lease)
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("settle and claim failed") from exc
+
+    def extend(
+        self, claimed: Sequence[ClaimedIntent], *, lease: timedelta
+    ) -> Sequence[UUID]:
+        if not claimed:
+            return []
+        try:
+            with self.engine.begin() as conn:
+                until = datetime.now(UTC) + lease  # the claim's clock
+                return list(
+                    conn.execute(st.extend_leases(claimed, until)).scalars().all()
+                )
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("lease extension failed") from exc
+
+    def acquire_partitions(
+        self, queue: str, *, partitions: int, holder: str, lease: timedelta
+    ) -> Sequence[int]:
+        if partitions < 1:
+            raise UsageError("partitions must be >= 1")
+        try:
+            with self.engine.begin() as conn:
+                now = datetime.now(UTC)  # the claim's clock
+                conn.execute(self.dialect.insert_partitions(queue, partitions))
+                # Locking the partition rows serializes turns on the queue.
                 rows = (
-                    conn.execute(self.dialect.claim_select(queue, now, limit))
+                    conn.execute(st.select_partitions(queue, partitions))
                     .mappings()
                     .all()
                 )
-                if rows:
-                    conn.execute(
-                        st.claim_mark_leased(
-                            self.dialect,
-                            [row["intent_id"] for row in rows],
-                            now + lease,
-                        )
+                conn.execute(st.expire_drainers(queue, now))
+                conn.execute(self.dialect.upsert_drainer(queue, holder, now + lease))
+                live = conn.execute(st.live_drainers(queue)).scalars().all()
+                share = -(-partitions // len(live))
+                mine = [row["partition"] for row in rows if row["holder"] == holder]
+                free = [
+                    row["partition"]
+                    for row in rows
+                    if row["holder"] is None
+                    or (
+                        row["holder"] != holder
+                        and _parse_db_datetime(row["leased_until"]) <= now
                     )
+                ]
+                kept = mine[:share]
+                held = sorted(kept + free[: share - len(kept)])
+                if mine[share:]:
+                    conn.execute(st.lease_partitions(queue, mine[share:], None, None))
+                if held:
+                    conn.execute(st.lease_partitions(queue, held, holder, now + lease))
+                return held
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("partition lease failed") from exc
+
+    def release_partitions(self, queue: str, *, holder: str) -> None:
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(st.release_partitions(queue, holder))
+                conn.execute(st.remove_drainer(queue, holder))
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("partition release failed") from exc
+
+    def renew_partitions(
+        self, queue: str, *, holder: str, lease: timedelta
+    ) -> Sequence[int]:
+        try:
+            with self.engine.begin() as conn:
+                until = datetime.now(UTC) + lease  # the claim's clock
+                conn.execute(self.dialect.upsert_drainer(queue, holder, until))
+                renewed = conn.execute(st.renew_partitions(queue, holder, until))
+                return sorted(renewed.scalars().all())
+        except EventicError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise StoreError("partition renewal failed") from exc
+
+    def claim_partitions(
+        self,
+        queue: str,
+        partitions: Sequence[int],
+        *,
+        of: int,
+        limit: int,
+        lease: timedelta,
+    ) -> Sequence[ClaimedIntent]:
+        if limit < 1:
+            raise UsageError("limit must be >= 1")
+        if of < 1:
+            raise UsageError("of must be >= 1")
+        if not partitions:
+            return []
+        try:
+            with self.engine.begin() as conn:
+                return self._claim(
+                    conn,
+                    queue,
+                    limit=limit,
+                    lease=lease,
+                    partitions=partitions,
+                    of=of,
+                )
         except EventicError:
             raise
         except Exception as exc:  # noqa: BLE001
             raise StoreError("claim failed") from exc
+
+    def _claim(
+        self,
+        conn: Connection,
+        queue: str,
+        *,
+        limit: int,
+        lease: timedelta,
+        partitions: Sequence[int] | None = None,
+        of: int = 1,
+    ) -> list[ClaimedIntent]:
+        # Lease checks are wall-clock delivery semantics; SQLite's
+        # CURRENT_TIMESTAMP is second-precision and would stall sub-second
+        # leases. committed_at is still the DB clock.
+        now = datetime.now(UTC)
+        rows = (
+            conn.execute(self.dialect.claim_select(queue, now, limit, partitions, of))
+            .mappings()
+            .all()
+        )
+        if rows:
+            conn.execute(
+                st.claim_mark_leased(
+                    self.dialect, [row["intent_id"] for row in rows], now + lease
+                )
+            )
         return [
             ClaimedIntent(
                 intent_id=row["intent_id"],
@@ -588,19 +1067,15 @@ class SQLite(Store):
                 stream=row["stream"],
                 aggregate_id=row["aggregate_id"],
                 revision=row["revision"],
+                stored=self._inline_to_stored(row),
+                subscriptions=tuple(row["subscriptions"] or ()),
             )
             for row in rows
         ]
 
-    def settle(self, settlements: Sequence[Settlement]) -> None:
-        try:
-            with self.engine.begin() as conn:
-                for statement in st.settle_intents(self.dialect, settlements):
-                    conn.execute(statement)
-        except EventicError:
-            raise
-        except Exception as exc:  # noqa: BLE001
-            raise StoreError("settle failed") from exc
+    def _settle(self, conn: Connection, settlements: Sequence[Settlement]) -> None:
+        for statement, params in st.settle_intents(self.dialect, settlements):
+            conn.execute(statement, params)
 
     # -- internal helpers ----------------------------------------------------
 
@@ -650,6 +1125,60 @@ class SQLite(Store):
         )
         return self._decode_window(stream, aggregate_id, revision, window)
 
+    def _decode_rows(
+        self, conn: Connection, stream: str, rows: Sequence[RowMapping]
+    ) -> list[JsonObject]:
+        """Decode log rows of one stream, fetching every delta window at once.
+
+        Snapshot rows decode alone; each delta row needs the range back to
+        its checkpoint, bounded by the ``every`` it was written with. All
+        ranges are read in one query per chunk instead of one per row. A delta
+        row that directly follows the row decoded before it applies to that
+        document instead of replaying its window again.
+        """
+        spans = [
+            (
+                row["aggregate_id"],
+                max(
+                    0,
+                    row["revision"]
+                    - int(cast(int, _json_loads(row["payload"]).get("every") or 20)),
+                ),
+                row["revision"],
+            )
+            for row in rows
+            if row["encoding"] != "snapshot/1"
+        ]
+        windows: dict[UUID, dict[int, RowMapping]] = {}
+        for start in range(0, len(spans), _WINDOW_CHUNK):
+            for log_row in (
+                conn.execute(
+                    st.select_windows(stream, spans[start : start + _WINDOW_CHUNK])
+                )
+                .mappings()
+                .all()
+            ):
+                by_revision = windows.setdefault(log_row["aggregate_id"], {})
+                by_revision[log_row["revision"]] = log_row
+        docs: list[JsonObject] = []
+        last: tuple[UUID, int] | None = None
+        for row in rows:
+            aggregate_id, revision = row["aggregate_id"], row["revision"]
+            payload = _json_loads(row["payload"])
+            if row["encoding"] == "snapshot/1":
+                doc = payload
+            elif last == (aggregate_id, revision - 1) and payload.get("base") == (
+                revision - 1
+            ):
+                doc = self._delta_decode(payload, docs[-1])
+            else:
+                by_revision = windows.get(aggregate_id, {})
+                window = [by_revision[n] for n in sorted(by_revision) if n <= revision]
+                doc = self._decode_window(stream, aggregate_id, revision, window)
+            docs.append(doc)
+            last = (aggregate_id, revision)
+        return docs
+
     def _decode_window(
         self,
         stream: str,
@@ -719,6 +1248,26 @@ class SQLite(Store):
             committed_at=_parse_db_datetime(row["committed_at"]),
         )
 
+    def _inline_to_stored(self, row: RowMapping) -> StoredRevision | None:
+        if row["inline_revision"] is None:
+            return None
+        inline = _json_loads(row["inline_revision"])
+        return StoredRevision(
+            stream=row["stream"],
+            aggregate_id=row["aggregate_id"],
+            revision=row["revision"],
+            revision_id=row["revision_id"],
+            kind=cast(str, inline["kind"]),
+            schema_version=cast(int, inline["schema_version"]),
+            meta_version=cast(int, inline["meta_version"]),
+            encoding="",
+            payload=cast(JsonObject, inline["payload"]),
+            digest=cast(str, inline["digest"]),
+            meta=cast(JsonObject, inline["meta"]),
+            committed_at=_parse_db_datetime(inline["committed_at"]),
+            changed=_changed_keys(inline["changed"]),
+        )
+
     def _log_row_to_stored(
         self, row: RowMapping, payload: JsonObject
     ) -> StoredRevision:
@@ -735,9 +1284,101 @@ class SQLite(Store):
             digest=row["digest"],
             meta=_json_loads(row["meta"]),
             committed_at=_parse_db_datetime(row["committed_at"]),
+            changed=_changed_keys(row.get("changed")),
         )
 
 
+def _inline_revision(request: CommitRequest, now: datetime) -> JsonObject:
+    """What an ``inline_payload`` intent carries to rebuild the commit."""
+    return {
+        "kind": request.kind,
+        "schema_version": request.schema_version,
+        "meta_version": request.meta_version,
+        "digest": request.digest,
+        "committed_at": now.isoformat(),
+        "payload": _json_loads(request.payload),
+        "meta": _json_loads(request.meta),
+        "changed": list(request.changed) if request.changed is not None else None,
+    }
+
+
+def _changed_keys(value: Any) -> frozenset[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+    return frozenset(cast(list[str], value))
+
+
+def _utc_moment(as_of: datetime) -> datetime:
+    """A tz-aware instant in UTC, the zone every ``committed_at`` is stored in."""
+    if as_of.tzinfo is None:
+        raise UsageError("as_of must be timezone-aware")
+    return as_of.astimezone(UTC)
+
+
+def _parse_position(position: str) -> tuple[int, int]:
+    """``"commit_tx:position"`` back to the ordering tuple."""
+    try:
+        commit_tx, _, ordinal = position.partition(":")
+        return int(commit_tx), int(ordinal)
+    except ValueError:
+        raise UsageError(f"not a change-feed position: {position!r}") from None
+
+
+def _ref(row: RowMapping) -> HeadRef:
+    return HeadRef(
+        aggregate_id=row["aggregate_id"],
+        revision=row["revision"],
+        digest=row["digest"],
+    )
+
+
+def _projection_row_to_stored(
+    row: RowMapping, fields: Sequence[str]
+) -> StoredProjection:
+    """``f{i}`` columns are JSON text; SQL NULL means the path is missing."""
+    values: JsonObject = {}
+    for index, path in enumerate(fields):
+        text = row[f"f{index}"]
+        if text is not None:
+            values[path] = json.loads(text)
+    return StoredProjection(
+        stream=row["stream"],
+        aggregate_id=row["aggregate_id"],
+        revision=row["revision"],
+        revision_id=row["revision_id"],
+        schema_version=row["schema_version"],
+        digest=row["digest"],
+        committed_at=_parse_db_datetime(row["committed_at"]),
+        fields=values,
+    )
+
+
+def _runs(numbers: set[int]) -> list[tuple[int, int]]:
+    """Sorted integers as inclusive ``(start, end)`` runs of consecutive ones."""
+    runs: list[tuple[int, int]] = []
+    for number in sorted(numbers):
+        if runs and runs[-1][1] == number - 1:
+            runs[-1] = (runs[-1][0], number)
+        else:
+            runs.append((number, number))
+    return runs
+
+
+def _staged_queues(
+    requests: Sequence[CommitRequest], results: Sequence[CommitResult]
+) -> list[str]:
+    """Queues that got new intents; a replay stages nothing."""
+    queues = {
+        intent.queue
+        for request, result in zip(requests, results, strict=True)
+        if not result.replayed
+        for intent in request.intents
+    }
+    return sorted(queues)
+
+
 def _intent_id(intent: IntentRequest) -> UUID:
     from eventic.ids import NS as _NS
 
@@ -763,9 +1404,21 @@ class Postgres(SQLite):
         self.dialect = Dialect(name="postgresql", capabilities=POSTGRES_CAPABILITIES)
         self._encodings = dict(encodings or {})
         self.engine = create_engine(url)
+        self._listener = PgListener(self.engine)
         self._install_events()
         if create_tables:
             self._create_tables()
 
     def _install_events(self) -> None:
         pass  # Postgres uses its default isolation and row locking
+
+    def close(self) -> None:
+        """Close listening connections and release the pool. Idempotent."""
+        self._listener.close()
+        super().close()
+
+    def _committed(self, queues: Sequence[str]) -> None:
+        pass  # NOTIFY went out with the transaction
+
+    def wait_for_intents(self, queue: str, *, timeout: timedelta) -> bool:
+        return self._listener.wait(queue, timeout)
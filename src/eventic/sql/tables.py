@@ -11,16 +11,19 @@ from __future__ import annotations
 from typing import Any
 
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
     Column,
     DateTime,
     Index,
     Integer,
     MetaData,
+    Sequence,
     String,
     Table,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy import Uuid as SqlUuid
 from sqlalchemy.dialects.postgresql import JSONB
@@ -35,6 +38,10 @@ json_type: JSON = JSON().with_variant(JSONB(), "postgresql")
 ENCODINGS_CONSTRAINT = "encoding IN ('snapshot/1','delta/1')"
 
 
+# Postgres draws ``eventic_revision.position`` from this sequence; SQLite
+# serializes writers and assigns ``max + 1`` instead (see ``Dialect``).
+position_seq = Sequence("eventic_revision_position_seq", metadata=metadata)
+
 eventic_revision = Table(
     "eventic_revision",
     metadata,
@@ -50,6 +57,13 @@ eventic_revision = Table(
     Column[Any]("digest", String(64), nullable=False),
     Column[Any]("meta", json_type, nullable=False),
     Column[Any]("committed_at", DateTime(timezone=True), nullable=False),
+    # Global commit order: (commit_tx, position). commit_tx is the writing
+    # transaction id on Postgres, so readers can exclude still-open writers.
+    Column[Any]("commit_tx", BigInteger, nullable=False),
+    Column[Any]("position", BigInteger, nullable=False),
+    # Sorted top-level keys changed from the previous revision, as the writer
+    # planned them; NULL for rows written before the column existed.
+    Column[Any]("changed", json_type, nullable=True),
     CheckConstraint("revision >= 0", name="ck_revision_nonneg"),
     CheckConstraint("kind IN ('create','change')", name="ck_kind"),
     CheckConstraint("schema_version >= 1", name="ck_schema_version"),
@@ -58,6 +72,8 @@ eventic_revision = Table(
     CheckConstraint("stream <> ''", name="ck_stream_nonempty"),
     UniqueConstraint("stream", "aggregate_id", "revision", name="uq_revision"),
     Index("ix_revision_sai", "stream", "aggregate_id", "revision"),
+    Index("ix_revision_commit_order", "commit_tx", "position", unique=True),
+    Index("ix_revision_sac", "stream", "aggregate_id", "committed_at"),
 )
 
 eventic_head = Table(
@@ -81,6 +97,11 @@ eventic_intent = Table(
     Column[Any]("intent_id", SqlUuid, primary_key=True),
     Column[Any]("subscription_id", Text, nullable=False),
     Column[Any]("revision_id", SqlUuid, nullable=False),
+    # The revision's aggregate key, copied at commit so a claim reads the
+    # intent table alone.
+    Column[Any]("stream", Text, nullable=False),
+    Column[Any]("aggregate_id", SqlUuid, nullable=False),
+    Column[Any]("revision", Integer, nullable=False),
     Column[Any]("queue", Text, nullable=False),
     Column[Any]("status", Text, nullable=False),
     Column[Any]("attempts", Integer, nullable=False, server_default="0"),
@@ -88,10 +109,55 @@ eventic_intent = Table(
     Column[Any]("leased_until", DateTime(timezone=True), nullable=True),
     Column[Any]("last_error", Text, nullable=True),
     Column[Any]("created_at", DateTime(timezone=True), nullable=False),
+    # The revision as delivered (document, meta, changed keys and log
+    # columns) for ``Outbox(inline_payload=True)``; NULL otherwise.
+    Column[Any]("inline_revision", json_type, nullable=True),
+    # ``Outbox(partitions=N)``: the aggregate's partition of the queue.
+    Column[Any]("partition", Integer, nullable=False, server_default="0"),
+    # ``Outbox(grouped=True)``: the subscriptions the row is still owed to,
+    # ``subscription_id`` being the first it was staged for, or the first it
+    # owes once a split took that one away; NULL otherwise.
+    Column[Any]("subscriptions", json_type, nullable=True),
     CheckConstraint("queue <> ''", name="ck_intent_queue"),
     CheckConstraint("status IN ('pending','leased','dead')", name="ck_intent_status"),
     UniqueConstraint("subscription_id", "revision_id", name="uq_intent_sub_rev"),
-    Index("ix_intent_drain", "queue", "status", "available_at"),
+    # Claimable rows only: a claim seeks one index for due pending intents
+    # and one for expired leases; dead rows are in neither.
+    Index(
+        "ix_intent_pending",
+        "queue",
+        "available_at",
+        postgresql_where=text("status = 'pending'"),
+        sqlite_where=text("status = 'pending'"),
+    ),
+    Index(
+        "ix_intent_leased",
+        "queue",
+        "leased_until",
+        postgresql_where=text("status = 'leased'"),
+        sqlite_where=text("status = 'leased'"),
+    ),
+)
+
+# Partition leases: which worker drains which partition of a queue. A row
+# with no holder, or an expired lease, is free to take.
+eventic_partition = Table(
+    "eventic_partition",
+    metadata,
+    Column[Any]("queue", Text, primary_key=True),
+    Column[Any]("partition", Integer, primary_key=True),
+    Column[Any]("holder", Text, nullable=True),
+    Column[Any]("leased_until", DateTime(timezone=True), nullable=True),
+)
+
+# Live drainers of a partitioned queue, holding partitions or waiting for
+# their share; a row past ``seen_until`` is a drainer that left.
+eventic_drainer = Table(
+    "eventic_drainer",
+    metadata,
+    Column[Any]("queue", Text, primary_key=True),
+    Column[Any]("holder", Text, primary_key=True),
+    Column[Any]("seen_until", DateTime(timezone=True), nullable=False),
 )
 
 eventic_schema = Table(
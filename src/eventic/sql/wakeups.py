@@ -0,0 +1,118 @@
+"""Worker wakeups: Postgres ``LISTEN``/``NOTIFY``, or an in-process signal.
+
+On Postgres, commits ``NOTIFY`` once per queue they staged intents for,
+inside the write transaction. A waiting worker holds a dedicated autocommit
+connection that ``LISTEN``s; it never touches the pool the store reads and
+writes through. SQLite has no cross-connection signal, so its store signals
+waiters in the same process after each commit.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import Engine
+
+from eventic.errors import StoreError
+from eventic.sql.dialect import INTENT_CHANNEL
+
+
+class PgListener:
+    """One listening connection per queue, opened on the first wait.
+
+    Notifications wait on the connection until read, so one that lands
+    between two waits wakes the second. A connection that fails is dropped
+    and reopened on the next wait.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._guard = threading.Lock()
+        self._queues: dict[str, tuple[threading.Lock, Any]] = {}
+
+    def wait(self, queue: str, timeout: timedelta) -> bool:
+        lock, conn = self._listening(queue)
+        deadline = time.monotonic() + max(timeout.total_seconds(), 0.0)
+        with lock:
+            try:
+                while True:
+                    remaining = max(deadline - time.monotonic(), 0.0)
+                    woke = any(
+                        note.payload == queue
+                        for note in conn.notifies(timeout=remaining, stop_after=1)
+                    )
+                    if woke:
+                        # Coalesce signals already queued behind this one.
+                        for _ in conn.notifies(timeout=0):
+                            pass
+                        return True
+                    if time.monotonic() >= deadline:
+                        return False
+            except Exception as exc:  # noqa: BLE001
+                self._drop(queue, conn)
+                raise StoreError("wakeup wait failed") from exc
+
+    def close(self) -> None:
+        with self._guard:
+            queues, self._queues = self._queues, {}
+        for _lock, conn in queues.values():
+            conn.close()
+
+    def _listening(self, queue: str) -> tuple[threading.Lock, Any]:
+        with self._guard:
+            entry = self._queues.get(queue)
+            if entry is not None:
+                return entry
+            try:
+                raw = self._engine.raw_connection()
+                conn = raw.driver_connection
+                raw.detach()  # owned here, never returned to the pool
+                conn.autocommit = True  # type: ignore[union-attr]
+                conn.execute(f'LISTEN "{INTENT_CHANNEL}"')  # type: ignore[union-attr]
+            except Exception as exc:  # noqa: BLE001
+                raise StoreError("wakeup subscribe failed") from exc
+            entry = (threading.Lock(), conn)
+            self._queues[queue] = entry
+            return entry
+
+    def _drop(self, queue: str, conn: Any) -> None:
+        with self._guard:
+            if self._queues.get(queue, (None, None))[1] is conn:
+                del self._queues[queue]
+        with contextlib.suppress(Exception):
+            conn.close()
+
+
+class LocalSignals:
+    """Per-queue flags under one condition variable, for co-located workers.
+
+    Only commits made through the same store object are seen; a writer in
+    another process is picked up by the worker's poll.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._subscribed: set[str] = set()
+        self._pending: set[str] = set()
+
+    def signal(self, queues: Iterable[str]) -> None:
+        with self._cond:
+            woken = self._subscribed.intersection(queues)
+            if woken:
+                self._pending |= woken
+                self._cond.notify_all()
+
+    def wait(self, queue: str, timeout: timedelta) -> bool:
+        with self._cond:
+            self._subscribed.add(queue)
+            woke = self._cond.wait_for(
+                lambda: queue in self._pending,
+                timeout=max(timeout.total_seconds(), 0.0),
+            )
+            self._pending.discard(queue)
+            return woke
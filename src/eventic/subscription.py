@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
 from pydantic import BaseModel
 
 from eventic.envelopes import Commit, Kind
+from eventic.jsonx import JsonValue
 from eventic.stream import Stream
 
 
@@ -28,16 +30,52 @@ class Backoff:
 
 @dataclass(frozen=True)
 class Outbox:
-    """Durable at-least-once delivery via a named queue."""
+    """Durable at-least-once delivery via a named queue.
+
+    ``inline_payload`` copies the revision's document, meta and changed keys
+    into each intent row, so the worker delivers from the claim alone, with
+    no read of the log. It costs a copy of the document per subscription.
+
+    ``coalesce`` delivers only the newest revision of each aggregate in a
+    claimed batch, its ``changed`` widened to the keys of the revisions it
+    stands in for; the older intents settle as it does, with no delivery of
+    their own. For handlers that only want the latest state.
+
+    ``partitions`` hashes each aggregate into one of that many partitions of
+    the queue. Workers lease partitions, not the queue, so each aggregate is
+    drained by one worker at a time, in order. Every subscription on a
+    queue declares the same count. Pending intents staged under an older
+    count are claimed by their partition modulo the new one.
+
+    ``grouped`` stages one intent row per commit for the whole queue, owed
+    to every subscription on it that takes the commit, instead of one per
+    subscription. The worker reconstructs the commit once for all of them,
+    and a retry owes only the ones that failed. Every subscription on a
+    queue declares the same ``grouped``, and none of them ``coalesce``.
+    """
 
     queue: str = "default"
     retry: Backoff = Backoff()
     dead_letter: bool = True
+    inline_payload: bool = False
+    coalesce: bool = False
+    partitions: int = 1
+    grouped: bool = False
 
 
 @dataclass(frozen=True)
 class Subscription[T: BaseModel, M: BaseModel]:
-    """One handler, for one stream, for a set of kinds, with one delivery."""
+    """One handler, for one stream, for a set of kinds, with one delivery.
+
+    ``when_changed`` and ``where`` narrow the commits the handler sees, and
+    are checked when the commit is planned: a commit they reject stages no
+    intent and runs no inline handler. ``when_changed`` names top-level
+    keys, as in ``Commit.changed``; the commit must change at least one.
+    ``where`` maps dotted paths to values the new document must hold, with
+    the strict equality of ``Collection.where``. Both empty (the default)
+    take every commit of ``kinds``. ``where`` is left out of the hash, so a
+    subscription stays hashable whatever values it holds.
+    """
 
     id: str
     stream: Stream[T]
@@ -46,3 +84,61 @@ class Subscription[T: BaseModel, M: BaseModel]:
         default_factory=lambda: frozenset({"create", "change"})
     )
     delivery: Inline | Outbox = Inline()
+    when_changed: frozenset[str] = frozenset()
+    where: Mapping[str, JsonValue] = field(
+        default_factory=dict[str, JsonValue], hash=False
+    )
+
+
+@dataclass(frozen=True)
+class AsyncSubscription[T: BaseModel, M: BaseModel]:
+    """A coroutine handler, declared as one; delivered by an ``AsyncWorker``.
+
+    Outbox only: inline dispatch runs after ``COMMIT`` returns, on the
+    writer's thread, where there is no event loop to await on.
+    ``when_changed`` and ``where`` filter as on ``Subscription``.
+    """
+
+    id: str
+    stream: Stream[T]
+    handler: Callable[[Commit[T, M]], Awaitable[None]]
+    kinds: frozenset[Kind] = field(
+        default_factory=lambda: frozenset({"create", "change"})
+    )
+    delivery: Outbox = Outbox()
+    when_changed: frozenset[str] = frozenset()
+    where: Mapping[str, JsonValue] = field(
+        default_factory=dict[str, JsonValue], hash=False
+    )
+
+
+@dataclass(frozen=True)
+class BatchSubscription[T: BaseModel, M: BaseModel]:
+    """One handler call for many commits, for sinks with a bulk write.
+
+    The worker hands the handler a claimed batch's commits for this
+    subscription, up to ``max_batch`` per call, each aggregate in revision
+    order. The handler returns ``None`` when every commit was handled, or
+    one outcome per commit, in order: ``None`` for delivered, an exception
+    to retry or dead-letter that commit alone. If it raises, every commit in
+    the call fails with it. Outbox only, like ``AsyncSubscription``;
+    ``when_changed`` and ``where`` filter as on ``Subscription``.
+    """
+
+    id: str
+    stream: Stream[T]
+    handler: Callable[[Sequence[Commit[T, M]]], Sequence[Exception | None] | None]
+    kinds: frozenset[Kind] = field(
+        default_factory=lambda: frozenset({"create", "change"})
+    )
+    max_batch: int = 100
+    delivery: Outbox = Outbox()
+    when_changed: frozenset[str] = frozenset()
+    where: Mapping[str, JsonValue] = field(
+        default_factory=dict[str, JsonValue], hash=False
+    )
+
+
+type AnySubscription = (
+    Subscription[Any, Any] | AsyncSubscription[Any, Any] | BatchSubscription[Any, Any]
+)
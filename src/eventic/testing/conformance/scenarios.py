@@ -1,28 +1,41 @@
 """The store conformance corpus: scenarios, declaratively.
 
 Grouped by contract area: CAS, replay, identity, atomicity, batch, reads,
-head integrity, time, intents, and error translation.
+projections, the change feed, point-in-time reads, head integrity, time,
+intents, and error translation.
 """
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from eventic.jsonx import canonical_bytes, digest
 from eventic.testing.conformance.store import (
+    Acquire,
+    AsOf,
     Batch,
+    Changes,
     Claim,
     Commit,
     ConcurrentDrainers,
+    Extend,
+    Fields,
     History,
     Payload,
     Race,
+    Refs,
+    Release,
+    Renew,
+    Revisions,
     Scenario,
     Search,
     Settle,
+    SettleClaim,
     Time,
     Wait,
     commit_step,
+    digest_of,
     exact_step,
     head_step,
     intent,
@@ -521,6 +534,190 @@ READS: tuple[Scenario, ...] = (
     ),
 )
 
+_WIDE: Payload = {
+    "title": "a",
+    "owner": {"id": 7, "name": "x"},
+    "note": None,
+    "body": "wide",
+    "a.b": 1,
+}
+
+PROJECTIONS: tuple[Scenario, ...] = (
+    Scenario(
+        "projection reads return only the requested paths",
+        requires=frozenset({"projections"}),
+        steps=(
+            _commit("todos", _A, None, "create", _WIDE),
+            Fields(
+                name="head fields",
+                stream="todos",
+                aggregate_id=_A,
+                fields=("title", "owner.id", "owner"),
+                expect_fields=(
+                    {"title": "a", "owner.id": 7, "owner": {"id": 7, "name": "x"}},
+                ),
+            ),
+            Fields(
+                name="missing head",
+                stream="todos",
+                aggregate_id=_B,
+                fields=("title",),
+                expect_missing=True,
+            ),
+        ),
+    ),
+    Scenario(
+        "projected missing path and explicit JSON null are distinct",
+        requires=frozenset({"projections"}),
+        steps=(
+            _commit("todos", _A, None, "create", _WIDE),
+            Fields(
+                name="null present, missing absent, escaped dot literal",
+                stream="todos",
+                aggregate_id=_A,
+                fields=("note", "nope", "owner.nope", "a\\.b"),
+                expect_fields=({"note": None, "a\\.b": 1},),
+            ),
+        ),
+    ),
+    Scenario(
+        "projected search applies filters and keyset order",
+        requires=frozenset({"projections", "json_paths"}),
+        steps=(
+            _commit("todos", _A, None, "create", _WIDE),
+            _commit("todos", _B, None, "create", {**_WIDE, "title": "b"}),
+            _commit("todos", UUID(int=3), None, "create", {"title": "c"}),
+            Fields(
+                name="filtered projection",
+                stream="todos",
+                fields=("title", "owner.id"),
+                filters={"body": "wide"},
+                expect_ids=(_A, _B),
+                expect_fields=(
+                    {"title": "a", "owner.id": 7},
+                    {"title": "b", "owner.id": 7},
+                ),
+            ),
+        ),
+    ),
+)
+
+REFS: tuple[Scenario, ...] = (
+    Scenario(
+        "head refs carry revision and digest, omitting absent ids",
+        requires=frozenset({"projections"}),
+        steps=(
+            _commit("todos", _A, None, "create", _DOC1),
+            _commit("todos", _A, 0, "change", _DOC2),
+            _commit("todos", _B, None, "create", _DOC3),
+            _commit("other", UUID(int=3), None, "create", _DOC1),
+            Refs(
+                name="refs by id",
+                stream="todos",
+                ids=(_A, _B, UUID(int=3), _A),
+                expect=((_A, 1, digest_of(_DOC2)), (_B, 0, digest_of(_DOC3))),
+            ),
+            Refs(
+                name="refs by filter",
+                stream="todos",
+                filters={"done": False},
+                expect=((_A, 1, digest_of(_DOC2)),),
+            ),
+        ),
+    ),
+)
+
+CHANGE_FEED: tuple[Scenario, ...] = (
+    Scenario(
+        "change feed is commit order across aggregates and streams",
+        requires=frozenset({"change_feed"}),
+        steps=(
+            _commit("todos", _B, None, "create", _DOC1),
+            _commit("todos", _A, None, "create", _DOC1),
+            _commit("other", _A, None, "create", _DOC1),
+            Batch(
+                name="two streams in one commit",
+                commits=(
+                    _commit("todos", _B, 0, "change", _DOC2),
+                    _commit("other", _A, 0, "change", _DOC2),
+                ),
+            ),
+            _commit("todos", _A, 0, "change", _DOC3),
+            Changes(
+                name="every stream",
+                page_size=2,
+                expect=(
+                    ("todos", _B, 0),
+                    ("todos", _A, 0),
+                    ("other", _A, 0),
+                    ("todos", _B, 1),
+                    ("other", _A, 1),
+                    ("todos", _A, 1),
+                ),
+            ),
+            Changes(
+                name="one stream",
+                streams=("other",),
+                expect=(("other", _A, 0), ("other", _A, 1)),
+            ),
+        ),
+    ),
+    Scenario(
+        "change feed is empty before any commit",
+        requires=frozenset({"change_feed"}),
+        steps=(Changes(name="empty feed", expect=()),),
+    ),
+)
+
+AS_OF: tuple[Scenario, ...] = (
+    Scenario(
+        "point-in-time reads pick the last revision committed by then",
+        requires=frozenset({"point_in_time"}),
+        steps=(
+            _commit("todos", _A, None, "create", _DOC1),
+            Wait(name="tick", seconds=0.01),
+            _commit("todos", _B, None, "create", _DOC2),
+            _commit("todos", _A, 0, "change", _DOC3),
+            Wait(name="tick", seconds=0.01),
+            _commit("todos", _A, 1, "change", _DOC2),
+            AsOf(name="every revision", stream="todos", aggregate_id=_A),
+            AsOf(
+                name="filtered on the historical document",
+                stream="todos",
+                aggregate_id=_A,
+                filters={"done": True},
+            ),
+            AsOf(name="a later aggregate", stream="todos", aggregate_id=_B),
+        ),
+    ),
+)
+
+BATCH_READS: tuple[Scenario, ...] = (
+    Scenario(
+        "a batch read returns the revisions that exist, as single reads do",
+        requires=frozenset({"batch_reads"}),
+        steps=(
+            _commit("todos", _A, None, "create", _DOC1),
+            _commit("todos", _A, 0, "change", _DOC2),
+            _commit("todos", _A, 1, "change", _DOC3),
+            _commit("todos", _B, None, "create", _DOC2),
+            Revisions(
+                name="scattered keys, absent ones included",
+                keys=(
+                    ("todos", _A, 2),
+                    ("todos", _A, 0),
+                    ("todos", _A, 1),
+                    ("todos", _B, 0),
+                    ("todos", _B, 1),
+                    ("todos", _A, 9),
+                    ("notes", _A, 0),
+                ),
+            ),
+            Revisions(name="nothing asked", keys=()),
+        ),
+    ),
+)
+
 # ---------------------------------------------------------------------------
 # Head integrity and time
 # ---------------------------------------------------------------------------
@@ -629,6 +826,362 @@ INTENTS: tuple[Scenario, ...] = (
             Claim(name="queue is empty", queue="q", expect_none=True),
         ),
     ),
+    Scenario(
+        "an inline-payload intent is claimed with its revision",
+        requires=frozenset({"outbox"}),
+        steps=(
+            _commit("todos", _A, None, "create", _DOC1),
+            _commit(
+                "todos",
+                _A,
+                0,
+                "change",
+                _DOC3,
+                intents=(
+                    intent("sub.a", _rid("todos", _A, 1), inline_payload=True),
+                    intent("sub.b", _rid("todos", _A, 1)),
+                ),
+            ),
+            Claim(
+                name="the inline claim matches the log",
+                queue="q",
+                expect=(
+                    ("sub.a", _rid("todos", _A, 1), 1),
+                    ("sub.b", _rid("todos", _A, 1), 1),
+                ),
+                expect_inline=("sub.a",),
+            ),
+            Settle(name="ack delivered", status="delivered"),
+            Claim(name="queue is empty", queue="q", expect_none=True),
+        ),
+    ),
+    Scenario(
+        "one settle call acks, retries and dead-letters together",
+        requires=frozenset({"outbox"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=tuple(
+                    intent(sub, _rid("todos", _A, 0))
+                    for sub in ("sub.a", "sub.b", "sub.c", "sub.d", "sub.e")
+                ),
+            ),
+            Claim(
+                name="claim all five",
+                queue="q",
+                expect=tuple(
+                    (sub, _rid("todos", _A, 0), 1)
+                    for sub in ("sub.a", "sub.b", "sub.c", "sub.d", "sub.e")
+                ),
+            ),
+            Settle(
+                name="mixed outcomes",
+                status="delivered",
+                available_at=datetime(2000, 1, 1, tzinfo=UTC),
+                error="boom",
+                statuses={"sub.b": "retry", "sub.c": "dead", "sub.d": "retry"},
+            ),
+            Claim(
+                name="only the retries come back",
+                queue="q",
+                expect=(
+                    ("sub.b", _rid("todos", _A, 0), 2),
+                    ("sub.d", _rid("todos", _A, 0), 2),
+                ),
+            ),
+        ),
+    ),
+    Scenario(
+        "settle and claim in one call",
+        requires=frozenset({"outbox", "pipelined_claims"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=(intent("sub.a", _rid("todos", _A, 0)),),
+            ),
+            Claim(
+                name="claim the first",
+                queue="q",
+                expect=(("sub.a", _rid("todos", _A, 0), 1),),
+            ),
+            _commit(
+                "todos",
+                _A,
+                0,
+                "change",
+                _DOC2,
+                intents=(intent("sub.a", _rid("todos", _A, 1)),),
+            ),
+            SettleClaim(
+                name="ack the first, claim the second",
+                queue="q",
+                expect=(("sub.a", _rid("todos", _A, 1), 1),),
+            ),
+            SettleClaim(name="ack the second, nothing left", queue="q"),
+            Claim(name="queue is empty", queue="q", expect_none=True),
+        ),
+    ),
+    Scenario(
+        "a heartbeat extends a live lease; a stale holder is fenced off",
+        requires=frozenset({"outbox", "lease_extension"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=(intent("sub.a", _rid("todos", _A, 0)),),
+            ),
+            Claim(
+                name="a short lease",
+                queue="q",
+                lease=timedelta(milliseconds=20),
+                expect=(("sub.a", _rid("todos", _A, 0), 1),),
+            ),
+            Extend(name="extend it", lease=timedelta(minutes=1), expect=1),
+            Wait(name="past the first lease", seconds=0.05),
+            Claim(name="the extended lease holds", queue="q", expect_none=True),
+            Extend(
+                name="a stale holder extends nothing",
+                lease=timedelta(minutes=1),
+                expect=0,
+                attempts=0,
+            ),
+            Settle(name="a stale holder cannot dead-letter", status="dead", attempts=0),
+            Settle(name="nor ack", status="delivered", attempts=0),
+            Extend(name="still leased", lease=timedelta(minutes=1), expect=1),
+            Settle(name="the holder acks", status="delivered", attempts=1),
+            Extend(name="nothing left", lease=timedelta(minutes=1), expect=0),
+        ),
+    ),
+    Scenario(
+        "a grouped intent narrows to the subscriptions still owed",
+        requires=frozenset({"outbox", "grouped_intents"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=(
+                    intent(
+                        "sub.a",
+                        _rid("todos", _A, 0),
+                        subscriptions=("sub.a", "sub.b", "sub.c"),
+                    ),
+                ),
+            ),
+            Claim(
+                name="one row for three",
+                queue="q",
+                expect=(("sub.a", _rid("todos", _A, 0), 1),),
+                expect_owed={"sub.a": ("sub.a", "sub.b", "sub.c")},
+            ),
+            Settle(
+                name="only sub.c failed",
+                status="retry",
+                available_at=datetime(2000, 1, 1, tzinfo=UTC),
+                subscriptions=("sub.c",),
+            ),
+            Claim(
+                name="the row owes sub.c alone",
+                queue="q",
+                expect=(("sub.a", _rid("todos", _A, 0), 2),),
+                expect_owed={"sub.a": ("sub.c",)},
+            ),
+            Settle(
+                name="a retry that keeps the set",
+                status="retry",
+                available_at=datetime(2000, 1, 1, tzinfo=UTC),
+            ),
+            Claim(
+                name="still sub.c",
+                queue="q",
+                expect=(("sub.a", _rid("todos", _A, 0), 3),),
+                expect_owed={"sub.a": ("sub.c",)},
+            ),
+            Settle(name="delivered at last", status="delivered"),
+            Claim(name="queue is empty", queue="q", expect_none=True),
+        ),
+    ),
+    Scenario(
+        "dead subscriptions split off a grouped intent that retries",
+        requires=frozenset({"outbox", "grouped_intents"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=(
+                    intent(
+                        "sub.a",
+                        _rid("todos", _A, 0),
+                        subscriptions=("sub.a", "sub.b", "sub.c"),
+                    ),
+                ),
+            ),
+            Claim(
+                name="one row for three",
+                queue="q",
+                expect=(("sub.a", _rid("todos", _A, 0), 1),),
+                expect_owed={"sub.a": ("sub.a", "sub.b", "sub.c")},
+            ),
+            Settle(
+                name="sub.a is dead, the others retry",
+                status="retry",
+                available_at=datetime(2000, 1, 1, tzinfo=UTC),
+                error="gone",
+                attempts=1,
+                subscriptions=("sub.b", "sub.c"),
+                split=("sub.a",),
+            ),
+            Claim(
+                name="the row owes the others, under a name of theirs",
+                queue="q",
+                expect=(("sub.b", _rid("todos", _A, 0), 2),),
+                expect_owed={"sub.b": ("sub.b", "sub.c")},
+            ),
+            Settle(name="delivered", status="delivered"),
+            Claim(name="the dead row is not claimed", queue="q", expect_none=True),
+        ),
+    ),
+    Scenario(
+        "partitions are shared fairly as holders join and leave",
+        requires=frozenset({"outbox", "partitions"}),
+        steps=(
+            Acquire(
+                name="alone: all four", queue="q", holder="a", partitions=4, expect=4
+            ),
+            Acquire(
+                name="none free yet", queue="q", holder="b", partitions=4, expect=0
+            ),
+            Acquire(
+                name="a gives two back", queue="q", holder="a", partitions=4, expect=2
+            ),
+            Acquire(name="b takes them", queue="q", holder="b", partitions=4, expect=2),
+            Acquire(name="a is stable", queue="q", holder="a", partitions=4, expect=2),
+            Release(name="a leaves", queue="q", holder="a"),
+            Acquire(name="b takes all", queue="q", holder="b", partitions=4, expect=4),
+        ),
+    ),
+    Scenario(
+        "an expired partition lease is free to take",
+        requires=frozenset({"outbox", "partitions"}),
+        steps=(
+            Acquire(
+                name="a short lease",
+                queue="q",
+                holder="a",
+                partitions=2,
+                expect=2,
+                lease=timedelta(milliseconds=20),
+            ),
+            Wait(name="past it", seconds=0.05),
+            Acquire(name="b takes both", queue="q", holder="b", partitions=2, expect=2),
+        ),
+    ),
+    Scenario(
+        "a renewed partition lease outlasts the first",
+        requires=frozenset({"outbox", "partitions"}),
+        steps=(
+            Acquire(
+                name="a short lease",
+                queue="q",
+                holder="a",
+                partitions=2,
+                expect=2,
+                lease=timedelta(milliseconds=50),
+            ),
+            Renew(name="a renews", queue="q", holder="a", expect=2),
+            Wait(name="past the first lease", seconds=0.08),
+            Acquire(name="b finds none", queue="q", holder="b", partitions=2, expect=0),
+            Renew(name="b holds nothing", queue="q", holder="b", expect=0),
+        ),
+    ),
+    Scenario(
+        "a partition claim sees only its partitions",
+        requires=frozenset({"outbox", "partitions"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=(intent("sub.a", _rid("todos", _A, 0), partition=1),),
+            ),
+            _commit(
+                "todos",
+                _B,
+                None,
+                "create",
+                _DOC2,
+                intents=(intent("sub.a", _rid("todos", _B, 0), partition=0),),
+            ),
+            Claim(
+                name="partition 0",
+                queue="q",
+                partitions=(0,),
+                expect=(("sub.a", _rid("todos", _B, 0), 1),),
+            ),
+            Claim(name="partition 0 is drained", queue="q", partitions=(0,)),
+            Claim(name="no partitions, no intents", queue="q", partitions=()),
+            Claim(
+                name="partitions 0 and 1",
+                queue="q",
+                partitions=(0, 1),
+                expect=(("sub.a", _rid("todos", _A, 0), 1),),
+            ),
+        ),
+    ),
+    Scenario(
+        "a lowered partition count strands no intent",
+        requires=frozenset({"outbox", "partitions"}),
+        steps=(
+            _commit(
+                "todos",
+                _A,
+                None,
+                "create",
+                _DOC1,
+                intents=(intent("sub.a", _rid("todos", _A, 0), partition=3),),
+            ),
+            _commit(
+                "todos",
+                _B,
+                None,
+                "create",
+                _DOC2,
+                intents=(intent("sub.a", _rid("todos", _B, 0), partition=2),),
+            ),
+            Claim(
+                name="3 of 4 is 1 of 2",
+                queue="q",
+                partitions=(1,),
+                of=2,
+                expect=(("sub.a", _rid("todos", _A, 0), 1),),
+            ),
+            Claim(
+                name="2 of 4 is 0 of 2",
+                queue="q",
+                partitions=(0,),
+                of=2,
+                expect=(("sub.a", _rid("todos", _B, 0), 1),),
+            ),
+        ),
+    ),
     Scenario(
         "retry makes the intent available again after backoff",
         requires=frozenset({"outbox"}),
@@ -803,6 +1356,11 @@ SCENARIOS: tuple[Scenario, ...] = (
     *ATOMICITY,
     *BATCH,
     *READS,
+    *PROJECTIONS,
+    *REFS,
+    *CHANGE_FEED,
+    *AS_OF,
+    *BATCH_READS,
     *HEAD_TIME,
     *INTENTS,
     *ERRORS,
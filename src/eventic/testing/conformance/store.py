@@ -8,7 +8,7 @@ expected outcomes. There are no ``assert`` statements inside this data.
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from uuid import UUID
 
@@ -105,6 +105,74 @@ class Search(Step):
     expect_cursor_none: bool | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class Fields(Step):
+    """Projection reads: ``head_fields`` for one aggregate, or ``search_fields``
+    when ``aggregate_id`` is ``None``. Requires ``projections``."""
+
+    stream: str
+    fields: tuple[str, ...]
+    aggregate_id: UUID | None = None
+    filters: Mapping[str, JsonValue] = field(default_factory=dict[str, JsonValue])
+    limit: int = 100
+    expect_missing: bool = False
+    expect_ids: tuple[UUID, ...] = ()
+    expect_fields: tuple[Payload, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Refs(Step):
+    """``head_refs`` for ``ids`` (any order), or ``search_refs`` with
+    ``filters`` (keyset order) when ``ids`` is empty. Requires
+    ``projections``."""
+
+    stream: str
+    ids: tuple[UUID, ...] = ()
+    filters: Mapping[str, JsonValue] = field(default_factory=dict[str, JsonValue])
+    expect: tuple[tuple[UUID, int, str], ...] = ()  # (aggregate_id, revision, digest)
+
+
+@dataclass(frozen=True, slots=True)
+class Changes(Step):
+    """The change feed in commit order, read whole and then page by page.
+
+    Requires ``change_feed``. Paging with ``page_size`` and resuming from each
+    page's last ``position`` must reproduce the whole read exactly.
+    """
+
+    streams: tuple[str, ...] = ()
+    page_size: int = 1
+    expect: tuple[tuple[str, UUID, int], ...] = ()  # (stream, aggregate_id, revision)
+
+
+@dataclass(frozen=True, slots=True)
+class AsOf(Step):
+    """Point-in-time reads, checked against the aggregate's own history.
+
+    Requires ``point_in_time``. At every revision's ``committed_at``,
+    ``revision_at`` returns the last revision committed by then, and
+    ``search_at`` with ``filters`` finds the aggregate exactly when that
+    revision's document matches. Just before the first commit there is
+    nothing.
+    """
+
+    stream: str
+    aggregate_id: UUID
+    filters: Mapping[str, JsonValue] = field(default_factory=dict[str, JsonValue])
+
+
+@dataclass(frozen=True, slots=True)
+class Revisions(Step):
+    """A batch read, checked against one ``revision`` call per key.
+
+    Requires ``batch_reads``. Every ``(stream, aggregate_id, revision)`` in
+    ``keys`` that exists comes back once, equal to the single read;
+    absent ones are left out.
+    """
+
+    keys: tuple[tuple[str, UUID, int], ...]
+
+
 @dataclass(frozen=True, slots=True)
 class Claim(Step):
     queue: str
@@ -114,6 +182,16 @@ class Claim(Step):
         tuple[str, UUID, int], ...
     ] = ()  # (subscription_id, revision_id, attempts)
     expect_none: bool = False
+    # subscriptions staged with ``inline_payload``: their claims carry the
+    # revision, equal to the one read from the log
+    expect_inline: tuple[str, ...] = ()
+    # claim only these partitions of the queue (requires ``partitions``)
+    partitions: tuple[int, ...] | None = None
+    of: int = 2  # the queue's partition count, for ``partitions``
+    # grouped intents, by ``subscription_id``: the subscriptions still owed
+    expect_owed: Mapping[str, tuple[str, ...]] = field(
+        default_factory=dict[str, tuple[str, ...]]
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -121,6 +199,71 @@ class Settle(Step):
     status: str  # delivered | retry | dead
     available_at: datetime | None = None
     error: str | None = None
+    # per-subscription statuses overriding ``status``, all in one settle call
+    statuses: Mapping[str, str] = field(default_factory=dict[str, str])
+    attempts: int | None = None  # fence every settlement at this attempt
+    subscriptions: tuple[str, ...] | None = None  # narrow a grouped intent
+    split: tuple[str, ...] = ()  # beside a retry: these split off dead
+
+
+@dataclass(frozen=True, slots=True)
+class Extend(Step):
+    """Extend the last claim's leases; ``expect`` of them come back.
+
+    Requires ``lease_extension``. With ``attempts``, the claims are presented
+    at that attempt instead of their own, as a stale holder would.
+    """
+
+    lease: timedelta
+    expect: int
+    attempts: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SettleClaim(Step):
+    """Settle the last claim with ``status`` and claim again, in one call.
+
+    Requires ``pipelined_claims``. ``status`` is ``delivered`` or ``dead``.
+    """
+
+    queue: str
+    status: str = "delivered"
+    limit: int = 10
+    lease: timedelta = timedelta(seconds=1)
+    expect: tuple[tuple[str, UUID, int], ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Acquire(Step):
+    """One holder's turn at a queue's partitions; it ends up with ``expect``.
+
+    Requires ``partitions``. The runner also checks that no two holders in
+    the scenario hold one partition.
+    """
+
+    queue: str
+    holder: str
+    partitions: int
+    expect: int
+    lease: timedelta = timedelta(minutes=1)
+
+
+@dataclass(frozen=True, slots=True)
+class Release(Step):
+    """The holder gives back every partition of the queue."""
+
+    queue: str
+    holder: str
+
+
+@dataclass(frozen=True, slots=True)
+class Renew(Step):
+    """The holder renews its partitions without a turn; it still has ``expect``."""
+
+    queue: str
+    holder: str
+    expect: int
+    lease: timedelta = timedelta(minutes=1)
 
 
 @dataclass(frozen=True, slots=True)
@@ -230,9 +373,22 @@ def commit_step(
     )
 
 
-def intent(subscription_id: str, revision_id: UUID, queue: str = "q") -> IntentRequest:
+def intent(
+    subscription_id: str,
+    revision_id: UUID,
+    queue: str = "q",
+    *,
+    inline_payload: bool = False,
+    partition: int = 0,
+    subscriptions: tuple[str, ...] = (),
+) -> IntentRequest:
     return IntentRequest(
-        subscription_id=subscription_id, revision_id=revision_id, queue=queue
+        subscription_id=subscription_id,
+        revision_id=revision_id,
+        queue=queue,
+        inline_payload=inline_payload,
+        partition=partition,
+        subscriptions=subscriptions,
     )
 
 
@@ -13,26 +13,46 @@ import time
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
 from eventic.errors import EventicError, RevisionConflict
 from eventic.ids import AggregateKey
 from eventic.jsonx import JsonObject
-from eventic.protocols import Capabilities, Store
+from eventic.protocols import (
+    BatchReads,
+    Capabilities,
+    ChangeFeed,
+    LeaseExtension,
+    PartitionedClaims,
+    PipelinedClaims,
+    PointInTimeReads,
+    ProjectionReads,
+    Store,
+)
 from eventic.testing.conformance import scenarios as scenario_data
 from eventic.testing.conformance.store import (
+    Acquire,
+    AsOf,
     Batch,
+    Changes,
     Claim,
     Commit,
     ConcurrentDrainers,
     Exact,
+    Extend,
+    Fields,
     Head,
     History,
     Race,
+    Refs,
+    Release,
+    Renew,
+    Revisions,
     Scenario,
     Search,
     Settle,
+    SettleClaim,
     Step,
     Time,
     Wait,
@@ -68,6 +88,8 @@ class _Context:
     def __init__(self) -> None:
         self.last_claimed: list[ClaimedIntent] = []
         self.last_commit_stamps: set[datetime] = set()
+        # (queue, holder) -> its partitions and when their lease runs out
+        self.held: dict[tuple[str, str], tuple[set[int], datetime]] = {}
 
 
 def _capability_names(caps: Capabilities) -> frozenset[str]:
@@ -92,6 +114,29 @@ def _to_request(commit: Commit) -> CommitRequest:
     )
 
 
+def _check_inline(store: Store, claimed: ClaimedIntent) -> None:
+    if claimed.stored is None or claimed.aggregate_id is None:
+        raise StepFailure(f"{claimed.subscription_id}: claim carries no revision")
+    logged = store.revision(
+        AggregateKey(claimed.stream, claimed.aggregate_id), claimed.revision
+    )
+    if logged is None:
+        raise StepFailure(f"{claimed.subscription_id}: no log revision")
+    for name in (
+        "revision_id",
+        "kind",
+        "schema_version",
+        "payload",
+        "digest",
+        "meta",
+        "committed_at",
+    ):
+        if getattr(claimed.stored, name) != getattr(logged, name):
+            raise StepFailure(
+                f"{claimed.subscription_id}: inline {name} differs from the log"
+            )
+
+
 def _check_revision(
     expected: StoredRevision | None,
     *,
@@ -241,20 +286,59 @@ def _run_step(store: Store, ctx: _Context, step: Step) -> None:
                 raise StepFailure("search cursor mismatch")
         return
 
+    if isinstance(step, Fields):
+        _run_fields(cast(ProjectionReads, store), step)
+        return
+
+    if isinstance(step, Refs):
+        _run_refs(cast(ProjectionReads, store), step)
+        return
+
+    if isinstance(step, Changes):
+        _run_changes(cast(ChangeFeed, store), step)
+        return
+
+    if isinstance(step, AsOf):
+        _run_as_of(store, step)
+        return
+
+    if isinstance(step, Revisions):
+        _run_revisions(store, step)
+        return
+
     if isinstance(step, Claim):
-        claimed = list(store.claim(step.queue, limit=step.limit, lease=step.lease))
-        ctx.last_claimed = claimed
+        if step.partitions is None:
+            claimed = list(store.claim(step.queue, limit=step.limit, lease=step.lease))
+        else:
+            claimed = list(
+                cast(PartitionedClaims, store).claim_partitions(
+                    step.queue,
+                    step.partitions,
+                    of=step.of,
+                    limit=step.limit,
+                    lease=step.lease,
+                )
+            )
         if step.expect_none:
             if claimed:
                 raise StepFailure(
                     f"claim returned {len(claimed)} intents, expected none"
                 )
             return
+        ctx.last_claimed = claimed
         got = {(c.subscription_id, c.revision_id, c.attempts) for c in claimed}
         if got != set(step.expect):
             raise StepFailure(f"claimed {got} != expected {set(step.expect)}")
         if any(not isinstance(c.intent_id, UUID) for c in claimed):  # type: ignore[reportUnnecessaryIsInstance]
             raise StepFailure("intent_id is not a UUID")
+        for c in claimed:
+            if c.subscription_id in step.expect_inline:
+                _check_inline(store, c)
+            owed = step.expect_owed.get(c.subscription_id, ())
+            if c.subscriptions != owed:
+                raise StepFailure(
+                    f"{c.subscription_id} owes {c.subscriptions}, expected {owed}"
+                )
         return
 
     if isinstance(step, Settle):
@@ -262,20 +346,105 @@ def _run_step(store: Store, ctx: _Context, step: Step) -> None:
         if not claimed:
             raise StepFailure("settle with nothing claimed")
         available_at = step.available_at
-        if step.status == "retry" and available_at is None:
+        if available_at is None:
             available_at = datetime.now(UTC) + timedelta(minutes=1)
-        settlements = [
-            Settlement(
-                intent_id=c.intent_id,
-                status=step.status,  # type: ignore[arg-type]
-                available_at=available_at,
-                error=step.error,
+        settlements: list[Settlement] = []
+        for c in claimed:
+            status = step.statuses.get(c.subscription_id, step.status)
+            settlements.append(
+                Settlement(
+                    intent_id=c.intent_id,
+                    status=status,  # type: ignore[arg-type]
+                    available_at=available_at if status == "retry" else None,
+                    error=step.error,
+                    attempts=step.attempts,
+                    subscriptions=step.subscriptions,
+                )
             )
-            for c in claimed
-        ]
+            if step.split:
+                settlements.append(
+                    Settlement(
+                        intent_id=c.intent_id,
+                        status="dead",
+                        error=step.error,
+                        attempts=step.attempts,
+                        subscriptions=step.split,
+                        split=True,
+                    )
+                )
         store.settle(settlements)
         return
 
+    if isinstance(step, Extend):
+        held = [
+            c
+            if step.attempts is None
+            else dataclasses.replace(c, attempts=step.attempts)
+            for c in ctx.last_claimed
+        ]
+        extended = cast(LeaseExtension, store).extend(held, lease=step.lease)
+        if len(extended) != step.expect:
+            raise StepFailure(
+                f"extended {len(extended)} leases, expected {step.expect}"
+            )
+        return
+
+    if isinstance(step, Acquire):
+        now = datetime.now(UTC)
+        held = set(
+            cast(PartitionedClaims, store).acquire_partitions(
+                step.queue,
+                partitions=step.partitions,
+                holder=step.holder,
+                lease=step.lease,
+            )
+        )
+        if len(held) != step.expect or not held <= set(range(step.partitions)):
+            raise StepFailure(
+                f"holder got partitions {sorted(held)}, expected {step.expect}"
+            )
+        ctx.held[(step.queue, step.holder)] = (held, now + step.lease)
+        for (queue, holder), (theirs, until) in ctx.held.items():
+            live = queue == step.queue and holder != step.holder and until > now
+            if live and held & theirs:
+                raise StepFailure(f"partitions {sorted(held & theirs)} held twice")
+        return
+
+    if isinstance(step, Release):
+        cast(PartitionedClaims, store).release_partitions(
+            step.queue, holder=step.holder
+        )
+        ctx.held.pop((step.queue, step.holder), None)
+        return
+
+    if isinstance(step, Renew):
+        now = datetime.now(UTC)
+        held = set(
+            cast(PartitionedClaims, store).renew_partitions(
+                step.queue, holder=step.holder, lease=step.lease
+            )
+        )
+        if len(held) != step.expect:
+            raise StepFailure(f"holder kept partitions {sorted(held)}")
+        ctx.held[(step.queue, step.holder)] = (held, now + step.lease)
+        return
+
+    if isinstance(step, SettleClaim):
+        settlements = [
+            Settlement(intent_id=c.intent_id, status=step.status)  # type: ignore[arg-type]
+            for c in ctx.last_claimed
+        ]
+        claimed = list(
+            cast(PipelinedClaims, store).settle_and_claim(
+                settlements, step.queue, limit=step.limit, lease=step.lease
+            )
+        )
+        ctx.last_claimed = claimed
+        got = {(c.subscription_id, c.revision_id, c.attempts) for c in claimed}
+        if got != set(step.expect):
+            raise StepFailure(f"claimed {got} != expected {set(step.expect)}")
+        return
+
     if isinstance(step, Wait):
         time.sleep(step.seconds)
         return
@@ -295,6 +464,128 @@ def _run_step(store: Store, ctx: _Context, step: Step) -> None:
     raise StepFailure(f"unknown step op {type(step).__name__}")
 
 
+def _run_fields(store: ProjectionReads, step: Fields) -> None:
+    if step.aggregate_id is not None:
+        value = store.head_fields(
+            AggregateKey(step.stream, step.aggregate_id), step.fields
+        )
+        if step.expect_missing:
+            if value is not None:
+                raise StepFailure("expected no projection, got one")
+            return
+        if value is None:
+            raise StepFailure("expected a projection, got none")
+        items = (value,)
+    else:
+        page = store.search_fields(
+            step.stream,
+            dict(step.filters),
+            fields=step.fields,
+            cursor=None,
+            limit=step.limit,
+        )
+        items = page.items
+        ids = tuple(item.aggregate_id for item in items)
+        if ids != step.expect_ids:
+            raise StepFailure(f"search_fields ids {ids} != {step.expect_ids}")
+    got = tuple(item.fields for item in items)
+    if step.expect_fields and got != step.expect_fields:
+        raise StepFailure(f"fields {got!r} != expected {step.expect_fields!r}")
+
+
+def _run_refs(store: ProjectionReads, step: Refs) -> None:
+    if step.ids:
+        refs = store.head_refs(step.stream, step.ids)
+        got = {(r.aggregate_id, r.revision, r.digest) for r in refs}
+        if len(got) != len(refs) or got != set(step.expect):
+            raise StepFailure(f"head_refs {sorted(got)} != {sorted(step.expect)}")
+        return
+    page = store.search_refs(step.stream, dict(step.filters), cursor=None, limit=100)
+    ordered = tuple((r.aggregate_id, r.revision, r.digest) for r in page.items)
+    if ordered != step.expect:
+        raise StepFailure(f"search_refs {ordered} != {step.expect}")
+
+
+def _run_changes(store: ChangeFeed, step: Changes) -> None:
+    whole = store.changes(None, streams=step.streams, limit=1000).items
+    got = tuple((c.stream, c.aggregate_id, c.revision) for c in whole)
+    if got != step.expect:
+        raise StepFailure(f"changes {got} != expected {step.expect}")
+    paged: list[str] = []
+    after: str | None = None
+    for _ in range(len(whole) + 1):
+        page = store.changes(after, streams=step.streams, limit=step.page_size)
+        paged.extend(c.position for c in page.items)
+        if not page.items:
+            break
+        after = page.items[-1].position
+    if paged != [c.position for c in whole]:
+        raise StepFailure("resuming from positions did not reproduce the feed")
+
+
+def _run_as_of(store: Store, step: AsOf) -> None:
+    from eventic.paths import matches
+
+    key = AggregateKey(step.stream, step.aggregate_id)
+    history = store.history(key, after=-1, limit=1000).items
+    if not history:
+        raise StepFailure("no revisions to read as of")
+    reads = cast(PointInTimeReads, store)
+    before = history[0].committed_at - timedelta(microseconds=1)
+    if reads.revision_at(key, before) is not None:
+        raise StepFailure("revision_at found a revision before the first commit")
+    for item in history:
+        expected = [r for r in history if r.committed_at <= item.committed_at][-1]
+        got = reads.revision_at(key, item.committed_at)
+        if got is None:
+            raise StepFailure(f"revision_at({item.committed_at!r}) found nothing")
+        if (got.revision, got.digest) != (expected.revision, expected.digest):
+            raise StepFailure(
+                f"revision_at({item.committed_at!r}) returned revision "
+                f"{got.revision}, expected {expected.revision}"
+            )
+        if got.payload != expected.payload:
+            raise StepFailure(f"revision_at payload differs at {got.revision}")
+        page = reads.search_at(
+            step.stream,
+            dict(step.filters),
+            as_of=item.committed_at,
+            cursor=None,
+            limit=1000,
+        )
+        found = [r for r in page.items if r.aggregate_id == step.aggregate_id]
+        if bool(found) != matches(expected.payload, step.filters):
+            raise StepFailure(
+                f"search_at at revision {expected.revision}: found={bool(found)}"
+            )
+        if found and found[0].payload != expected.payload:
+            raise StepFailure("search_at returned a different document")
+
+
+def _run_revisions(store: Store, step: Revisions) -> None:
+    keys = [(AggregateKey(s, a), r) for s, a, r in step.keys]
+    got = cast(BatchReads, store).revisions(keys)
+    by_key = {(r.stream, r.aggregate_id, r.revision): r for r in got}
+    if len(by_key) != len(got):
+        raise StepFailure("revisions returned a revision twice")
+    expected = {
+        (key.stream, key.aggregate_id, revision): single
+        for key, revision in keys
+        if (single := store.revision(key, revision)) is not None
+    }
+    if set(by_key) != set(expected):
+        raise StepFailure(f"revisions returned {sorted(by_key)} != {sorted(expected)}")
+    for at, single in expected.items():
+        batched = by_key[at]
+        if (batched.payload, batched.digest, batched.kind, batched.changed) != (
+            single.payload,
+            single.digest,
+            single.kind,
+            single.changed,
+        ):
+            raise StepFailure(f"revisions differs from revision at {at}")
+
+
 def _run_time(store: Store, ctx: _Context, step: Time) -> None:
     page = store.history(
         AggregateKey(step.stream, step.aggregate_id),
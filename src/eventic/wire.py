@@ -20,11 +20,18 @@ EncodingId = Literal["snapshot/1", "delta/1"]
 
 @dataclass(frozen=True, slots=True)
 class IntentRequest:
-    """One durable delivery intent owed to a subscription."""
+    """One durable delivery intent owed to a subscription.
+
+    A grouped intent (``Outbox(grouped=True)``) is one row owed to every
+    subscription in ``subscriptions``; ``subscription_id`` is the first.
+    """
 
     subscription_id: str
     revision_id: UUID
     queue: str
+    inline_payload: bool = False  # carry the revision itself in the intent row
+    partition: int = 0  # the aggregate's partition of ``queue``
+    subscriptions: tuple[str, ...] = ()  # grouped: every subscription owed
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,6 +49,9 @@ class CommitRequest:
     meta_version: int
     fingerprint: str
     intents: tuple[IntentRequest, ...] = field(default_factory=tuple)
+    # Top-level keys that differ from the previous revision, sorted; ``None``
+    # when the writer did not compute them.
+    changed: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -72,12 +82,61 @@ class StoredRevision:
     digest: str
     meta: JsonObject
     committed_at: datetime
+    changed: frozenset[str] | None = None  # as recorded at commit, if it was
+
+
+@dataclass(frozen=True, slots=True)
+class StoredProjection:
+    """Selected paths of a head document, extracted by the store.
+
+    ``fields`` maps each requested path to its JSON value; a path absent from
+    the document is absent from ``fields`` (JSON null is present, as ``None``).
+    """
+
+    stream: str
+    aggregate_id: UUID
+    revision: int
+    revision_id: UUID
+    schema_version: int
+    digest: str
+    committed_at: datetime
+    fields: JsonObject
+
+
+@dataclass(frozen=True, slots=True)
+class HeadRef:
+    """A head's identity and version, without its document."""
+
+    aggregate_id: UUID
+    revision: int
+    digest: str
+
+
+@dataclass(frozen=True, slots=True)
+class StoredChange:
+    """One log row in global commit order, without its document.
+
+    ``position`` is opaque: pass it back as ``after`` to resume after it.
+    """
+
+    position: str
+    stream: str
+    aggregate_id: UUID
+    revision: int
+    revision_id: UUID
+    kind: str
+    digest: str
+    committed_at: datetime
+    changed: frozenset[str] | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class ClaimedIntent:
     """A leased intent claimed by a worker, with enough to reconstruct the
-    commit: the aggregate key is joined from the log row."""
+    commit: the aggregate key is copied onto the intent row when it is
+    staged. ``stored`` is the revision itself when the intent was staged
+    with ``inline_payload``; ``subscriptions`` is what a grouped intent
+    still owes."""
 
     intent_id: UUID
     subscription_id: str
@@ -87,13 +146,27 @@ class ClaimedIntent:
     stream: str = ""
     aggregate_id: UUID | None = None
     revision: int = -1
+    stored: StoredRevision | None = None
+    subscriptions: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
 class Settlement:
-    """The outcome of one claimed delivery, applied in a short transaction."""
+    """The outcome of one claimed delivery, applied in a short transaction.
+
+    With ``attempts`` — the claim's — it is fenced: it applies only while the
+    intent is still at that attempt, never after another drainer re-claimed it.
+    A retry or death of a grouped intent may narrow it to ``subscriptions``,
+    the ones still owed; ``None`` keeps the set it has. A death with
+    ``split`` moves its ``subscriptions`` off the intent into a dead intent
+    of their own, beside a retry of the same intent in the same settle that
+    keeps the rest.
+    """
 
     intent_id: UUID
     status: Literal["delivered", "retry", "dead"]
     available_at: datetime | None = None
     error: str | None = None
+    attempts: int | None = None
+    subscriptions: tuple[str, ...] | None = None
+    split: bool = False
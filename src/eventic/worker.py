@@ -6,68 +6,264 @@ must be idempotent. The worker holds no database lock while user code runs.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
+import os
+import socket
 import threading
-from dataclasses import dataclass
+import time
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, cast
+from uuid import UUID, uuid4
 
 from eventic.app import App
 from eventic.envelopes import Commit
-from eventic.errors import DeliveryError
+from eventic.errors import (
+    CapabilityUnsupported,
+    DeliveryError,
+    EventicError,
+    UsageError,
+)
 from eventic.hydration import hydrate
 from eventic.ids import AggregateKey
-from eventic.jsonx import JsonObject
+from eventic.pacing import batch_size, next_wait, per_intent, weighted_turn
 from eventic.planning import changed_keys
-from eventic.protocols import Store
+from eventic.protocols import (
+    BatchReads,
+    LeaseExtension,
+    PartitionedClaims,
+    PipelinedClaims,
+    Store,
+    Wakeups,
+)
 from eventic.retry import disposition
 from eventic.stream import Stream
-from eventic.wire import ClaimedIntent, Settlement
+from eventic.subscription import (
+    AnySubscription,
+    AsyncSubscription,
+    BatchSubscription,
+    Outbox,
+)
+from eventic.wire import ClaimedIntent, Settlement, StoredRevision
 
 logger = logging.getLogger("eventic.worker")
 
+_STOP_SLICE = 0.1  # seconds; a parked worker rechecks the stop flag this often
+
 
 @dataclass
 class WorkerReport:
-    claimed: int = 0
+    claimed: int = 0  # intent rows, as the limit counts them
     delivered: int = 0
     retried: int = 0
     dead_lettered: int = 0
+    limit: int = 0  # the claim limit this batch was drained with
+    seconds: float = 0.0  # wall time spent delivering, settle excluded
+    lost: int = 0  # skipped: the heartbeat found the lease taken over
+    coalesced: int = 0  # settled undelivered: a newer revision stood in
+    queue: str = ""  # the queue the batch was claimed from
+    # Reports spanning several queues: one per queue, summed above.
+    by_queue: dict[str, WorkerReport] = field(default_factory=dict[str, "WorkerReport"])
+
+    @classmethod
+    def combine(cls, reports: Iterable[WorkerReport]) -> WorkerReport:
+        """The reports' counts added up, and per queue when there are several."""
+        total = cls()
+        for report in reports:
+            total._add(report)
+            for queue, part in (report.by_queue or {report.queue: report}).items():
+                total.by_queue.setdefault(queue, cls(queue=queue))._add(part)
+        if len(total.by_queue) == 1:
+            (total.queue,) = total.by_queue
+            total.by_queue = {}
+        return total
+
+    def _add(self, other: WorkerReport) -> None:
+        self.claimed += other.claimed
+        self.delivered += other.delivered
+        self.retried += other.retried
+        self.dead_lettered += other.dead_lettered
+        self.limit += other.limit
+        self.seconds += other.seconds
+        self.lost += other.lost
+        self.coalesced += other.coalesced
+
+
+@dataclass
+class _Batch:
+    """One claimed batch's revisions, read together, and the ``Commit``
+    envelopes built from them, shared by every subscription on a revision."""
+
+    revisions: dict[tuple[str, UUID, int], StoredRevision] = field(
+        default_factory=dict[tuple[str, UUID, int], StoredRevision]
+    )
+    commits: dict[tuple[str, UUID, int], Commit[Any, Any]] = field(
+        default_factory=dict[tuple[str, UUID, int], Commit[Any, Any]]
+    )
+    lost: set[UUID] = field(default_factory=set[UUID])  # leases taken over
+    # A coalesced intent's id -> the older intents it stands in for, leased
+    # and heartbeaten with the batch until they settle with it.
+    absorbed: dict[UUID, list[ClaimedIntent]] = field(
+        default_factory=dict[UUID, list[ClaimedIntent]]
+    )
+
+
+def _tally(report: WorkerReport, lane: WorkerReport) -> None:
+    """A lane's outcomes into its batch's report."""
+    report.delivered += lane.delivered
+    report.retried += lane.retried
+    report.dead_lettered += lane.dead_lettered
+    report.lost += lane.lost
+
+
+def _fanned(claimed: Sequence[ClaimedIntent]) -> list[ClaimedIntent]:
+    """A grouped intent as one claim per subscription it still owes; each
+    settles for its own subscription until :func:`_merged`."""
+    fanned: list[ClaimedIntent] = []
+    for intent in claimed:
+        if not intent.subscriptions:
+            fanned.append(intent)
+            continue
+        fanned.extend(
+            dataclasses.replace(intent, subscription_id=sub, subscriptions=(sub,))
+            for sub in intent.subscriptions
+        )
+    return fanned
+
 
+def _merged(settlements: Sequence[Settlement]) -> list[Settlement]:
+    """One settlement per grouped intent, from its subscriptions' own.
 
-class Worker:
-    """Drains one queue; ``drain_once`` is one claim/deliver/settle batch."""
+    Delivered subscriptions drop out. The intent is delivered when all of
+    them were, and dead when every one that failed is. Otherwise it retries
+    those to retry, at the earliest retry of any, and the dead ones split
+    off into a dead intent of their own, so none is delivered past its
+    ``max_attempts`` and redrive still finds it.
+    """
+    merged = [s for s in settlements if s.subscriptions is None]
+    groups: dict[UUID, list[Settlement]] = {}
+    for settlement in settlements:
+        if settlement.subscriptions is not None:
+            groups.setdefault(settlement.intent_id, []).append(settlement)
+    for parts in groups.values():
+        failed = [s for s in parts if s.status != "delivered"]
+        if not failed:
+            merged.append(dataclasses.replace(parts[0], subscriptions=None))
+            continue
+        retries = [s for s in failed if s.status == "retry"]
+        dead = tuple(
+            sub for s in failed if s.status == "dead" for sub in s.subscriptions or ()
+        )
+        if not retries:
+            merged.append(dataclasses.replace(failed[0], subscriptions=dead))
+            continue
+        lead = min(
+            retries,
+            key=lambda s: s.available_at or datetime.max.replace(tzinfo=UTC),
+        )
+        owed = tuple(sub for s in retries for sub in s.subscriptions or ())
+        merged.append(dataclasses.replace(lead, subscriptions=owed))
+        if dead:
+            first = next(s for s in failed if s.status == "dead")
+            merged.append(dataclasses.replace(first, subscriptions=dead, split=True))
+    return merged
+
+
+def _covered(settlements: Sequence[Settlement], batch: _Batch) -> list[Settlement]:
+    """The coalesced intents, each settled as the newer one standing in for
+    it was: a retry redelivers them together, ``changed`` widened again."""
+    return [
+        dataclasses.replace(
+            settlement,
+            intent_id=older.intent_id,
+            attempts=older.attempts,
+            subscriptions=older.subscriptions or None,
+        )
+        for settlement in settlements
+        for older in batch.absorbed.get(settlement.intent_id, ())
+    ]
+
+
+def _weights(queue: str, queues: Mapping[str, int] | None) -> dict[str, int]:
+    if queues is None:
+        return {queue: 1}
+    if queue != "default":
+        raise UsageError("pass queue or queues, not both")
+    return dict(queues)
+
+
+def _key_order(item: tuple[AggregateKey, int]) -> tuple[str, str, int]:
+    key, revision = item
+    return key.stream, str(key.aggregate_id), revision
+
+
+class _Drainer:
+    """What both workers share: pacing, lanes, and the per-intent outcomes."""
 
     def __init__(
         self,
         app: App,
         store: Store,
         *,
-        queue: str = "default",
-        lease: timedelta = timedelta(seconds=30),
-        batch_size: int = 100,
+        queues: Mapping[str, int],
+        lease: timedelta,
+        batch_size: int,
+        adaptive_batch: bool,
+        concurrency: int,
+        pipelined: bool,
+        heartbeat: timedelta | None,
     ) -> None:
+        if not queues:
+            raise UsageError("a worker needs at least one queue")
+        if any(weight < 1 for weight in queues.values()):
+            raise UsageError("queue weights must be >= 1")
+        if concurrency < 1:
+            raise UsageError("concurrency must be >= 1")
+        if pipelined and not store.capabilities.pipelined_claims:
+            raise CapabilityUnsupported(
+                "this store lacks the pipelined_claims capability"
+            )
+        if heartbeat is not None:
+            if not store.capabilities.lease_extension:
+                raise CapabilityUnsupported(
+                    "this store lacks the lease_extension capability"
+                )
+            if not timedelta(0) < heartbeat < lease:
+                raise UsageError("heartbeat must be positive and shorter than lease")
+        self._partitions = {
+            sub.delivery.queue: sub.delivery.partitions
+            for sub in app.subscriptions
+            if isinstance(sub.delivery, Outbox)
+            and sub.delivery.queue in queues
+            and sub.delivery.partitions > 1
+        }
+        if self._partitions and not store.capabilities.partitions:
+            raise CapabilityUnsupported("this store lacks the partitions capability")
+        # Names this worker's partition leases; unique per worker object.
+        self._holder = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
         self._app = app
         self._store = store
-        self._queue = queue
+        self._weights = dict(queues)
+        self._credit: dict[str, int] = {}
+        self._waits = dict.fromkeys(self._weights, timedelta(0))
+        self._ready_at = dict.fromkeys(self._weights, 0.0)  # monotonic seconds
         self._lease = lease
         self._batch_size = batch_size
-        self._subscriptions = {sub.id: sub for sub in app.subscriptions}
+        self._adaptive_batch = adaptive_batch
+        self._concurrency = concurrency
+        self._pipelined = pipelined
+        self._heartbeat = heartbeat
+        self._per_intent: float | None = None
+        self._subscriptions: dict[str, AnySubscription] = {
+            sub.id: sub for sub in app.subscriptions
+        }
         self._stop = threading.Event()
 
-    def drain_once(self) -> WorkerReport:
-        claimed = self._store.claim(
-            self._queue, limit=self._batch_size, lease=self._lease
-        )
-        if not claimed:
-            return WorkerReport()
-        report = WorkerReport(claimed=len(claimed))
-        settlements: list[Settlement] = []
-        for intent in claimed:
-            self._deliver(intent, settlements, report)
-        self._store.settle(settlements)
-        return report
-
     def stop(self) -> None:
         """Signal ``run_forever`` to return after the current drain.
 
@@ -76,71 +272,411 @@ class Worker:
         """
         self._stop.set()
 
-    def run_forever(self, *, poll: timedelta = timedelta(seconds=1)) -> None:
-        """Drain in a loop; returns when :meth:`stop` is called.
+    def _limit(self) -> int:
+        if not self._adaptive_batch:
+            return self._batch_size
+        return batch_size(self._per_intent, self._lease, ceiling=self._batch_size)
 
-        The stop flag is checked before each drain, and the sleep is an
-        ``Event.wait``, so ``stop()`` takes effect within ``poll`` even when
-        the worker is between drains.
+    def _measured(self, report: WorkerReport, started: float) -> None:
+        report.seconds = time.monotonic() - started
+        self._per_intent = per_intent(self._per_intent, report.claimed, report.seconds)
+
+    def _claim(
+        self, queue: str, pending: Sequence[Settlement], limit: int
+    ) -> Sequence[ClaimedIntent]:
+        """The next batch, settling ``pending`` in the same transaction.
+
+        A partitioned queue settles first: this turn may give partitions
+        back, and none may go while an intent of theirs is in hand.
+        """
+        if queue in self._partitions:
+            if pending:
+                self._store.settle(pending)
+            partitioned = cast(PartitionedClaims, self._store)
+            held = partitioned.acquire_partitions(
+                queue,
+                partitions=self._partitions[queue],
+                holder=self._holder,
+                lease=self._lease,
+            )
+            return partitioned.claim_partitions(
+                queue,
+                held,
+                of=self._partitions[queue],
+                limit=limit,
+                lease=self._lease,
+            )
+        if pending:
+            return cast(PipelinedClaims, self._store).settle_and_claim(
+                pending, queue, limit=limit, lease=self._lease
+            )
+        return self._store.claim(queue, limit=limit, lease=self._lease)
+
+    def _release(self) -> None:
+        """Give back this worker's partitions so the others take them now,
+        not when the leases run out."""
+        for queue in self._partitions:
+            try:
+                cast(PartitionedClaims, self._store).release_partitions(
+                    queue, holder=self._holder
+                )
+            except EventicError as exc:
+                logger.warning("partition release failed: %s", exc)
+
+    def _start(self, floor: timedelta) -> None:
+        """Every queue ready now, each backing off from ``floor``."""
+        self._waits = dict.fromkeys(self._weights, floor)
+        self._ready_at = dict.fromkeys(self._weights, 0.0)
+
+    def _turn(self) -> str:
+        """The next queue to drain, by weight among the ready ones.
+
+        A queue that came back empty is not ready until its backoff runs
+        out. If none is ready, the one due first goes.
+        """
+        now = time.monotonic()
+        ready = [q for q, at in self._ready_at.items() if at <= now]
+        if not ready:
+            ready = [min(self._ready_at, key=self._ready_at.__getitem__)]
+        queue, self._credit = weighted_turn(self._weights, self._credit, ready)
+        return queue
+
+    def _paced(
+        self, report: WorkerReport, *, floor: timedelta, ceiling: timedelta
+    ) -> timedelta:
+        """Back the drained queue off by its own last batch; the wait until
+        any queue is ready again."""
+        queue = report.queue
+        self._waits[queue] = next_wait(
+            report.claimed,
+            report.limit,
+            self._waits[queue],
+            floor=floor,
+            ceiling=ceiling,
+        )
+        now = time.monotonic()
+        self._ready_at[queue] = now + self._waits[queue].total_seconds()
+        return timedelta(seconds=max(0.0, min(self._ready_at.values()) - now))
+
+    def _carry(self, wait: timedelta) -> bool:
+        """Hold a batch's settlements for the next claim?
+
+        Only when pipelined, and only straight into another drain: never
+        across a wait, where held leases would run down.
         """
+        return self._pipelined and not wait
+
+    @contextmanager
+    def _heartbeats(
+        self, claimed: Sequence[ClaimedIntent], batch: _Batch
+    ) -> Generator[None]:
+        """Renew the batch's leases every ``heartbeat`` while it is delivered,
+        and on a partitioned queue this worker's partitions with them.
+
+        An intent whose lease was taken over goes to ``batch.lost``; it is
+        skipped if not yet delivered, and its settlement is fenced off.
+        """
+        if self._heartbeat is None:
+            yield
+            return
+        extension = cast(LeaseExtension, self._store)
+        interval = self._heartbeat.total_seconds()
+        queue = claimed[0].queue if claimed else ""
+        done = threading.Event()
+
+        def beat() -> None:
+            while not done.wait(interval):
+                if queue in self._partitions:
+                    try:
+                        cast(PartitionedClaims, self._store).renew_partitions(
+                            queue, holder=self._holder, lease=self._lease
+                        )
+                    except EventicError as exc:
+                        logger.warning("partition heartbeat failed: %s", exc)
+                held = [c for c in claimed if c.intent_id not in batch.lost]
+                try:
+                    extended = set(extension.extend(held, lease=self._lease))
+                except EventicError as exc:
+                    # The next beat retries; the lease may still run out.
+                    logger.warning("lease heartbeat failed: %s", exc)
+                    continue
+                batch.lost.update(
+                    c.intent_id for c in held if c.intent_id not in extended
+                )
+
+        thread = threading.Thread(target=beat, name="eventic-heartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def _wakeups(self) -> Wakeups | None:
+        if not self._store.capabilities.wakeups:
+            return None
+        wakeups = cast(Wakeups, self._store)
+        # Subscribe before the first drain so no commit falls in between.
+        # A store that cannot subscribe yet is polled; ``_park`` tries again.
+        for queue in self._weights:
+            try:
+                wakeups.wait_for_intents(queue, timeout=timedelta(0))
+            except EventicError as exc:
+                logger.warning("wakeup subscribe failed, polling: %s", exc)
+                break
+        return wakeups
+
+    def _park(self, wakeups: Wakeups | None, wait: timedelta) -> None:
+        """Wait for a wakeup or ``wait``, in slices so ``stop()`` stays prompt.
+
+        A wakeup makes its queue ready at once, backoff or not. A failed
+        wait is logged and the rest of ``wait`` is slept out instead, so a
+        lost listener slows the worker to polling rather than stopping it.
+        """
+        deadline = time.monotonic() + wait.total_seconds()
         while not self._stop.is_set():
-            self.drain_once()
-            self._stop.wait(poll.total_seconds())
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if wakeups is None:
+                self._stop.wait(remaining)
+                return
+            share = min(remaining, _STOP_SLICE) / len(self._weights)
+            for queue in self._weights:
+                try:
+                    woken = wakeups.wait_for_intents(
+                        queue, timeout=timedelta(seconds=share)
+                    )
+                except EventicError as exc:
+                    logger.warning("wakeup wait failed, polling: %s", exc)
+                    self._stop.wait(max(deadline - time.monotonic(), 0.0))
+                    return
+                if woken:
+                    self._ready_at[queue] = 0.0
+                    return
 
-    # -- internals -----------------------------------------------------------
+    def _lanes(self, claimed: Sequence[ClaimedIntent]) -> list[list[ClaimedIntent]]:
+        """Claimed intents by ``(subscription_id, aggregate_id)``, in revision
+        order within each lane. A batch subscription is one lane."""
+        lanes: dict[tuple[str, UUID | None], list[ClaimedIntent]] = {}
+        for intent in claimed:
+            aggregate = None if self._batched(intent) else intent.aggregate_id
+            lanes.setdefault((intent.subscription_id, aggregate), []).append(intent)
+        return [sorted(lane, key=lambda i: i.revision) for lane in lanes.values()]
 
-    def _deliver(
+    def _batched(self, intent: ClaimedIntent) -> BatchSubscription[Any, Any] | None:
+        subscription = self._subscriptions.get(intent.subscription_id)
+        return subscription if isinstance(subscription, BatchSubscription) else None
+
+    def _deliver_group(
+        self,
+        subscription: BatchSubscription[Any, Any],
+        intents: Sequence[ClaimedIntent],
+        batch: _Batch,
+        settlements: list[Settlement],
+        report: WorkerReport,
+    ) -> None:
+        """One batch subscription's intents, ``max_batch`` to a handler call;
+        each outcome settles its own intent."""
+        for start in range(0, len(intents), subscription.max_batch):
+            ready: list[ClaimedIntent] = []
+            commits: list[Commit[Any, Any]] = []
+            for intent in intents[start : start + subscription.max_batch]:
+                if intent.intent_id in batch.lost:
+                    report.lost += 1
+                    continue
+                try:
+                    commits.append(
+                        self._reconstruct(subscription.stream, intent, batch)
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    self._retry_or_dead(subscription, intent, settlements, report, exc)
+                    continue
+                ready.append(intent)
+            if not ready:
+                continue
+            try:
+                outcomes = subscription.handler(commits)
+                if outcomes is None:
+                    outcomes = [None] * len(ready)
+                elif len(outcomes) != len(ready):
+                    raise DeliveryError(
+                        f"batch handler returned {len(outcomes)} outcomes "
+                        f"for {len(ready)} commits"
+                    )
+            except Exception as exc:  # noqa: BLE001
+                outcomes = [exc] * len(ready)
+            for intent, outcome in zip(ready, outcomes, strict=True):
+                if outcome is None:
+                    self._delivered(intent, settlements, report)
+                else:
+                    self._retry_or_dead(
+                        subscription, intent, settlements, report, outcome
+                    )
+
+    def _delivered(
         self, intent: ClaimedIntent, settlements: list[Settlement], report: WorkerReport
     ) -> None:
-        subscription = self._subscriptions.get(intent.subscription_id)
-        if subscription is None:
-            self._dead_letter(
-                intent,
-                settlements,
-                report,
-                DeliveryError(f"unknown subscription {intent.subscription_id}"),
+        settlements.append(
+            Settlement(
+                intent_id=intent.intent_id,
+                status="delivered",
+                attempts=intent.attempts,
+                subscriptions=intent.subscriptions or None,
             )
-            return
-        try:
-            commit = self._reconstruct(subscription.stream, intent)
-            subscription.handler(commit)
-        except Exception as exc:  # noqa: BLE001
-            self._retry_or_dead(subscription, intent, settlements, report, exc)
-            return
-        settlements.append(Settlement(intent_id=intent.intent_id, status="delivered"))
+        )
         report.delivered += 1
 
+    def _unknown(
+        self, intent: ClaimedIntent, settlements: list[Settlement], report: WorkerReport
+    ) -> None:
+        self._dead_letter(
+            intent,
+            settlements,
+            report,
+            DeliveryError(f"unknown subscription {intent.subscription_id}"),
+        )
+
+    def _prefetch(self, claimed: Sequence[ClaimedIntent]) -> _Batch:
+        """Every revision the batch needs, in one read.
+
+        Intents that carry their revision are not read at all. Predecessors
+        are read in a second read, and only for revisions written without
+        their changed keys. A read that fails leaves its revisions to be read
+        one by one at delivery, so a row that cannot be read or decoded
+        fails only its own intents.
+        """
+        if not self._store.capabilities.batch_reads:
+            return _Batch()
+        reads = cast(BatchReads, self._store)
+        keys = {
+            (AggregateKey(intent.stream, intent.aggregate_id), intent.revision)
+            for intent in claimed
+            if intent.stored is None
+            and intent.aggregate_id is not None
+            and intent.revision >= 0
+        }
+        stored = [intent.stored for intent in claimed if intent.stored is not None]
+        try:
+            if keys:
+                stored.extend(reads.revisions(sorted(keys, key=_key_order)))
+            have = {
+                (AggregateKey(s.stream, s.aggregate_id), s.revision) for s in stored
+            }
+            previous = {
+                (AggregateKey(s.stream, s.aggregate_id), s.revision - 1)
+                for s in stored
+                if s.changed is None and s.revision > 0
+            } - have
+            if previous:
+                stored.extend(reads.revisions(sorted(previous, key=_key_order)))
+        except EventicError as exc:
+            logger.warning("batch read failed, reading revisions singly: %s", exc)
+        return _Batch({(s.stream, s.aggregate_id, s.revision): s for s in stored})
+
+    def _coalesce(
+        self, claimed: Sequence[ClaimedIntent], batch: _Batch, report: WorkerReport
+    ) -> list[ClaimedIntent]:
+        """The intents to deliver.
+
+        For an ``Outbox(coalesce=True)`` subscription only the newest claimed
+        revision of each aggregate is delivered; the older intents go to
+        ``batch.absorbed`` and settle as it does (see :func:`_covered`).
+        """
+        newest: dict[tuple[str, UUID | None], ClaimedIntent] = {}
+        older: list[ClaimedIntent] = []
+        due: list[ClaimedIntent] = []
+        for intent in claimed:
+            subscription = self._subscriptions.get(intent.subscription_id)
+            if subscription is None or not getattr(
+                subscription.delivery, "coalesce", False
+            ):
+                due.append(intent)
+                continue
+            lane = (intent.subscription_id, intent.aggregate_id)
+            kept = newest.setdefault(lane, intent)
+            if kept is not intent:
+                if intent.revision > kept.revision:
+                    newest[lane], intent = intent, kept
+                older.append(intent)
+        for intent in older:
+            kept = newest[(intent.subscription_id, intent.aggregate_id)]
+            batch.absorbed.setdefault(kept.intent_id, []).append(intent)
+        report.coalesced = len(older)
+        due.extend(newest.values())
+        return due
+
     def _reconstruct(
-        self, stream: Stream[Any], intent: ClaimedIntent
+        self, stream: Stream[Any], intent: ClaimedIntent, batch: _Batch
     ) -> Commit[Any, Any]:
+        """The intent's ``Commit``; a coalesced one's ``changed`` also holds
+        the keys of the revisions it stands in for."""
+        commit = self._commit(stream, intent, batch)
+        absorbed = batch.absorbed.get(intent.intent_id)
+        if not absorbed:
+            return commit
+        changed = set(commit.changed)
+        for older in absorbed:
+            if older.aggregate_id is None:
+                continue
+            stored = older.stored or self._read(
+                batch, older.stream, older.aggregate_id, older.revision
+            )
+            if stored is not None:
+                changed |= self._changed_for(older, stored, batch)
+        return commit.model_copy(update={"changed": frozenset(changed)})
+
+    def _commit(
+        self, stream: Stream[Any], intent: ClaimedIntent, batch: _Batch
+    ) -> Commit[Any, Any]:
+        """The revision's ``Commit``, shared by every subscription in the batch."""
         if intent.aggregate_id is None or intent.revision < 0:
             raise DeliveryError("claimed intent lacks an aggregate key")
-        key = AggregateKey(intent.stream, intent.aggregate_id)
-        stored = self._store.revision(key, intent.revision)
+        at = (intent.stream, intent.aggregate_id, intent.revision)
+        shared = batch.commits.get(at)
+        if shared is not None:
+            return shared
+        stored = intent.stored or self._read(
+            batch, intent.stream, intent.aggregate_id, intent.revision
+        )
         if stored is None:
             raise DeliveryError(
                 f"revision {intent.revision} of {intent.stream} is absent"
             )
         revision = hydrate(stream, self._app.meta, stored)
-        changed = self._changed_for(stream, intent, stored.payload)
-        return Commit[Any, Any](
+        changed = self._changed_for(intent, stored, batch)
+        commit = Commit[Any, Any](
             kind=stored.kind,  # type: ignore[arg-type]
             revision=revision,
             changed=changed,
         )
+        batch.commits[at] = commit
+        return commit
 
     def _changed_for(
-        self, stream: Stream[Any], intent: ClaimedIntent, after: JsonObject
+        self, intent: ClaimedIntent, stored: StoredRevision, batch: _Batch
     ) -> frozenset[str]:
+        if stored.changed is not None:
+            return stored.changed
+        after = stored.payload
         if intent.revision == 0 or intent.aggregate_id is None:
             return frozenset(after)
-        previous = self._store.revision(
-            AggregateKey(intent.stream, intent.aggregate_id), intent.revision - 1
+        previous = self._read(
+            batch, intent.stream, intent.aggregate_id, intent.revision - 1
         )
         if previous is None:
             return frozenset(after)
         return changed_keys(previous.payload, after)
 
+    def _read(
+        self, batch: _Batch, stream: str, aggregate_id: UUID, revision: int
+    ) -> StoredRevision | None:
+        """A prefetched revision, or one read on its own when it was missed."""
+        stored = batch.revisions.get((stream, aggregate_id, revision))
+        if stored is not None:
+            return stored
+        return self._store.revision(AggregateKey(stream, aggregate_id), revision)
+
     def _retry_or_dead(
         self,
         subscription: Any,
@@ -169,6 +705,8 @@ class Worker:
                 status="retry",
                 available_at=decision.available_at,
                 error=decision.error,
+                attempts=intent.attempts,
+                subscriptions=intent.subscriptions or None,
             )
         )
         report.retried += 1
@@ -187,6 +725,363 @@ class Worker:
                 intent_id=intent.intent_id,
                 status="dead",
                 error=redact_error(exc),
+                attempts=intent.attempts,
+                subscriptions=intent.subscriptions or None,
             )
         )
         report.dead_lettered += 1
+
+
+class Worker(_Drainer):
+    """Drains a queue; ``drain_once`` is one claim/deliver/settle batch.
+
+    With ``queues`` (name -> weight) one worker drains several queues in one
+    loop: ``run_forever`` gives backlogged queues batches in proportion to
+    their weights, and a queue that came back empty is not claimed from
+    again until its own backoff runs out. ``drain_once`` then drains one
+    batch from each queue and reports them in ``by_queue``.
+
+    With ``adaptive_batch`` the claim limit follows observed handler latency
+    so a batch is delivered within half its ``lease``; ``batch_size`` is then
+    the ceiling.
+
+    With ``concurrency`` above one, a batch is split into lanes by
+    ``(subscription_id, aggregate_id)`` and the lanes are delivered on that
+    many threads. Intents in one lane run in revision order on one thread;
+    the batch still settles in one call.
+
+    With ``pipelined``, ``run_forever`` settles each batch in the same
+    transaction that claims the next, one round trip instead of two, while
+    there is a backlog. It needs a store with ``pipelined_claims``.
+
+    A queue with ``Outbox(partitions=N)`` is drained only from the partitions
+    this worker leases; each drain renews them and rebalances against the
+    other live workers, ``heartbeat`` renews them while a batch is
+    delivered, and stopping gives them back. Such a queue settles
+    before it claims, pipelined or not. It needs a store with
+    ``partitions``.
+
+    A queue with ``AsyncSubscription`` handlers needs an :class:`AsyncWorker`.
+    """
+
+    def __init__(
+        self,
+        app: App,
+        store: Store,
+        *,
+        queue: str = "default",
+        queues: Mapping[str, int] | None = None,
+        lease: timedelta = timedelta(seconds=30),
+        batch_size: int = 100,
+        adaptive_batch: bool = False,
+        concurrency: int = 1,
+        pipelined: bool = False,
+        heartbeat: timedelta | None = None,
+    ) -> None:
+        weights = _weights(queue, queues)
+        for name in weights:
+            coroutines = sorted(
+                sub.id
+                for sub in app.subscriptions
+                if isinstance(sub, AsyncSubscription) and sub.delivery.queue == name
+            )
+            if coroutines:
+                raise UsageError(
+                    f"queue {name} has async handlers ({', '.join(coroutines)}); "
+                    "drain it with AsyncWorker"
+                )
+        super().__init__(
+            app,
+            store,
+            queues=weights,
+            lease=lease,
+            batch_size=batch_size,
+            adaptive_batch=adaptive_batch,
+            concurrency=concurrency,
+            pipelined=pipelined,
+            heartbeat=heartbeat,
+        )
+
+    def drain_once(self) -> WorkerReport:
+        reports: list[WorkerReport] = []
+        for queue in self._weights:
+            report, settlements = self._drain(queue, ())
+            if settlements:
+                self._store.settle(settlements)
+            reports.append(report)
+        self._release()
+        return WorkerReport.combine(reports)
+
+    def run_forever(
+        self,
+        *,
+        poll: timedelta = timedelta(seconds=1),
+        min_poll: timedelta = timedelta(milliseconds=50),
+    ) -> None:
+        """Drain in a loop; returns when :meth:`stop` is called.
+
+        A full batch drains again at once, so a backlog is worked off without
+        sleeping. Once the queue is empty the wait starts at ``min_poll`` and
+        doubles per empty drain, up to ``poll``.
+
+        The stop flag is checked before each drain, and the sleep is an
+        ``Event.wait``, so ``stop()`` takes effect within ``poll`` even when
+        the worker is between drains.
+
+        On a store with the ``wakeups`` capability the worker parks until a
+        commit stages intents for its queue and drains at once; ``poll`` is
+        then only the fallback that picks up retries coming due and expired
+        leases.
+        """
+        wakeups = self._wakeups()
+        floor = min(min_poll, poll)
+        self._start(floor)
+        pending: list[Settlement] = []
+        while not self._stop.is_set():
+            report, settlements = self._drain(self._turn(), pending)
+            wait = self._paced(report, floor=floor, ceiling=poll)
+            pending = settlements if self._carry(wait) else []
+            if not pending and settlements:
+                self._store.settle(settlements)
+            if wait:
+                self._park(wakeups, wait)
+        if pending:
+            self._store.settle(pending)
+        self._release()
+
+    # -- internals -----------------------------------------------------------
+
+    def _drain(
+        self, queue: str, pending: Sequence[Settlement]
+    ) -> tuple[WorkerReport, list[Settlement]]:
+        """Claim a batch from ``queue`` (settling ``pending`` with it) and
+        deliver it; the batch's own settlements come back unapplied."""
+        limit = self._limit()
+        rows = self._claim(queue, pending, limit)
+        if not rows:
+            return WorkerReport(limit=limit, queue=queue), []
+        claimed = _fanned(rows)
+        report = WorkerReport(claimed=len(rows), limit=limit, queue=queue)
+        started = time.monotonic()
+        batch = self._prefetch(claimed)
+        due = self._coalesce(claimed, batch, report)
+        with self._heartbeats(claimed, batch):
+            settlements = self._deliver_batch(due, batch, report)
+        self._measured(report, started)
+        return report, _merged(settlements + _covered(settlements, batch))
+
+    def _deliver_batch(
+        self, claimed: Sequence[ClaimedIntent], batch: _Batch, report: WorkerReport
+    ) -> list[Settlement]:
+        if self._concurrency == 1:
+            settlements: list[Settlement] = []
+            for intent in claimed:
+                if not self._batched(intent):
+                    self._deliver(intent, batch, settlements, report)
+            for lane in self._lanes(claimed):
+                subscription = self._batched(lane[0])
+                if subscription is not None:
+                    self._deliver_group(subscription, lane, batch, settlements, report)
+            return settlements
+        lanes = self._lanes(claimed)
+        with ThreadPoolExecutor(
+            max_workers=min(self._concurrency, len(lanes)),
+            thread_name_prefix="eventic-worker",
+        ) as pool:
+            outcomes = list(pool.map(self._deliver_lane, lanes, [batch] * len(lanes)))
+        settlements = []
+        for lane_settlements, lane_report in outcomes:
+            settlements.extend(lane_settlements)
+            _tally(report, lane_report)
+        return settlements
+
+    def _deliver_lane(
+        self, lane: list[ClaimedIntent], batch: _Batch
+    ) -> tuple[list[Settlement], WorkerReport]:
+        """One lane on one thread; its own tallies."""
+        settlements: list[Settlement] = []
+        report = WorkerReport()
+        subscription = self._batched(lane[0])
+        if subscription is not None:
+            self._deliver_group(subscription, lane, batch, settlements, report)
+            return settlements, report
+        for intent in lane:
+            self._deliver(intent, batch, settlements, report)
+        return settlements, report
+
+    def _deliver(
+        self,
+        intent: ClaimedIntent,
+        batch: _Batch,
+        settlements: list[Settlement],
+        report: WorkerReport,
+    ) -> None:
+        if intent.intent_id in batch.lost:
+            report.lost += 1
+            return
+        subscription = self._subscriptions.get(intent.subscription_id)
+        if subscription is None:
+            self._unknown(intent, settlements, report)
+            return
+        if isinstance(subscription, BatchSubscription):
+            self._deliver_group(subscription, [intent], batch, settlements, report)
+            return
+        try:
+            commit = self._reconstruct(subscription.stream, intent, batch)
+            subscription.handler(commit)
+        except Exception as exc:  # noqa: BLE001
+            self._retry_or_dead(subscription, intent, settlements, report, exc)
+            return
+        self._delivered(intent, settlements, report)
+
+
+class AsyncWorker(_Drainer):
+    """Drains a queue on an event loop; handlers overlap up to ``concurrency``.
+
+    Claim, reconstruction, and settle run on threads over the sync store
+    (``asyncio.to_thread``). ``AsyncSubscription`` handlers are awaited on the
+    loop; plain ``Subscription`` handlers on the same queue run on a thread.
+    Lanes keep each ``(subscription_id, aggregate_id)`` in revision order, as
+    with ``Worker(concurrency=N)``, and ``queues`` weighs several queues as
+    it does there.
+    """
+
+    def __init__(
+        self,
+        app: App,
+        store: Store,
+        *,
+        queue: str = "default",
+        queues: Mapping[str, int] | None = None,
+        lease: timedelta = timedelta(seconds=30),
+        batch_size: int = 100,
+        adaptive_batch: bool = False,
+        concurrency: int = 100,
+        pipelined: bool = False,
+        heartbeat: timedelta | None = None,
+    ) -> None:
+        super().__init__(
+            app,
+            store,
+            queues=_weights(queue, queues),
+            lease=lease,
+            batch_size=batch_size,
+            adaptive_batch=adaptive_batch,
+            concurrency=concurrency,
+            pipelined=pipelined,
+            heartbeat=heartbeat,
+        )
+
+    async def drain_once(self) -> WorkerReport:
+        reports: list[WorkerReport] = []
+        for queue in self._weights:
+            report, settlements = await self._drain(queue, ())
+            if settlements:
+                await asyncio.to_thread(self._store.settle, settlements)
+            reports.append(report)
+        await asyncio.to_thread(self._release)
+        return WorkerReport.combine(reports)
+
+    async def run_forever(
+        self,
+        *,
+        poll: timedelta = timedelta(seconds=1),
+        min_poll: timedelta = timedelta(milliseconds=50),
+    ) -> None:
+        """:meth:`Worker.run_forever` on the loop; waits park on a thread."""
+        wakeups = await asyncio.to_thread(self._wakeups)
+        floor = min(min_poll, poll)
+        self._start(floor)
+        pending: list[Settlement] = []
+        while not self._stop.is_set():
+            report, settlements = await self._drain(self._turn(), pending)
+            wait = self._paced(report, floor=floor, ceiling=poll)
+            pending = settlements if self._carry(wait) else []
+            if not pending and settlements:
+                await asyncio.to_thread(self._store.settle, settlements)
+            if wait:
+                await asyncio.to_thread(self._park, wakeups, wait)
+        if pending:
+            await asyncio.to_thread(self._store.settle, pending)
+        await asyncio.to_thread(self._release)
+
+    # -- internals -----------------------------------------------------------
+
+    async def _drain(
+        self, queue: str, pending: Sequence[Settlement]
+    ) -> tuple[WorkerReport, list[Settlement]]:
+        limit = self._limit()
+        rows = await asyncio.to_thread(self._claim, queue, pending, limit)
+        if not rows:
+            return WorkerReport(limit=limit, queue=queue), []
+        claimed = _fanned(rows)
+        report = WorkerReport(claimed=len(rows), limit=limit, queue=queue)
+        started = time.monotonic()
+        batch = await asyncio.to_thread(self._prefetch, claimed)
+        due = self._coalesce(claimed, batch, report)
+        settlements: list[Settlement] = []
+        slots = asyncio.Semaphore(self._concurrency)
+        with self._heartbeats(claimed, batch):
+            await asyncio.gather(
+                *(
+                    self._deliver_lane(lane, batch, slots, settlements, report)
+                    for lane in self._lanes(due)
+                )
+            )
+        self._measured(report, started)
+        return report, _merged(settlements + _covered(settlements, batch))
+
+    async def _deliver_lane(
+        self,
+        lane: list[ClaimedIntent],
+        batch: _Batch,
+        slots: asyncio.Semaphore,
+        settlements: list[Settlement],
+        report: WorkerReport,
+    ) -> None:
+        subscription = self._batched(lane[0])
+        if subscription is not None:
+            # A sync bulk handler: on a thread, tallied apart, merged here.
+            own: list[Settlement] = []
+            tally = WorkerReport()
+            async with slots:
+                await asyncio.to_thread(
+                    self._deliver_group, subscription, lane, batch, own, tally
+                )
+            settlements.extend(own)
+            _tally(report, tally)
+            return
+        for intent in lane:
+            await self._deliver(intent, batch, slots, settlements, report)
+
+    async def _deliver(
+        self,
+        intent: ClaimedIntent,
+        batch: _Batch,
+        slots: asyncio.Semaphore,
+        settlements: list[Settlement],
+        report: WorkerReport,
+    ) -> None:
+        if intent.intent_id in batch.lost:
+            report.lost += 1
+            return
+        subscription = self._subscriptions.get(intent.subscription_id)
+        if subscription is None:
+            self._unknown(intent, settlements, report)
+            return
+        if isinstance(subscription, BatchSubscription):
+            await self._deliver_lane([intent], batch, slots, settlements, report)
+            return
+        try:
+            commit = await asyncio.to_thread(
+                self._reconstruct, subscription.stream, intent, batch
+            )
+            async with slots:
+                if isinstance(subscription, AsyncSubscription):
+                    await subscription.handler(commit)
+                else:
+                    await asyncio.to_thread(subscription.handler, commit)
+        except Exception as exc:  # noqa: BLE001
+            self._retry_or_dead(subscription, intent, settlements, report, exc)
+            return
+        self._delivered(intent, settlements, report)
@@ -25,36 +25,50 @@ def _module(name: str) -> types.ModuleType:
     return importlib.import_module(name)
 
 
+def _contract_methods() -> list[tuple[str, object]]:
+    """``Store`` plus the optional narrow read protocols: one rule set."""
+    from eventic import protocols
+
+    methods: list[tuple[str, object]] = []
+    for contract in (
+        protocols.Store,
+        protocols.ProjectionReads,
+        protocols.ChangeFeed,
+        protocols.PointInTimeReads,
+        protocols.BatchReads,
+        protocols.Wakeups,
+        protocols.PipelinedClaims,
+        protocols.LeaseExtension,
+        protocols.PartitionedClaims,
+    ):
+        for name, member in inspect.getmembers(contract, inspect.isfunction):
+            if not name.startswith("_"):
+                methods.append((f"{contract.__name__}.{name}", member))
+    return methods
+
+
 def test_protocol_annotations_resolve_without_sqlalchemy() -> None:
     import typing
 
-    from eventic import protocols
-
-    for name, member in inspect.getmembers(protocols.Store, inspect.isfunction):
-        if name.startswith("_"):
-            continue
+    for name, member in _contract_methods():
         hints = typing.get_type_hints(member, include_extras=True)
         for annotation in hints.values():
             assert "sqlalchemy" not in str(annotation).lower(), (
-                f"Store.{name} leaks sqlalchemy: {annotation}"
+                f"{name} leaks sqlalchemy: {annotation}"
             )
 
 
 def test_no_iterator_returns_in_protocol() -> None:
     import typing
 
-    from eventic import protocols
-
-    for name, member in inspect.getmembers(protocols.Store, inspect.isfunction):
-        if name.startswith("_"):
-            continue
+    for name, member in _contract_methods():
         for annotation in typing.get_type_hints(member).values():
             text = str(annotation)
             assert (
                 "Iterator" not in text
                 and "Iterable" not in text
                 and "Generator" not in text
-            ), f"Store.{name} returns a lazy iterator"
+            ), f"{name} returns a lazy iterator"
 
 
 def test_no_yield_in_store_executor() -> None:
@@ -67,15 +81,10 @@ def test_no_yield_in_store_executor() -> None:
 
 
 def test_no_callable_parameters_in_store() -> None:
-
-    from eventic import protocols
-
-    for name, member in inspect.getmembers(protocols.Store, inspect.isfunction):
-        if name.startswith("_"):
-            continue
+    for name, member in _contract_methods():
         for param in inspect.signature(member).parameters.values():
             annotation = str(param.annotation).lower()
-            assert "callable" not in annotation, f"Store.{name} takes a callable"
+            assert "callable" not in annotation, f"{name} takes a callable"
 
 
 def test_no_contextvar_or_threadlocal() -> None:
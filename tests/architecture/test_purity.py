@@ -8,7 +8,7 @@ from pathlib import Path
 
 FORBIDDEN = {"sqlalchemy", "os", "time", "random", "socket", "requests", "httpx"}
 
-PURE_MODULES = ["wire", "planning", "hydration", "retry"]
+PURE_MODULES = ["wire", "planning", "hydration", "retry", "paths", "pacing"]
 
 
 def _module_imports(name: str) -> list[str]:
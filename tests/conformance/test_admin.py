@@ -232,6 +232,9 @@ def test_list_intents_respects_limit_and_cursor_roundtrips(tmp_path: Path) -> No
                     intent_id=_uuid.uuid5(_uuid.NAMESPACE_URL, f"intent-{i}"),
                     subscription_id=f"sub.{i}",
                     revision_id=_uuid.uuid4(),
+                    stream="todos",
+                    aggregate_id=_uuid.uuid4(),
+                    revision=0,
                     queue="q",
                     status="pending",
                     attempts=0,
@@ -103,6 +103,68 @@ def test_worker_empty_queue_exits_zero(url: str) -> None:
     assert "claimed=0 delivered=0 retried=0 dead_lettered=0" in r.stdout
 
 
+def test_worker_drains_weighted_queues(url: str) -> None:
+    _run("schema", "upgrade", url=url)
+    r = _run("worker", "--queue", "q=3", "--queue", "other", "--once", url=url)
+    assert r.returncode == 0, r.stderr
+    assert "queue=q claimed=0" in r.stdout
+    assert "queue=other claimed=0" in r.stdout
+    r = _run("worker", "--queue", "q=0", "--once", url=url)
+    assert r.returncode == 2
+
+
+def test_worker_processes_need_concurrent_drainers(url: str) -> None:
+    _run("schema", "upgrade", url=url)
+    r = _run("worker", "--processes", "2", "--once", url=url)
+    assert r.returncode == 1
+    assert "concurrent_drainers" in r.stderr
+
+
+def test_supervisor_combines_child_reports() -> None:
+    from eventic.cli.supervisor import supervise
+    from eventic.worker import WorkerReport
+
+    report, failed = supervise(
+        3, lambda: WorkerReport(claimed=2, delivered=2, queue="q"), once=True
+    )
+    assert report is not None and not failed
+    assert (report.claimed, report.delivered, report.queue) == (6, 6, "q")
+
+
+def test_supervisor_restarts_a_crashed_child(tmp_path: Path) -> None:
+    """A child that dies is restarted after a backoff; SIGTERM to the
+    supervisor stops the children and returns."""
+    import io
+    import os
+    import signal
+    import time
+
+    from eventic.cli.supervisor import supervise
+
+    def drain() -> None:
+        if not (tmp_path / "crashed").exists():
+            (tmp_path / "crashed").touch()
+            os._exit(3)
+        (tmp_path / "restarted").touch()
+        signal.signal(signal.SIGTERM, lambda _s, _f: sys.exit(0))
+        while True:
+            time.sleep(0.05)
+
+    previous = signal.signal(
+        signal.SIGALRM, lambda _s, _f: os.kill(os.getpid(), signal.SIGTERM)
+    )
+    signal.setitimer(signal.ITIMER_REAL, 2.5)
+    err = io.StringIO()
+    try:
+        report, failed = supervise(1, drain, once=False, err=err)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+    assert report is None and not failed
+    assert (tmp_path / "restarted").exists()
+    assert "exited with code 3; restarting in 1s" in err.getvalue()
+
+
 def test_worker_undeliverable_dead_letters_and_exits_nonzero(url: str) -> None:
     """A queue with an undeliverable intent retries, then dead-letters, then
     the CLI exits non-zero."""
@@ -119,9 +181,10 @@ def test_worker_undeliverable_dead_letters_and_exits_nonzero(url: str) -> None:
     conn.execute(
         "INSERT INTO eventic_revision (revision_id, stream, aggregate_id, revision, "
         "kind, schema_version, meta_version, encoding, payload, digest, meta, "
-        "committed_at) VALUES ('a' || '1111111111111111111111111111111', 'todos', "
+        "committed_at, commit_tx, position) VALUES "
+        "('a' || '1111111111111111111111111111111', 'todos', "
         "'11111111111111111111111111111111', 0, 'create', 1, 1, 'snapshot/1', "
-        "?, ?, '{}', CURRENT_TIMESTAMP)",
+        "?, ?, '{}', CURRENT_TIMESTAMP, 1, 1)",
         (payload, digest(payload)),
     )
     conn.execute(
@@ -132,11 +195,12 @@ def test_worker_undeliverable_dead_letters_and_exits_nonzero(url: str) -> None:
         (payload, digest(payload)),
     )
     conn.execute(
-        "INSERT INTO eventic_intent (intent_id, subscription_id, revision_id, queue, "
-        "status, attempts, available_at, created_at) VALUES "
-        "('b' || '2222222222222222222222222222222', 'missing-sub', "
-        "'a1111111111111111111111111111111', 'q', 'pending', 0, CURRENT_TIMESTAMP, "
-        "CURRENT_TIMESTAMP)"
+        "INSERT INTO eventic_intent (intent_id, subscription_id, revision_id, stream, "
+        "aggregate_id, revision, queue, status, attempts, available_at, created_at) "
+        "VALUES ('b' || '2222222222222222222222222222222', 'missing-sub', "
+        "'a1111111111111111111111111111111', 'todos', "
+        "'11111111111111111111111111111111', 0, 'q', 'pending', 0, "
+        "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
     )
     conn.commit()
     conn.close()
@@ -160,6 +224,38 @@ def test_verify_and_heads_rebuild(url: str) -> None:
     assert r2.returncode == 0, r2.stderr
 
 
+def test_tail_prints_changes_and_resumes(url: str) -> None:
+    import json
+    import sys as _sys
+
+    from eventic.sql import SQLite
+
+    _run("schema", "upgrade", url=url)
+    _sys.path.insert(0, str(ROOT / "tests" / "fixtures"))
+    try:
+        from demo_app import Todo, app, todos  # type: ignore[import-not-found]
+    finally:
+        _sys.path.pop(0)
+    store = SQLite(url, create_tables=False)
+    ev = app.bind(store)
+    for i in range(3):
+        ev[todos].create(Todo(text=str(i)))
+    store.close()
+
+    r = _run("tail", "--limit", "2", url=url)
+    assert r.returncode == 0, r.stderr
+    lines = [json.loads(line) for line in r.stdout.splitlines()]
+    assert [line["revision"] for line in lines] == [0, 0, 0]
+    # identity and the changed key names, never the payload
+    assert all("state" not in line and "payload" not in line for line in lines)
+    assert [sorted(line["changed"]) for line in lines] == [["done", "text"]] * 3
+    r2 = _run("tail", "--after", lines[0]["position"], url=url)
+    assert [json.loads(line)["id"] for line in r2.stdout.splitlines()] == [
+        line["id"] for line in lines[1:]
+    ]
+    assert _run("tail", "--stream", "nope", url=url).returncode == 2
+
+
 def test_missing_url_is_usage_error() -> None:
     r = subprocess.run(
         [sys.executable, "-m", "eventic.cli.main", "--app", "demo_app:app", "inspect"],
@@ -180,6 +276,7 @@ def test_no_command_prints_url_or_payload(url: str) -> None:
         ("heads", "rebuild"),
         ("inspect",),
         ("intents", "list"),
+        ("tail",),
     ]:
         r = _run(*args, url=url)
         assert r.returncode == 0, (args, r.stderr)
@@ -180,3 +180,224 @@ def test_jsonb_does_not_break_replay() -> None:
         assert head.digest == digest(payload)
     finally:
         store.close()
+
+
+def test_change_feed_waits_for_in_flight_writers() -> None:
+    """A later commit is held back while an earlier writer is still open, so
+    a reader resuming from its last position never skips the earlier row."""
+    import uuid
+    from datetime import UTC, datetime
+
+    from eventic.jsonx import canonical_bytes, digest
+    from eventic.sql import statements as st
+    from eventic.wire import CommitRequest
+
+    store = _pg_factory()()
+    try:
+        doc = canonical_bytes({"n": 1})
+
+        def request(aid: int) -> CommitRequest:
+            return CommitRequest(
+                stream="todos",
+                aggregate_id=uuid.UUID(int=aid),
+                expected_revision=None,
+                kind="create",
+                schema_version=1,
+                payload=doc,
+                digest=digest(doc),
+                meta=canonical_bytes({}),
+                meta_version=1,
+                fingerprint="f",
+            )
+
+        slow = store.engine.connect()
+        tx = slow.begin()
+        slow.execute(
+            st.insert_revision(
+                store.dialect,
+                {
+                    "revision_id": uuid.uuid4(),
+                    "stream": "todos",
+                    "aggregate_id": uuid.UUID(int=1),
+                    "revision": 0,
+                    "kind": "create",
+                    "schema_version": 1,
+                    "meta_version": 1,
+                    "encoding": "snapshot/1",
+                    "payload": {"n": 1},
+                    "digest": digest(doc),
+                    "meta": {},
+                    "committed_at": datetime.now(UTC),
+                },
+            )
+        )
+        store.commit([request(2)])
+        assert store.changes(None, streams=(), limit=10).items == ()
+        tx.commit()
+        slow.close()
+        ids = [
+            c.aggregate_id.int for c in store.changes(None, streams=(), limit=10).items
+        ]
+        assert ids == [1, 2]
+    finally:
+        store.close()
+
+
+def test_commit_order_migration_backfills_existing_rows() -> None:
+    """0002 orders rows written before it, each aggregate by revision even
+    where committed_at runs backwards, and continues the sequence."""
+    import importlib.resources as resources
+    import uuid
+
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import text
+
+    from eventic.jsonx import canonical_bytes, digest
+    from eventic.wire import CommitRequest
+
+    assert PG_URL
+    engine = create_engine(PG_URL)
+    _drop_everything(engine)
+    cfg = Config(str(resources.files("eventic.sql.migrations") / "alembic.ini"))
+    cfg.set_main_option("sqlalchemy.url", PG_URL)
+    command.upgrade(cfg, "0001")
+    doc = canonical_bytes({"n": 1})
+    with engine.begin() as conn:
+        # (1, 1) started its transaction before (1, 0) committed
+        for aid, rev, ago in ((1, 0, 0), (1, 1, 60), (2, 0, 0)):
+            conn.execute(
+                text(
+                    "INSERT INTO eventic_revision (revision_id, stream, "
+                    "aggregate_id, revision, kind, schema_version, meta_version, "
+                    "encoding, payload, digest, meta, committed_at) VALUES "
+                    "(:rid, 'todos', :aid, :rev, :kind, 1, 1, 'snapshot/1', "
+                    "'{\"n\": 1}', :digest, '{}', now() - make_interval(secs => :ago))"
+                ),
+                {
+                    "rid": uuid.uuid4(),
+                    "aid": uuid.UUID(int=aid),
+                    "rev": rev,
+                    "kind": "change" if rev else "create",
+                    "ago": ago,
+                    "digest": digest(doc),
+                },
+            )
+    command.upgrade(cfg, "head")
+    engine.dispose()
+    store = Postgres(PG_URL, create_tables=False)
+    try:
+        store.commit(
+            [
+                CommitRequest(
+                    stream="todos",
+                    aggregate_id=uuid.UUID(int=3),
+                    expected_revision=None,
+                    kind="create",
+                    schema_version=1,
+                    payload=doc,
+                    digest=digest(doc),
+                    meta=canonical_bytes({}),
+                    meta_version=1,
+                    fingerprint="f",
+                )
+            ]
+        )
+        changes = store.changes(None, streams=(), limit=10).items
+        assert [(c.aggregate_id.int, c.revision) for c in changes] == [
+            (1, 0),
+            (1, 1),
+            (2, 0),
+            (3, 0),
+        ]
+    finally:
+        store.close()
+
+
+def test_worker_wakes_on_notify_not_on_poll() -> None:
+    """A commit that stages intents wakes a parked worker at once; the long
+    poll is only the fallback."""
+    import threading
+    import time
+    from datetime import timedelta
+
+    from pydantic import BaseModel
+
+    from eventic.app import App
+    from eventic.stream import Stream
+    from eventic.subscription import Outbox, Subscription
+    from eventic.worker import Worker
+
+    class Todo(BaseModel):
+        text: str
+
+    delivered = threading.Event()
+    todos = Stream(Todo, name="todos")
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.wake",
+                stream=todos,
+                handler=lambda _commit: delivered.set(),
+                delivery=Outbox(queue="wake"),
+            )
+        ],
+    )
+    store = _pg_factory()()
+    try:
+        assert not store.wait_for_intents("wake", timeout=timedelta(milliseconds=50))
+        worker = Worker(app, store, queue="wake")
+        thread = threading.Thread(
+            target=worker.run_forever, kwargs={"poll": timedelta(seconds=30)}
+        )
+        thread.start()
+        time.sleep(0.3)  # parked after its first, empty drain
+        started = time.monotonic()
+        app.bind(store)[todos].create(Todo(text="a"))
+        assert delivered.wait(5)
+        assert time.monotonic() - started < 1.0
+        worker.stop()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    finally:
+        store.close()
+
+
+def test_worker_processes_drain_on_postgres() -> None:
+    """``eventic worker --processes N`` forks N drainers and sums their reports."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    assert PG_URL
+    engine = create_engine(PG_URL)
+    _drop_everything(engine)
+    engine.dispose()
+    root = Path(__file__).resolve().parent.parent.parent
+    r = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "eventic.cli.main",
+            "--app",
+            "demo_app:app",
+            "--url",
+            PG_URL,
+            "worker",
+            "--queue",
+            "q",
+            "--processes",
+            "2",
+            "--once",
+        ],
+        capture_output=True,
+        text=True,
+        env={
+            "PYTHONPATH": str(root / "src") + ":" + str(root / "tests" / "fixtures"),
+        },
+        cwd=root,
+    )
+    assert r.returncode == 0, r.stderr
+    assert "claimed=0 delivered=0" in r.stdout
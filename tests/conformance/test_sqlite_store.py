@@ -128,6 +128,68 @@ def test_statements_have_no_execute() -> None:
                 raise AssertionError("statements.py must not execute")
 
 
+def test_settle_is_two_statements_whatever_the_batch(tmp_path: Path) -> None:
+    """Deliveries are one ``DELETE``; retries and deaths one ``UPDATE``."""
+    import uuid
+    from datetime import UTC, datetime, timedelta
+
+    from sqlalchemy import event as sa_event
+
+    from eventic.ids import revision_id
+    from eventic.wire import IntentRequest, Settlement
+
+    store = SQLite(str(tmp_path / "settle.db"))
+    aid = uuid.uuid4()
+    rid = revision_id("todos", aid, 0)
+    doc = canonical_bytes({"text": "a"})
+    store.commit(
+        [
+            CommitRequest(
+                stream="todos",
+                aggregate_id=aid,
+                expected_revision=None,
+                kind="create",
+                schema_version=1,
+                payload=doc,
+                digest=digest(doc),
+                meta=canonical_bytes({}),
+                meta_version=1,
+                fingerprint="f",
+                intents=tuple(
+                    IntentRequest(
+                        subscription_id=f"sub.{n}", revision_id=rid, queue="q"
+                    )
+                    for n in range(30)
+                ),
+            )
+        ]
+    )
+    claimed = store.claim("q", limit=30, lease=timedelta(seconds=30))
+    statuses = ("delivered", "retry", "dead")
+    statements: list[str] = []
+
+    @sa_event.listens_for(store.engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        if statement.lstrip().upper().startswith(("DELETE", "UPDATE")):
+            statements.append(statement)
+
+    store.settle(
+        [
+            Settlement(
+                intent_id=c.intent_id,
+                status=statuses[i % 3],  # type: ignore[arg-type]
+                available_at=datetime(2000, 1, 1, tzinfo=UTC),
+                error="boom",
+            )
+            for i, c in enumerate(claimed)
+        ]
+    )
+    assert len(statements) == 2
+    again = store.claim("q", limit=30, lease=timedelta(seconds=30))
+    assert len(again) == 10 and {c.attempts for c in again} == {2}
+    store.close()
+
+
 def test_sqlite_json_paths(store: SQLite) -> None:
     """Missing path and explicit null are distinct; dotted keys addressable."""
     from eventic.jsonx import canonical_bytes, digest
@@ -185,3 +247,192 @@ def test_error_translation(store: SQLite) -> None:
     )
     with pytest.raises(StoreError):
         store.commit([bad])
+
+
+def test_projection_reads_through_collection(store: SQLite) -> None:
+    """``fields=`` returns unvalidated projections, paged like ``where``."""
+    from pydantic import BaseModel
+
+    from eventic.app import App
+    from eventic.envelopes import Projection
+    from eventic.errors import NotFound, UsageError
+    from eventic.stream import Stream
+
+    class Owner(BaseModel):
+        id: int
+        name: str
+
+    class Doc(BaseModel):
+        title: str
+        owner: Owner
+        body: str = ""
+
+    docs = Stream(Doc, name="docs")
+    ev = App(id="demo", streams=[docs]).bind(store)
+    made = [
+        ev[docs].create(Doc(title=f"t{i}", owner=Owner(id=i, name="n"), body="x" * 50))
+        for i in range(5)
+    ]
+
+    one = ev[docs].get(made[0].id, fields=("title", "owner.id"))
+    assert isinstance(one, Projection)
+    assert one.fields == {"title": "t0", "owner.id": 0}
+    assert (one.revision, one.digest) == (made[0].revision, made[0].digest)
+
+    seen: list[dict[str, object]] = []
+    cursor: str | None = None
+    while True:
+        page = ev[docs].where(fields=("owner.id",), limit=2, cursor=cursor)
+        seen.extend(item.fields for item in page.items)
+        cursor = page.cursor
+        if cursor is None:
+            break
+    assert sorted(f["owner.id"] for f in seen) == [0, 1, 2, 3, 4]
+
+    with pytest.raises(UsageError):
+        ev[docs].get(made[0].id, fields="title")
+    with pytest.raises(UsageError):
+        ev[docs].get(made[0].id, fields=())
+    with pytest.raises(UsageError):
+        ev[docs].get(made[0].id, revision=0, fields=("title",))  # type: ignore[call-overload]
+    with pytest.raises(NotFound):
+        ev[docs].get(__import__("uuid").UUID(int=99), fields=("title",))
+
+
+def test_where_ids_and_head_revisions(store: SQLite) -> None:
+    """Ref reads page like ``where`` and chunk large id lists."""
+    import uuid
+
+    from pydantic import BaseModel
+
+    from eventic.app import App
+    from eventic.stream import Stream
+
+    class Todo(BaseModel):
+        text: str
+        done: bool = False
+
+    todos = Stream(Todo, name="todos")
+    ev = App(id="demo", streams=[todos]).bind(store)
+    made = [ev[todos].create(Todo(text=str(i), done=i % 2 == 0)) for i in range(7)]
+    made[0] = ev[todos].change(made[0], text="changed")
+
+    ids: list[uuid.UUID] = []
+    cursor: str | None = None
+    while True:
+        page = ev[todos].where_ids(done=True, limit=2, cursor=cursor)
+        ids.extend(ref.aggregate_id for ref in page.items)
+        cursor = page.cursor
+        if cursor is None:
+            break
+    assert sorted(ids) == sorted(r.id for r in made if r.state.done)
+
+    absent = [uuid.uuid4() for _ in range(1200)]
+    refs = ev[todos].head_revisions([r.id for r in made] + absent)
+    assert {k: (v.revision, v.digest) for k, v in refs.items()} == {
+        r.id: (r.revision, r.digest) for r in made
+    }
+
+
+def test_conditional_get(store: SQLite) -> None:
+    """``if_none_match``/``if_revision_gt`` answer unchanged heads with
+    ``NotModified`` and return the full revision otherwise."""
+    import uuid
+
+    from pydantic import BaseModel
+
+    from eventic.app import App
+    from eventic.envelopes import NotModified, Revision
+    from eventic.errors import NotFound, UsageError
+    from eventic.stream import Stream
+
+    class Todo(BaseModel):
+        text: str
+
+    todos = Stream(Todo, name="todos")
+    ev = App(id="demo", streams=[todos]).bind(store)
+    t0 = ev[todos].create(Todo(text="a"))
+
+    same = ev[todos].get(t0.id, if_none_match=t0.digest)
+    assert same == NotModified(stream="todos", id=t0.id, revision=0, digest=t0.digest)
+    assert isinstance(ev[todos].get(t0.id, if_revision_gt=0), NotModified)
+
+    t1 = ev[todos].change(t0, text="b")
+    fresh = ev[todos].get(t0.id, if_none_match=t0.digest)
+    assert isinstance(fresh, Revision) and fresh.digest == t1.digest
+    assert isinstance(ev[todos].get(t0.id, if_revision_gt=0), Revision)
+
+    with pytest.raises(NotFound):
+        ev[todos].get(uuid.uuid4(), if_none_match=t0.digest)
+    with pytest.raises(UsageError):
+        ev[todos].get(t0.id, if_none_match=t0.digest, if_revision_gt=0)  # type: ignore[call-overload]
+
+
+def test_as_of_reads_decode_delta_history(tmp_path: Path) -> None:
+    """``as_of`` picks the revision committed by then, across checkpoints."""
+    from datetime import UTC, datetime, timedelta
+
+    from pydantic import BaseModel
+    from sqlalchemy import text
+
+    from eventic.app import App
+    from eventic.encodings.delta import Delta
+    from eventic.errors import NotFound, UsageError
+    from eventic.stream import Stream
+
+    class Todo(BaseModel):
+        text: str
+        done: bool = False
+
+    store = SQLite(str(tmp_path / "as-of.db"), encodings={"todos": Delta(every=3)})
+    todos = Stream(Todo, name="todos")
+    ev = App(id="demo", streams=[todos]).bind(store)
+    a = ev[todos].create(Todo(text="a0"))
+    for i in range(1, 7):
+        a = ev[todos].change(a, text=f"a{i}", done=i % 2 == 0)
+    b = ev[todos].create(Todo(text="b0", done=True))
+    # SQLite's clock has second precision; spread the log a minute apart.
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def stored(minutes: int) -> str:
+        return (start + timedelta(minutes=minutes)).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+    with store.engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE eventic_revision SET committed_at = :t0 WHERE aggregate_id = :b"
+            ),
+            {"t0": stored(4), "b": b.id.hex},
+        )
+        for revision in range(7):
+            conn.execute(
+                text(
+                    "UPDATE eventic_revision SET committed_at = :t "
+                    "WHERE aggregate_id = :a AND revision = :r"
+                ),
+                {
+                    "t": stored(revision),
+                    "a": a.id.hex,
+                    "r": revision,
+                },
+            )
+
+    for revision in range(7):
+        moment = start + timedelta(minutes=revision, seconds=30)
+        got = ev[todos].get(a.id, as_of=moment)
+        assert (got.revision, got.state.text) == (revision, f"a{revision}")
+
+    at_four = start + timedelta(minutes=4)
+    page = ev[todos].where(as_of=at_four, done=True)
+    assert [(r.id, r.revision) for r in page.items] == sorted(
+        [(a.id, 4), (b.id, 0)], key=lambda pair: pair[0]
+    )
+    assert ev[todos].where(as_of=at_four - timedelta(seconds=1), done=True).items == ()
+
+    with pytest.raises(NotFound):
+        ev[todos].get(b.id, as_of=start)
+    with pytest.raises(UsageError):
+        ev[todos].get(a.id, as_of=datetime(2026, 1, 1))
+    with pytest.raises(UsageError):
+        ev[todos].get(a.id, revision=1, as_of=start)
+    store.close()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 import time
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -11,11 +13,14 @@ from pydantic import BaseModel
 
 from eventic.app import App
 from eventic.envelopes import Commit
-from eventic.errors import DeadLettered, StoreError
+from eventic.errors import CapabilityUnsupported, DeadLettered, StoreError, UsageError
+from eventic.ids import AggregateKey
 from eventic.runtime import Runtime
+from eventic.sql.admin import SqlAdmin
 from eventic.sql.store import SQLite
 from eventic.stream import Stream
 from eventic.subscription import Backoff, Outbox, Subscription
+from eventic.wire import StoredRevision
 from eventic.worker import Worker, WorkerReport
 
 
@@ -155,6 +160,9 @@ def test_crash_after_side_effect_duplicates_delivery() -> None:
         def revision(self, key, revision):
             return self._inner.revision(key, revision)
 
+        def revisions(self, keys):
+            return self._inner.revisions(keys)
+
         def history(self, key, *, after, limit):
             return self._inner.history(key, after=after, limit=limit)
 
@@ -327,6 +335,150 @@ def test_one_function_two_subscriptions_two_deliveries() -> None:
     store.close()
 
 
+def test_batch_is_prefetched_and_commits_shared() -> None:
+    """A claimed batch is read in one ``revisions`` call; the per-intent
+    ``revision`` read is never taken, and two subscriptions on a revision
+    share one ``Commit``."""
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[Commit[Todo, BaseModel]] = []
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id=f"sub.{n}", stream=todos, handler=seen.append, delivery=Outbox()
+            )
+            for n in ("one", "two")
+        ],
+    )
+    runtime = app.bind(store)
+    for i in range(3):
+        todo = runtime[todos].create(Todo(text=f"t{i}"))
+        runtime[todos].change(todo, done=True)
+    reads: list[int] = []
+    single = store.revision
+    batched = store.revisions
+
+    def counted_revision(key: AggregateKey, revision: int) -> StoredRevision | None:
+        reads.append(-1)
+        return single(key, revision)
+
+    def counted_revisions(
+        keys: Sequence[tuple[AggregateKey, int]],
+    ) -> Sequence[StoredRevision]:
+        reads.append(len(keys))
+        return batched(keys)
+
+    store.revision = counted_revision  # type: ignore[method-assign]
+    store.revisions = counted_revisions  # type: ignore[method-assign]
+    report = Worker(app, store, queue="default").drain_once()
+    assert report.delivered == 12
+    assert reads == [6]  # three creates and three changes; no single reads
+    assert len({id(commit) for commit in seen}) == 6
+    assert sorted(len(c.changed) for c in seen) == [1] * 6 + [2] * 6
+    store.close()
+
+
+def test_recorded_changed_keys_spare_the_predecessor_read() -> None:
+    """A revision carries its changed keys from commit; a row written before
+    they were recorded is diffed against its predecessor instead."""
+    from sqlalchemy import text
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[Commit[Todo, BaseModel]] = []
+    app = _app(todos, seen.append)
+    runtime = app.bind(store)
+    created = [runtime[todos].create(Todo(text=f"t{i}")) for i in range(3)]
+    worker = Worker(app, store, queue="q")
+    assert worker.drain_once().delivered == 3
+    for todo in created:
+        runtime[todos].change(todo, done=True)
+    stored = store.revision(AggregateKey("todos", created[0].id), 1)
+    assert stored is not None and stored.changed == frozenset({"done"})
+
+    with store.engine.begin() as conn:  # as if written before the column existed
+        conn.execute(text("UPDATE eventic_revision SET changed = NULL"))
+    reads: list[int] = []
+    batched = store.revisions
+
+    def counted_revisions(
+        keys: Sequence[tuple[AggregateKey, int]],
+    ) -> Sequence[StoredRevision]:
+        reads.append(len(keys))
+        return batched(keys)
+
+    store.revisions = counted_revisions  # type: ignore[method-assign]
+    assert worker.drain_once().delivered == 3
+    assert reads == [3, 3]  # the changes, then their predecessors
+    assert [c.changed for c in seen[3:]] == [frozenset({"done"})] * 3
+    store.close()
+
+
+def test_an_unreadable_revision_fails_only_its_own_intent() -> None:
+    """A row that breaks the batch read is read again on its own; the rest of
+    the batch is delivered and only its intent retries."""
+    from sqlalchemy import text
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+    app = _app(todos, lambda c: seen.append(c.revision.state.text))
+    runtime = app.bind(store)
+    bad = runtime[todos].create(Todo(text="bad"))
+    runtime[todos].create(Todo(text="good"))
+    with store.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE eventic_revision SET payload = '{' WHERE aggregate_id = :a"),
+            {"a": bad.id.hex},
+        )
+    report = Worker(app, store, queue="q").drain_once()
+    assert (report.claimed, report.delivered, report.retried) == (2, 1, 1)
+    assert seen == ["good"]
+    store.close()
+
+
+def test_inline_payload_delivers_without_reading_the_log() -> None:
+    """``Outbox(inline_payload=True)``: the claim carries the revision, so the
+    worker reads nothing else, and the envelope equals a log-built one."""
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    inline: list[Commit[Todo, BaseModel]] = []
+    logged: list[Commit[Todo, BaseModel]] = []
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.inline",
+                stream=todos,
+                handler=inline.append,
+                delivery=Outbox(queue="fast", inline_payload=True),
+            ),
+            Subscription(
+                id="sub.log", stream=todos, handler=logged.append, delivery=Outbox()
+            ),
+        ],
+    )
+    runtime = app.bind(store)
+    todo = runtime[todos].create(Todo(text="a"))
+    runtime[todos].change(todo, done=True)
+
+    def no_reads(*args: object) -> None:
+        raise AssertionError("the log was read")
+
+    reads = (store.revision, store.revisions)
+    store.revision = no_reads  # type: ignore[method-assign]
+    store.revisions = no_reads  # type: ignore[method-assign]
+    assert Worker(app, store, queue="fast").drain_once().delivered == 2
+    store.revision, store.revisions = reads  # type: ignore[method-assign]
+    assert Worker(app, store, queue="default").drain_once().delivered == 2
+    assert inline == logged
+    assert [c.changed for c in inline] == [frozenset({"text", "done"}), {"done"}]
+    store.close()
+
+
 def test_worker_report_structure() -> None:
     report = WorkerReport(claimed=3, delivered=2, retried=1, dead_lettered=0)
     assert report.claimed == 3
@@ -361,6 +513,835 @@ def test_run_forever_stops_via_stop_flag() -> None:
     store.close()
 
 
+def test_co_located_worker_wakes_on_commit() -> None:
+    """A commit through the same SQLite store wakes a parked worker; the long
+    poll never elapses."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    delivered = threading.Event()
+    app = _app(todos, lambda c: delivered.set())
+    worker = Worker(app, store, queue="q")
+    thread = threading.Thread(
+        target=worker.run_forever, kwargs={"poll": timedelta(seconds=30)}
+    )
+    thread.start()
+    time.sleep(0.2)  # parked after its first, empty drain
+    started = time.monotonic()
+    _seed(store, app)
+    assert delivered.wait(5)
+    assert time.monotonic() - started < 1.0
+    assert not store.wait_for_intents("other", timeout=timedelta(milliseconds=10))
+    worker.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    store.close()
+
+
+def test_run_forever_polls_when_wakeups_fail() -> None:
+    """A store whose wakeup wait raises (a lost LISTEN connection) slows the
+    worker to polling; run_forever keeps delivering and still stops."""
+    import threading
+
+    store = SQLite(":memory:")
+    waits: list[timedelta] = []
+
+    def broken(queue: str, *, timeout: timedelta) -> bool:
+        waits.append(timeout)
+        raise StoreError("wakeup wait failed")
+
+    store.wait_for_intents = broken  # type: ignore[method-assign]
+    todos = Stream(Todo, name="todos")
+    delivered = threading.Event()
+    app = _app(todos, lambda c: delivered.set())
+    worker = Worker(app, store, queue="q")
+    thread = threading.Thread(
+        target=worker.run_forever, kwargs={"poll": timedelta(milliseconds=20)}
+    )
+    thread.start()
+    time.sleep(0.05)
+    _seed(store, app)
+    assert delivered.wait(5)
+    worker.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert waits[0] == timedelta(0)  # the priming subscribe
+    assert any(waits[1:])  # and the parks after it
+    store.close()
+
+
+def test_run_forever_works_off_a_backlog_without_polling() -> None:
+    """Full batches drain back to back; the long poll only follows the
+    partial batch that empties the queue."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+    app = _app(todos, lambda c: seen.append(c.revision.state.text))
+    runtime = app.bind(store)
+    for i in range(25):
+        runtime[todos].create(Todo(text=str(i)))
+    worker = Worker(app, store, queue="q", batch_size=10)
+    thread = threading.Thread(
+        target=worker.run_forever, kwargs={"poll": timedelta(seconds=30)}
+    )
+    started = time.monotonic()
+    thread.start()
+    while len(seen) < 25 and time.monotonic() - started < 5:
+        time.sleep(0.01)
+    assert len(seen) == 25
+    assert time.monotonic() - started < 2.0
+    worker.stop()
+    thread.join(timeout=5)
+    store.close()
+
+
+def _recorded(calls: list[str], name: str, method: Any) -> Any:
+    def call(*args: Any, **kwargs: Any) -> Any:
+        calls.append(name)
+        return method(*args, **kwargs)
+
+    return call
+
+
+def test_pipelined_worker_settles_with_the_next_claim() -> None:
+    """While a backlog lasts, each batch settles in the next claim's
+    transaction; the last one settles on its own before the worker parks."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+    app = _app(todos, lambda c: seen.append(c.revision.state.text))
+    runtime = app.bind(store)
+    for i in range(25):
+        runtime[todos].create(Todo(text=str(i)))
+    calls: list[str] = []
+    for name in ("claim", "settle", "settle_and_claim"):
+        setattr(store, name, _recorded(calls, name, getattr(store, name)))
+    worker = Worker(app, store, queue="q", batch_size=10, pipelined=True)
+    thread = threading.Thread(
+        target=worker.run_forever, kwargs={"poll": timedelta(seconds=30)}
+    )
+    thread.start()
+    started = time.monotonic()
+    while "settle" not in calls and time.monotonic() - started < 5:
+        time.sleep(0.01)
+    worker.stop()
+    thread.join(timeout=5)
+    assert sorted(seen, key=int) == [str(i) for i in range(25)]
+    assert calls == ["claim", "settle_and_claim", "settle_and_claim", "settle"]
+    assert store.claim("q", limit=100, lease=timedelta(seconds=1)) == []
+    store.close()
+
+
+def test_pipelined_worker_needs_the_capability() -> None:
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    app = _app(todos, lambda c: None)
+    plain = dataclasses.replace(store.capabilities, pipelined_claims=False)
+    store.dialect = dataclasses.replace(store.dialect, capabilities=plain)
+    with pytest.raises(CapabilityUnsupported):
+        Worker(app, store, queue="q", pipelined=True)
+    store.close()
+
+
+def _two_queue_app(todos: Stream[Todo], seen: list[str]) -> App:
+    def tally(queue: str) -> Any:
+        return lambda commit: seen.append(queue)
+
+    return App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id=f"sub.{queue}",
+                stream=todos,
+                handler=tally(queue),
+                delivery=Outbox(queue=queue),
+            )
+            for queue in ("search", "email")
+        ],
+    )
+
+
+def test_multi_queue_worker_shares_by_weight_and_skips_idle_queues() -> None:
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+    app = _two_queue_app(todos, seen)
+    runtime = app.bind(store)
+    for i in range(30):
+        runtime[todos].create(Todo(text=str(i)))
+    claims: list[str] = []
+    claim = store.claim
+
+    def recording(queue: str, **kwargs: Any) -> Any:
+        claims.append(queue)
+        return claim(queue, **kwargs)
+
+    store.claim = recording  # type: ignore[method-assign]
+    worker = Worker(
+        app, store, queues={"search": 5, "email": 1, "idle": 1}, batch_size=5
+    )
+    thread = threading.Thread(
+        target=worker.run_forever,
+        kwargs={"poll": timedelta(seconds=30), "min_poll": timedelta(seconds=5)},
+    )
+    thread.start()
+    started = time.monotonic()
+    while len(seen) < 60 and time.monotonic() - started < 5:
+        time.sleep(0.01)
+    worker.stop()
+    thread.join(timeout=5)
+    assert len(seen) == 60
+    # While both have a backlog, search gets five batches to email's one.
+    busy = [q for q in claims if q != "idle"][:6]
+    assert busy.count("search") == 5 and busy.count("email") == 1
+    assert claims.count("idle") == 1  # empty once, then left to its backoff
+    store.close()
+
+
+def test_multi_queue_drain_once_reports_each_queue() -> None:
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+    app = _two_queue_app(todos, seen)
+    runtime = app.bind(store)
+    for i in range(3):
+        runtime[todos].create(Todo(text=str(i)))
+    report = Worker(app, store, queues={"search": 2, "email": 1}).drain_once()
+    assert report.claimed == report.delivered == 6
+    assert {q: r.delivered for q, r in report.by_queue.items()} == {
+        "search": 3,
+        "email": 3,
+    }
+    assert report.by_queue["email"].queue == "email"
+    with pytest.raises(UsageError):
+        Worker(app, store, queue="search", queues={"email": 1})
+    with pytest.raises(UsageError):
+        Worker(app, store, queues={"email": 0})
+    store.close()
+
+
+def test_heartbeat_keeps_a_slow_handler_leased() -> None:
+    """A handler that outlives its lease keeps it; a second drainer finds
+    nothing to claim and the work is delivered once."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+    started = threading.Event()
+
+    def slow(commit: Commit[Todo, BaseModel]) -> None:
+        started.set()
+        time.sleep(0.4)
+        seen.append(commit.revision.state.text)
+
+    app = _app(todos, slow)
+    _seed(store, app)
+    lease = timedelta(milliseconds=100)
+    worker = Worker(app, store, queue="q", lease=lease, heartbeat=lease / 4)
+    thread = threading.Thread(target=worker.drain_once)
+    thread.start()
+    assert started.wait(5)
+    time.sleep(0.25)  # well past the first lease
+    assert store.claim("q", limit=10, lease=lease) == []
+    thread.join(timeout=5)
+    assert seen == ["hi"]
+    assert store.claim("q", limit=10, lease=lease) == []
+    store.close()
+
+
+def test_heartbeat_skips_an_intent_whose_lease_was_taken() -> None:
+    from sqlalchemy import text
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[str] = []
+
+    def handler(commit: Commit[Todo, BaseModel]) -> None:
+        if commit.revision.state.text == "first":
+            with store.engine.begin() as conn:  # another drainer re-claims
+                conn.execute(
+                    text(
+                        "UPDATE eventic_intent SET attempts = attempts + 1 "
+                        "WHERE revision_id = :rid"
+                    ),
+                    {"rid": second.revision_id.hex},
+                )
+            time.sleep(0.2)
+        seen.append(commit.revision.state.text)
+
+    app = _app(todos, handler)
+    runtime = app.bind(store)
+    runtime[todos].create(Todo(text="first"))
+    second = runtime[todos].create(Todo(text="second"))
+    worker = Worker(
+        app,
+        store,
+        queue="q",
+        lease=timedelta(seconds=5),
+        heartbeat=timedelta(milliseconds=20),
+    )
+    report = worker.drain_once()
+    assert (report.delivered, report.lost) == (1, 1)
+    assert seen == ["first"]
+    store.close()
+
+
+def test_heartbeat_is_shorter_than_the_lease() -> None:
+    store = SQLite(":memory:")
+    app = _app(Stream(Todo, name="todos"), lambda c: None)
+    with pytest.raises(UsageError):
+        Worker(app, store, lease=timedelta(seconds=1), heartbeat=timedelta(seconds=1))
+    store.close()
+
+
+def test_adaptive_batch_fits_the_lease() -> None:
+    """Slow handlers shrink the claim limit to what half a lease can deliver."""
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    app = _app(todos, lambda c: time.sleep(0.02))
+    runtime = app.bind(store)
+    for i in range(12):
+        runtime[todos].create(Todo(text=str(i)))
+    worker = Worker(
+        app,
+        store,
+        queue="q",
+        lease=timedelta(milliseconds=100),
+        batch_size=4,
+        adaptive_batch=True,
+    )
+    first = worker.drain_once()
+    assert (first.claimed, first.limit) == (4, 4)
+    assert first.seconds >= 4 * 0.02
+    second = worker.drain_once()
+    assert second.limit < 4
+    store.close()
+
+
+def test_concurrent_lanes_overlap_but_keep_aggregate_order() -> None:
+    """Lanes run in parallel; one aggregate's intents stay in revision order
+    and the whole batch settles."""
+    import random
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    order: dict[object, list[int]] = {}
+    guard = threading.Lock()
+
+    def handler(commit: Commit[Todo, BaseModel]) -> None:
+        time.sleep(random.uniform(0.02, 0.06))  # noqa: S311
+        with guard:
+            order.setdefault(commit.revision.id, []).append(commit.revision.revision)
+
+    app = _app(todos, handler)
+    runtime = app.bind(store)
+    for i in range(8):
+        t = runtime[todos].create(Todo(text=str(i)))
+        for _ in range(2):
+            t = runtime[todos].change(t, text=t.state.text + "!")
+    worker = Worker(app, store, queue="q", batch_size=100, concurrency=8)
+    started = time.monotonic()
+    report = worker.drain_once()
+    elapsed = time.monotonic() - started
+    assert (report.claimed, report.delivered) == (24, 24)
+    assert elapsed < 24 * 0.02
+    assert all(revisions == [0, 1, 2] for revisions in order.values())
+    assert worker.drain_once().claimed == 0
+    with pytest.raises(UsageError):
+        Worker(app, store, queue="q", concurrency=0)
+    store.close()
+
+
+def test_async_worker_overlaps_coroutine_handlers() -> None:
+    """Coroutine handlers overlap on one loop, sync ones on the same queue run
+    on threads, and one aggregate's intents stay in revision order."""
+    import asyncio
+
+    from eventic.subscription import AsyncSubscription
+    from eventic.worker import AsyncWorker
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    order: dict[object, list[int]] = {}
+    synced: list[int] = []
+
+    async def post(commit: Commit[Todo, BaseModel]) -> None:
+        await asyncio.sleep(0.05)
+        order.setdefault(commit.revision.id, []).append(commit.revision.revision)
+
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            AsyncSubscription(
+                id="sub.post", stream=todos, handler=post, delivery=Outbox(queue="q")
+            ),
+            Subscription(
+                id="sub.sync",
+                stream=todos,
+                handler=lambda c: synced.append(c.revision.revision),
+                delivery=Outbox(queue="q"),
+            ),
+        ],
+    )
+    runtime = app.bind(store)
+    for i in range(20):
+        t = runtime[todos].create(Todo(text=str(i)))
+        runtime[todos].change(t, text="changed")
+    worker = AsyncWorker(app, store, queue="q", concurrency=50)
+    started = time.monotonic()
+    report = asyncio.run(worker.drain_once())
+    elapsed = time.monotonic() - started
+    assert (report.claimed, report.delivered) == (80, 80)
+    assert elapsed < 40 * 0.05
+    assert all(revisions == [0, 1] for revisions in order.values())
+    assert sorted(synced) == [0] * 20 + [1] * 20
+    with pytest.raises(UsageError):
+        Worker(app, store, queue="q")
+    store.close()
+
+
+def test_coalesced_subscription_delivers_only_the_newest_revision() -> None:
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[Commit[Todo, BaseModel]] = []
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.index",
+                stream=todos,
+                handler=seen.append,
+                delivery=Outbox(queue="q", coalesce=True),
+            )
+        ],
+    )
+    runtime = app.bind(store)
+    todo = runtime[todos].create(Todo(text="a"))
+    other = runtime[todos].create(Todo(text="x"))
+    worker = Worker(app, store, queue="q")
+    assert worker.drain_once().delivered == 2
+    seen.clear()
+    todo = runtime[todos].change(todo, text="b")
+    todo = runtime[todos].change(todo, done=True)
+    todo = runtime[todos].change(todo, text="c")
+    runtime[todos].change(other, text="y")
+    report = worker.drain_once()
+    assert (report.claimed, report.delivered, report.coalesced) == (4, 2, 2)
+    latest = next(c for c in seen if c.revision.id == todo.id)
+    assert latest.revision.revision == 3
+    assert latest.revision.state == Todo(text="c", done=True)
+    assert latest.changed == {"text", "done"}
+    assert store.claim("q", limit=10, lease=timedelta(seconds=5)) == []
+    store.close()
+
+
+def _coalescing(todos: Stream[Todo], handler: Any) -> App:
+    return App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.index",
+                stream=todos,
+                handler=handler,
+                delivery=Outbox(
+                    queue="q",
+                    coalesce=True,
+                    retry=Backoff(base=0.01, factor=1.0, cap=0.02),
+                ),
+            )
+        ],
+    )
+
+
+def test_coalesced_intents_retry_with_the_newest() -> None:
+    """A failed delivery takes the intents it stood in for with it, so the
+    redelivery still reports every key they changed."""
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[Commit[Todo, BaseModel]] = []
+
+    def flaky(commit: Commit[Todo, BaseModel]) -> None:
+        if not seen:
+            seen.append(commit)
+            raise RuntimeError("down")
+        seen.append(commit)
+
+    app = _coalescing(todos, flaky)
+    runtime = app.bind(store)
+    todo = runtime[todos].create(Todo(text="a"))
+    todo = runtime[todos].change(todo, done=True)
+    runtime[todos].change(todo, text="b")
+    worker = Worker(app, store, queue="q")
+    report = worker.drain_once()
+    assert (report.retried, report.coalesced) == (1, 2)
+    time.sleep(0.05)
+    report = worker.drain_once()
+    assert (report.claimed, report.delivered, report.coalesced) == (3, 1, 2)
+    assert seen[1].revision.revision == 2
+    assert seen[1].changed == {"text", "done"}
+    store.close()
+
+
+def test_heartbeat_keeps_coalesced_intents_leased() -> None:
+    """The older intents a slow delivery stands in for keep their leases too:
+    no other drainer delivers their older state meanwhile."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    started = threading.Event()
+
+    def slow(commit: Commit[Todo, BaseModel]) -> None:
+        started.set()
+        time.sleep(0.4)
+
+    app = _coalescing(todos, slow)
+    runtime = app.bind(store)
+    todo = runtime[todos].create(Todo(text="a"))
+    runtime[todos].change(todo, text="b")
+    lease = timedelta(milliseconds=100)
+    worker = Worker(app, store, queue="q", lease=lease, heartbeat=lease / 4)
+    thread = threading.Thread(target=worker.drain_once)
+    thread.start()
+    assert started.wait(5)
+    time.sleep(0.25)  # well past the first lease
+    assert store.claim("q", limit=10, lease=lease) == []
+    thread.join(timeout=5)
+    assert store.claim("q", limit=10, lease=lease) == []
+    store.close()
+
+
+def test_predicates_filter_inline_and_outbox_alike() -> None:
+    """A commit the predicates reject stages no intent and runs no inline
+    handler; both deliveries see the same commits."""
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    inline: list[int] = []
+    outbox: list[int] = []
+    predicates: dict[str, Any] = {
+        "when_changed": frozenset({"done"}),
+        "where": {"done": True},
+    }
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.inline",
+                stream=todos,
+                handler=lambda c: inline.append(c.revision.revision),
+                **predicates,
+            ),
+            Subscription(
+                id="sub.outbox",
+                stream=todos,
+                handler=lambda c: outbox.append(c.revision.revision),
+                delivery=Outbox(queue="q"),
+                **predicates,
+            ),
+        ],
+    )
+    runtime = app.bind(store)
+    todo = runtime[todos].create(Todo(text="a"))
+    todo = runtime[todos].change(todo, text="b")
+    todo = runtime[todos].change(todo, done=True)
+    runtime[todos].change(todo, text="c")
+    report = Worker(app, store, queue="q").drain_once()
+    assert report.claimed == 1
+    assert inline == outbox == [2]
+    store.close()
+
+
+def test_grouped_intent_retries_only_the_subscriptions_that_failed() -> None:
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    calls: list[str] = []
+    failures = {"sub.c": 1}
+    grouped = Outbox(
+        queue="q",
+        grouped=True,
+        retry=Backoff(max_attempts=2, base=0.01, factor=1.0, cap=0.01),
+    )
+
+    def deliver(name: str) -> Any:
+        def handler(commit: Commit[Todo, BaseModel]) -> None:
+            calls.append(name)
+            if failures.get(name):
+                failures[name] -= 1
+                raise RuntimeError("sink down")
+
+        return handler
+
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(id=name, stream=todos, handler=deliver(name), delivery=grouped)
+            for name in ("sub.a", "sub.b", "sub.c")
+        ],
+    )
+    _seed(store, app)
+    [row], _ = SqlAdmin(store).list_intents()
+    assert row["subscriptions"] == ["sub.a", "sub.b", "sub.c"]
+    worker = Worker(app, store, queue="q")
+    report = worker.drain_once()
+    assert (report.delivered, report.retried) == (2, 1)
+    assert sorted(calls) == ["sub.a", "sub.b", "sub.c"]
+    calls.clear()
+    time.sleep(0.02)
+    report = worker.drain_once()
+    assert (report.claimed, report.delivered) == (1, 1)
+    assert calls == ["sub.c"]
+    assert worker.drain_once().claimed == 0
+    failures["sub.b"] = 2
+    _seed(store, app)
+    worker.drain_once()
+    time.sleep(0.02)
+    assert worker.drain_once().dead_lettered == 1
+    admin = SqlAdmin(store)
+    assert (admin.redrive("sub.a"), admin.redrive("sub.b")) == (0, 1)
+    store.close()
+
+
+def test_grouped_dead_subscription_splits_off_the_retry() -> None:
+    """A subscription out of attempts is not redelivered with a sibling that
+    retries: it splits off dead, and redrive still finds it. A grouped row
+    counts once in ``claimed``."""
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    calls: list[str] = []
+    down = {"sub.b", "sub.c"}
+
+    def deliver(name: str) -> Any:
+        def handler(commit: Commit[Todo, BaseModel]) -> None:
+            calls.append(name)
+            if name in down:
+                raise RuntimeError("sink down")
+
+        return handler
+
+    def grouped(max_attempts: int) -> Outbox:
+        retry = Backoff(max_attempts=max_attempts, base=0.01, factor=1.0, cap=0.01)
+        return Outbox(queue="q", grouped=True, retry=retry)
+
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id=name, stream=todos, handler=deliver(name), delivery=grouped(n)
+            )
+            for name, n in (("sub.a", 3), ("sub.b", 1), ("sub.c", 3))
+        ],
+    )
+    _seed(store, app)
+    worker = Worker(app, store, queue="q")
+    report = worker.drain_once()
+    assert (report.claimed, report.delivered) == (1, 1)
+    assert (report.retried, report.dead_lettered) == (1, 1)
+    down.clear()
+    calls.clear()
+    time.sleep(0.02)
+    assert worker.drain_once().delivered == 1
+    assert calls == ["sub.c"]
+    admin = SqlAdmin(store)
+    [dead], _ = admin.list_intents(status="dead")
+    assert (dead["subscription_id"], dead["subscriptions"]) == ("sub.b", ["sub.b"])
+    assert admin.redrive("sub.b") == 1
+    calls.clear()
+    assert worker.drain_once().delivered == 1
+    assert calls == ["sub.b"]
+    store.close()
+
+
+def test_partitioned_workers_split_the_queue_and_keep_aggregate_order() -> None:
+    """Two workers on a partitioned queue share its partitions; each
+    aggregate is delivered in revision order, and stopping frees them."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    order: dict[object, list[int]] = {}
+    workers: dict[object, set[str]] = {}
+    guard = threading.Lock()
+
+    def handler(commit: Commit[Todo, BaseModel]) -> None:
+        time.sleep(0.005)
+        with guard:
+            order.setdefault(commit.revision.id, []).append(commit.revision.revision)
+            workers.setdefault(commit.revision.id, set()).add(
+                threading.current_thread().name
+            )
+
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.a",
+                stream=todos,
+                handler=handler,
+                delivery=Outbox(queue="q", partitions=4),
+            )
+        ],
+    )
+    runtime = app.bind(store)
+    for i in range(8):
+        t = runtime[todos].create(Todo(text=str(i)))
+        for _ in range(2):
+            t = runtime[todos].change(t, text=t.state.text + "!")
+    drainers = [Worker(app, store, queue="q", batch_size=2) for _ in range(2)]
+    threads = [
+        threading.Thread(
+            target=worker.run_forever,
+            kwargs={"poll": timedelta(milliseconds=50)},
+            name=f"w{n}",
+        )
+        for n, worker in enumerate(drainers)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 10
+    while sum(map(len, order.values())) < 24 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for worker in drainers:
+        worker.stop()
+    for thread in threads:
+        thread.join()
+    assert all(revisions == [0, 1, 2] for revisions in order.values())
+    assert len(order) == 8
+    assert set().union(*workers.values()) == {"w0", "w1"}
+    held = store.acquire_partitions(
+        "q", partitions=4, holder="next", lease=timedelta(seconds=5)
+    )
+    assert list(held) == [0, 1, 2, 3]
+    plain = dataclasses.replace(store.capabilities, partitions=False)
+    store.dialect = dataclasses.replace(store.dialect, capabilities=plain)
+    with pytest.raises(CapabilityUnsupported):
+        Worker(app, store, queue="q")
+    store.close()
+
+
+def test_heartbeat_keeps_a_slow_partition_from_changing_hands() -> None:
+    """A slow handler's partition stays leased to its worker: a second worker
+    cannot claim the aggregate's next revision and overtake it."""
+    import threading
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    seen: list[int] = []
+    started = threading.Event()
+
+    def slow(commit: Commit[Todo, BaseModel]) -> None:
+        if commit.revision.revision == 0:
+            started.set()
+            time.sleep(0.4)
+        seen.append(commit.revision.revision)
+
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="sub.a",
+                stream=todos,
+                handler=slow,
+                delivery=Outbox(queue="q", partitions=2),
+            )
+        ],
+    )
+    runtime = app.bind(store)
+    todo = runtime[todos].create(Todo(text="a"))
+    runtime[todos].change(todo, done=True)
+    lease = timedelta(milliseconds=100)
+    first = Worker(
+        app, store, queue="q", lease=lease, heartbeat=lease / 4, batch_size=1
+    )
+    second = Worker(app, store, queue="q", lease=lease)
+    thread = threading.Thread(target=first.drain_once)
+    thread.start()
+    assert started.wait(5)
+    time.sleep(0.25)  # well past the first partition lease
+    assert second.drain_once().claimed == 0
+    thread.join(timeout=5)
+    assert second.drain_once().delivered == 1
+    assert seen == [0, 1]
+    store.close()
+
+
+def _bulk_app(todos: Stream[Todo], handler: Any, *, max_batch: int) -> App:
+    from eventic.subscription import BatchSubscription
+
+    return App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            BatchSubscription(
+                id="sub.bulk",
+                stream=todos,
+                handler=handler,
+                max_batch=max_batch,
+                delivery=Outbox(queue="q"),
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_batch_handler_gets_chunks_and_settles_each_outcome(concurrency: int) -> None:
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+    calls: list[list[str]] = []
+
+    def bulk(commits: Sequence[Commit[Todo, BaseModel]]) -> list[Exception | None]:
+        texts = [c.revision.state.text for c in commits]
+        calls.append(texts)
+        return [ValueError("rejected") if t == "2" else None for t in texts]
+
+    app = _bulk_app(todos, bulk, max_batch=2)
+    runtime = app.bind(store)
+    for i in range(5):
+        runtime[todos].create(Todo(text=str(i)))
+    report = Worker(app, store, queue="q", concurrency=concurrency).drain_once()
+    assert [len(call) for call in calls] == [2, 2, 1]
+    assert sorted(t for call in calls for t in call) == ["0", "1", "2", "3", "4"]
+    assert (report.delivered, report.retried) == (4, 1)
+    store.close()
+
+
+def test_batch_handler_that_raises_fails_the_whole_call() -> None:
+    from eventic.worker import AsyncWorker
+
+    store = SQLite(":memory:")
+    todos = Stream(Todo, name="todos")
+
+    def bulk(commits: Sequence[Commit[Todo, BaseModel]]) -> None:
+        raise ConnectionError("bulk endpoint down")
+
+    app = _bulk_app(todos, bulk, max_batch=10)
+    runtime = app.bind(store)
+    for i in range(3):
+        runtime[todos].create(Todo(text=str(i)))
+    import asyncio
+
+    report = asyncio.run(AsyncWorker(app, store, queue="q").drain_once())
+    assert (report.claimed, report.delivered, report.retried) == (3, 0, 3)
+    store.close()
+
+
 def test_last_error_redacted_no_credentials() -> None:
     store = SQLite(":memory:")
     todos = Stream(Todo, name="todos")
@@ -7,7 +7,7 @@ from typing import Any, assert_type
 from pydantic import BaseModel
 
 from eventic import App, Outbox, Stream, Subscription
-from eventic.envelopes import Commit, Page, Revision
+from eventic.envelopes import Commit, NotModified, Page, Projection, Revision
 from eventic.runtime import Collection
 from eventic.sql import SQLite
 from eventic.worker import Worker
@@ -57,6 +57,14 @@ def changed_is_frozenset(commit: Commit[Todo, BaseModel]) -> frozenset[str]:
 
 page: Page[Revision[Todo, BaseModel]] = ev[todos].history(t.id)
 assert_type(page.items[0].state, Todo)
+assert_type(ev[todos].get(t.id), Revision[Todo, Any])
+assert_type(ev[todos].get(t.id, fields=("text",)), Projection)
+assert_type(ev[todos].get(t.id, as_of=t.committed_at), Revision[Todo, Any])
+assert_type(ev[todos].where(done=True, as_of=t.committed_at), Page[Revision[Todo, Any]])
+assert_type(
+    ev[todos].get(t.id, if_none_match=t.digest), Revision[Todo, Any] | NotModified
+)
+assert_type(ev[todos].where(done=True, fields=("text",)), Page[Projection])
 
 
 def worker_types() -> None:
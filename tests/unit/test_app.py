@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import copy
+from collections.abc import Sequence
 
 import pytest
 from pydantic import BaseModel
@@ -72,7 +73,40 @@ def test_collected_validation_reports_all() -> None:
     assert "duplicate stream name: todos" in msg
     assert "duplicate subscription id: s" in msg
     assert "stream other is not installed" in msg
-    assert "async handlers are not supported in 1.0" in msg
+    assert "async handlers are not supported in a Subscription" in msg
+
+
+def test_async_subscription_takes_only_coroutines_via_outbox() -> None:
+    from eventic.subscription import AsyncSubscription, Inline, Outbox
+
+    todos = Stream(Todo, name="todos")
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            AsyncSubscription(
+                id="a", stream=todos, handler=async_handler, delivery=Outbox()
+            )
+        ],
+    )
+    assert len(app.subscriptions) == 1
+    with pytest.raises(ConfigError) as excinfo:
+        App(
+            id="demo",
+            streams=[todos],
+            subscriptions=[
+                AsyncSubscription(id="a", stream=todos, handler=handler),  # type: ignore[arg-type]
+                AsyncSubscription(
+                    id="b",
+                    stream=todos,
+                    handler=async_handler,
+                    delivery=Inline(),  # type: ignore[arg-type]
+                ),
+            ],
+        )
+    msg = str(excinfo.value)
+    assert "an AsyncSubscription handler must be an async def" in msg
+    assert "an AsyncSubscription needs Outbox delivery" in msg
 
 
 def test_handler_arity_reported() -> None:
@@ -86,6 +120,44 @@ def test_handler_arity_reported() -> None:
     assert "exactly one positional argument" in str(excinfo.value)
 
 
+def test_batch_subscription_takes_sync_bulk_handlers_via_outbox() -> None:
+    from eventic.subscription import BatchSubscription, Inline
+
+    todos = Stream(Todo, name="todos")
+
+    def bulk(commits: Sequence[Commit[Todo, RequestMeta]]) -> None:
+        return None
+
+    async def async_bulk(commits: Sequence[Commit[Todo, RequestMeta]]) -> None:
+        return None
+
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[BatchSubscription(id="a", stream=todos, handler=bulk)],
+    )
+    assert len(app.subscriptions) == 1
+    with pytest.raises(ConfigError) as excinfo:
+        App(
+            id="demo",
+            streams=[todos],
+            subscriptions=[
+                BatchSubscription(id="a", stream=todos, handler=async_bulk),  # type: ignore[arg-type]
+                BatchSubscription(
+                    id="b",
+                    stream=todos,
+                    handler=bulk,
+                    max_batch=0,
+                    delivery=Inline(),  # type: ignore[arg-type]
+                ),
+            ],
+        )
+    msg = str(excinfo.value)
+    assert "a BatchSubscription handler must not be an async def" in msg
+    assert "a BatchSubscription needs Outbox delivery" in msg
+    assert "max_batch must be >= 1" in msg
+
+
 def test_handler_wrong_annotation_reported() -> None:
     todos = Stream(Todo, name="todos")
 
@@ -150,3 +222,85 @@ def test_bind_rejects_outbox_without_capability() -> None:
     )
     with pytest.raises(CapabilityUnsupported):
         app.bind(NoOutboxStore())  # type: ignore[arg-type]
+
+
+def test_grouped_queues_agree_and_need_the_capability() -> None:
+    from eventic.protocols import Capabilities
+
+    class NoGroupsStore:
+        capabilities = Capabilities(outbox=True)
+
+    todos = Stream(Todo, name="todos")
+    with pytest.raises(ConfigError) as excinfo:
+        App(
+            id="demo",
+            streams=[todos],
+            subscriptions=[
+                Subscription(
+                    id="a", stream=todos, handler=handler, delivery=Outbox(grouped=True)
+                ),
+                Subscription(id="b", stream=todos, handler=handler, delivery=Outbox()),
+                Subscription(
+                    id="c",
+                    stream=todos,
+                    handler=handler,
+                    delivery=Outbox(queue="q", grouped=True, coalesce=True),
+                ),
+            ],
+        )
+    msg = str(excinfo.value)
+    assert "queue default mixes grouped and per-subscription intents" in msg
+    assert "subscription c: coalesce needs one intent per subscription" in msg
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="a", stream=todos, handler=handler, delivery=Outbox(grouped=True)
+            )
+        ],
+    )
+    with pytest.raises(CapabilityUnsupported):
+        app.bind(NoGroupsStore())  # type: ignore[arg-type]
+
+
+def test_subscriptions_stay_hashable_with_a_where_filter() -> None:
+    from eventic.subscription import AsyncSubscription, BatchSubscription
+
+    todos = Stream(Todo, name="todos")
+
+    def bulk(commits: Sequence[Commit[Todo, RequestMeta]]) -> None:
+        return None
+
+    subs = [
+        Subscription(id="a", stream=todos, handler=handler, where={"done": [True]}),
+        AsyncSubscription(
+            id="b", stream=todos, handler=async_handler, where={"text": {"x": 1}}
+        ),
+        BatchSubscription(id="c", stream=todos, handler=bulk, where={"done": True}),
+    ]
+    assert len({*subs, *subs}) == 3
+
+
+def test_filters_name_the_stream_keys() -> None:
+    todos = Stream(Todo, name="todos")
+    with pytest.raises(ConfigError) as excinfo:
+        App(
+            id="demo",
+            streams=[todos],
+            subscriptions=[
+                Subscription(
+                    id="s",
+                    stream=todos,
+                    handler=handler,
+                    when_changed=frozenset({"done", "nope"}),
+                    where={"a..b": 1, "": 1, "dne.x": 1, "text": "ok"},
+                )
+            ],
+        )
+    msg = str(excinfo.value)
+    assert "subscription s: when_changed names unknown keys nope" in msg
+    assert "subscription s: where path 'a..b' is malformed" in msg
+    assert "subscription s: where path '' is malformed" in msg
+    assert "subscription s: where path 'dne.x' names unknown key dne" in msg
+    assert "'text'" not in msg
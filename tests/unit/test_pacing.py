@@ -0,0 +1,64 @@
+"""Drain pacing: full batches go again at once, idle waits back off."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from eventic.pacing import batch_size, next_wait, per_intent, weighted_turn
+
+_FLOOR = timedelta(milliseconds=50)
+_CEILING = timedelta(seconds=1)
+
+
+def test_full_batch_drains_again_at_once() -> None:
+    assert next_wait(10, 10, _CEILING, floor=_FLOOR, ceiling=_CEILING) == timedelta(0)
+
+
+def test_partial_batch_waits_the_floor() -> None:
+    assert next_wait(3, 10, _CEILING, floor=_FLOOR, ceiling=_CEILING) == _FLOOR
+
+
+def test_empty_batches_double_up_to_the_ceiling() -> None:
+    wait = timedelta(0)
+    seen: list[timedelta] = []
+    for _ in range(7):
+        wait = next_wait(0, 10, wait, floor=_FLOOR, ceiling=_CEILING)
+        seen.append(wait)
+    assert seen == [_FLOOR * 2**i for i in range(5)] + [_CEILING, _CEILING]
+
+
+def test_per_intent_smooths_and_ignores_empty_batches() -> None:
+    assert per_intent(None, 0, 0.0) is None
+    first = per_intent(None, 4, 2.0)
+    assert first == 0.5
+    assert per_intent(first, 0, 0.0) == first
+    later = per_intent(first, 1, 1.5)
+    assert later is not None and 0.5 < later < 1.5
+
+
+def test_batch_size_fits_half_the_lease() -> None:
+    lease = timedelta(seconds=30)
+    assert batch_size(None, lease, ceiling=100) == 100
+    assert batch_size(0.5, lease, ceiling=100) == 30
+    assert batch_size(0.01, lease, ceiling=100) == 100
+    assert batch_size(60.0, lease, ceiling=100) == 1
+
+
+def test_weighted_turns_interleave_in_proportion() -> None:
+    weights = {"search": 5, "email": 1}
+    credit: dict[str, int] = {}
+    turns: list[str] = []
+    for _ in range(12):
+        queue, credit = weighted_turn(weights, credit, ["search", "email"])
+        turns.append(queue)
+    assert turns.count("search") == 10 and turns.count("email") == 2
+    assert turns[:6].count("email") == 1
+
+
+def test_a_queue_that_is_not_ready_is_skipped_without_credit() -> None:
+    weights = {"search": 5, "email": 1}
+    credit: dict[str, int] = {}
+    for _ in range(3):
+        queue, credit = weighted_turn(weights, credit, ["email"])
+        assert queue == "email"
+    assert credit.get("search", 0) == 0
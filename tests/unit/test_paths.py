@@ -0,0 +1,44 @@
+"""Dotted paths matched in Python agree with the SQLite search semantics."""
+
+from __future__ import annotations
+
+import pytest
+
+from eventic.jsonx import JsonObject, JsonValue
+from eventic.paths import matches, split_path
+
+_DOC: JsonObject = {
+    "done": True,
+    "count": 1,
+    "ratio": 1.0,
+    "note": None,
+    "owner": {"id": 7},
+    "a.b": "dotted",
+}
+
+
+def test_split_path_honors_escaped_dots() -> None:
+    assert split_path("owner.id") == ["owner", "id"]
+    assert split_path(r"a\.b") == ["a.b"]
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, True),
+        ({"owner.id": 7}, True),
+        ({r"a\.b": "dotted"}, True),
+        ({"note": None}, True),
+        ({"missing": None}, False),
+        ({"done": 1}, False),
+        ({"count": True}, False),
+        ({"count": 1.0}, False),
+        ({"ratio": 1.0}, True),
+        ({"owner.id": 7, "done": False}, False),
+        ({"owner.id.deeper": 7}, False),
+    ],
+)
+def test_matches_is_type_strict_and_missing_never_matches(
+    filters: dict[str, JsonValue], expected: bool
+) -> None:
+    assert matches(_DOC, filters) is expected
@@ -235,15 +235,92 @@ def test_intents_for_outbox_and_kinds() -> None:
         ],
     )
     rid = UUID(int=9)
-    create_intents = intents_for(app, todos, "create", rid)
+    doc = {"text": "x", "done": False}
+    create_intents = intents_for(
+        app, todos, "create", rid, UUID(int=1), frozenset(doc), doc
+    )
     assert [i.subscription_id for i in create_intents] == ["o"]
-    change_intents = intents_for(app, todos, "change", rid)
+    change_intents = intents_for(
+        app, todos, "change", rid, UUID(int=1), frozenset({"text"}), doc
+    )
     assert [i.subscription_id for i in change_intents] == ["o", "only-change"]
     for intent in change_intents:
         assert isinstance(intent, IntentRequest)
         assert intent.revision_id == rid
 
 
+def test_predicates_skip_intents_for_commits_they_reject() -> None:
+    todos = Stream(Todo, name="todos")
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(
+                id="on-done",
+                stream=todos,
+                handler=handler,
+                delivery=Outbox(),
+                when_changed=frozenset({"done"}),
+            ),
+            Subscription(
+                id="done-only",
+                stream=todos,
+                handler=handler,
+                delivery=Outbox(),
+                where={"done": True},
+            ),
+        ],
+    )
+    aid = UUID(int=1)
+    create = plan_create(app, todos, Todo(text="a"), aid)
+    assert [i.subscription_id for i in create.intents] == ["on-done"]
+    base = Revision[Todo, BaseModel](
+        stream="todos",
+        id=aid,
+        revision=0,
+        revision_id=revision_id("todos", aid, 0),
+        state=Todo(text="a"),
+        meta=Todo(text="m"),
+        committed_at=datetime(2024, 1, 1, tzinfo=UTC),
+        digest=create.digest,
+    )
+    assert plan_change(app, todos, base, {"text": "b"}).intents == ()
+    finished = plan_change(app, todos, base, {"done": True})
+    assert [i.subscription_id for i in finished.intents] == ["on-done", "done-only"]
+
+
+def test_grouped_queue_stages_one_intent_for_its_subscriptions() -> None:
+    todos = Stream(Todo, name="todos")
+    grouped = Outbox(queue="g", grouped=True)
+    app = App(
+        id="demo",
+        streams=[todos],
+        subscriptions=[
+            Subscription(id="a", stream=todos, handler=handler, delivery=grouped),
+            Subscription(id="solo", stream=todos, handler=handler, delivery=Outbox()),
+            Subscription(
+                id="b",
+                stream=todos,
+                handler=handler,
+                delivery=Outbox(queue="g", grouped=True, inline_payload=True),
+            ),
+            Subscription(
+                id="c",
+                stream=todos,
+                handler=handler,
+                delivery=grouped,
+                where={"done": True},
+            ),
+        ],
+    )
+    request = plan_create(app, todos, Todo(text="a"), UUID(int=1))
+    first, solo = request.intents
+    assert (first.subscription_id, first.queue) == ("a", "g")
+    assert first.subscriptions == ("a", "b")
+    assert first.inline_payload
+    assert (solo.subscription_id, solo.subscriptions) == ("solo", ())
+
+
 def test_hydrate_round_trip_by_digest() -> None:
     app = _app()
     todos = app.streams[0]